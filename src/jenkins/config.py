@@ -4,19 +4,26 @@ Handles loading configuration from environment variables and/or config files.
 """
 
 import os
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
 from pathlib import Path
 from typing import Any
 from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import yaml
 
 
+DEFAULT_SCENARIOS_FILE = Path(__file__).parent.parent.parent / "scenarios.default.yaml"
+
+
 def load_default_scenarios() -> Dict[str, Any]:
     """Load default scenario configuration."""
-    default_scenarios_file = (
-        Path(__file__).parent.parent.parent / "scenarios.default.yaml"
-    )
+    default_scenarios_file = DEFAULT_SCENARIOS_FILE
 
     if default_scenarios_file.exists():
         try:
@@ -38,15 +45,7 @@ def load_user_scenarios(scenarios_path: Optional[str] = None) -> Dict[str, Any]:
 
     # If no path specified, try default locations
     if not scenarios_path:
-        # First try current working directory
-        default_paths = [
-            Path.cwd() / "scenarios.yaml",
-            Path.cwd() / "scenarios.yml",
-            # Then try the directory alongside the config file
-            Path(__file__).parent.parent.parent / "scenarios.yaml",
-        ]
-
-        for path in default_paths:
+        for path in _default_user_scenarios_paths():
             if path.exists():
                 scenarios_path = str(path)
                 break
@@ -66,6 +65,17 @@ def load_user_scenarios(scenarios_path: Optional[str] = None) -> Dict[str, Any]:
     return scenarios
 
 
+def _default_user_scenarios_paths() -> List[Path]:
+    """Get the default locations searched for a user scenarios file."""
+    return [
+        # First try current working directory
+        Path.cwd() / "scenarios.yaml",
+        Path.cwd() / "scenarios.yml",
+        # Then try the directory alongside the config file
+        Path(__file__).parent.parent.parent / "scenarios.yaml",
+    ]
+
+
 def merge_scenarios(
     default_scenarios: Dict[str, Any], user_scenarios: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -145,11 +155,158 @@ def load_config(
     return config
 
 
+@dataclass
+class ConfigSnapshot:
+    """Loaded configuration plus the file state it was built from."""
+
+    config: Dict[str, Any]
+    sources: Dict[str, Optional[Tuple[int, int]]]
+    generation: int
+    loaded_at: float = field(default_factory=time.time)
+
+
+class ConfigStore:
+    """Loaded-once configuration with mtime-based invalidation.
+
+    The configuration is parsed on first use and then served from memory.
+    Every ``check_interval`` seconds the source files (default scenarios,
+    user scenarios, config files) are stat-ed, and the snapshot is rebuilt
+    when any of them changed, appeared or disappeared. ``invalidate()``
+    forces a reload on the next access, e.g. after environment changes.
+    """
+
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        scenarios_path: Optional[str] = None,
+        check_interval: float = 2.0,
+    ) -> None:
+        """Initialize config store.
+
+        Args:
+            config_path: Optional path to a YAML config file
+            scenarios_path: Optional path to a scenarios YAML file
+            check_interval: Minimum seconds between source file mtime checks
+        """
+        self.config_path = config_path
+        self.scenarios_path = scenarios_path
+        self.check_interval = check_interval
+        self._snapshot: Optional[ConfigSnapshot] = None
+        self._checked_at = 0.0
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def configure(
+        self, config_path: Optional[str] = None, scenarios_path: Optional[str] = None
+    ) -> None:
+        """Set config file paths and drop the current snapshot.
+
+        Args:
+            config_path: Optional path to a YAML config file
+            scenarios_path: Optional path to a scenarios YAML file
+        """
+        with self._lock:
+            self.config_path = config_path
+            self.scenarios_path = scenarios_path
+            self._snapshot = None
+
+    def invalidate(self) -> None:
+        """Force the configuration to be reloaded on next access."""
+        with self._lock:
+            self._snapshot = None
+
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the current configuration snapshot, reloading it if stale.
+
+        Returns:
+            Current configuration snapshot
+        """
+        with self._lock:
+            now = time.monotonic()
+            snapshot = self._snapshot
+            if snapshot is not None and now - self._checked_at < self.check_interval:
+                return snapshot
+
+            self._checked_at = now
+            sources = self._source_state()
+            if snapshot is not None and snapshot.sources == sources:
+                return snapshot
+
+            self._generation += 1
+            self._snapshot = ConfigSnapshot(
+                config=load_config(self.config_path, self.scenarios_path),
+                sources=sources,
+                generation=self._generation,
+            )
+            return self._snapshot
+
+    def get(self) -> Dict[str, Any]:
+        """Get the current configuration dict.
+
+        Returns:
+            A dictionary containing configuration values
+        """
+        return self.snapshot().config
+
+    def _source_state(self) -> Dict[str, Optional[Tuple[int, int]]]:
+        """Stat every file the configuration may be loaded from.
+
+        Returns:
+            Mapping of path to (mtime_ns, size), None for missing files
+        """
+        paths = [str(DEFAULT_SCENARIOS_FILE)]
+        paths.extend(str(path) for path in _default_user_scenarios_paths())
+        for path in (
+            self.scenarios_path,
+            self.config_path,
+            os.getenv("JENKINS_MCP_SCENARIOS_FILE"),
+            os.environ.get("JENKINS_MCP_CONFIG_FILE"),
+        ):
+            if path:
+                paths.append(path)
+
+        state: Dict[str, Optional[Tuple[int, int]]] = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                state[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                state[path] = None
+        return state
+
+
+# Global configuration store shared by tools, resources and prompts
+config_store = ConfigStore()
+
+
+def get_config() -> Dict[str, Any]:
+    """Get the cached configuration, reloading it if the source files changed."""
+    return config_store.get()
+
+
+def get_cache_dir(config: Optional[Dict[str, Any]] = None) -> Path:
+    """Get the local cache directory (job index, build logs).
+
+    Resolution order: ``JENKINS_MCP_CACHE_DIR`` environment variable,
+    ``cache_dir`` config entry, ``$XDG_CACHE_HOME/jenkins-mcp``,
+    ``~/.cache/jenkins-mcp``.
+    """
+    if config is None:
+        config = get_config()
+    cache_dir = os.environ.get("JENKINS_MCP_CACHE_DIR") or config.get("cache_dir")
+    if not cache_dir:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        cache_dir = str(Path(xdg_cache) / "jenkins-mcp")
+    return Path(cache_dir).expanduser()
+
+
 def get_jenkins_servers(config: Optional[Dict[str, Any]] = None) -> list:
     """Get all Jenkins server configs, only supports new format (servers/uri/tokenEnv)."""
     if config is None:
-        config = load_config()
+        config = get_config()
     servers = config.get("servers", [])
+    pool_config = config.get("connection_pool") or {}
+    default_max_connections = pool_config.get("max_connections")
     result = []
     for s in servers:
         name = s.get("name")
@@ -161,7 +318,11 @@ def get_jenkins_servers(config: Optional[Dict[str, Any]] = None) -> list:
             token_env_val = os.environ.get(token_env)
             if token_env_val:
                 token = token_env_val
-        result.append({"name": name, "uri": uri, "user": user, "token": token})
+        server = {"name": name, "uri": uri, "user": user, "token": token}
+        max_connections = s.get("maxConnections", default_max_connections)
+        if max_connections:
+            server["max_connections"] = int(max_connections)
+        result.append(server)
     return result
 
 
@@ -178,6 +339,7 @@ def add_jenkins_server(server: dict, config_path: str) -> None:
     file_config["jenkins_servers"] = servers
     with open(config_file, "w") as f:
         yaml.safe_dump(file_config, f)
+    config_store.invalidate()
 
 
 def remove_jenkins_server(server_name: str, config_path: str) -> None:
@@ -191,12 +353,13 @@ def remove_jenkins_server(server_name: str, config_path: str) -> None:
         file_config["jenkins_servers"] = servers
         with open(config_file, "w") as f:
             yaml.safe_dump(file_config, f)
+        config_store.invalidate()
 
 
 def get_scenario_mapping(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Get scenario mapping config."""
     if config is None:
-        config = load_config()
+        config = get_config()
     return config.get("scenarios", {})
 
 
@@ -215,6 +378,7 @@ def add_scenario_mapping(
     file_config["scenarios"] = scenarios
     with open(config_file, "w") as f:
         yaml.safe_dump(file_config, f)
+    config_store.invalidate()
 
 
 def remove_scenario_mapping(scenario_name: str, config_path: str) -> None:
@@ -229,6 +393,7 @@ def remove_scenario_mapping(scenario_name: str, config_path: str) -> None:
         file_config["scenarios"] = scenarios
         with open(config_file, "w") as f:
             yaml.safe_dump(file_config, f)
+        config_store.invalidate()
 
 
 def _convert_value(value: str) -> Any:
@@ -2,6 +2,9 @@
 
 from ..config import get_scenario_mapping
 from ..server import mcp
+from ..tools.async_client import AsyncJenkinsAPIClient
+from ..tools.exceptions import JenkinsError
+from ..tools.log_summary import format_failure_summary
 
 
 @mcp.prompt()
@@ -87,10 +90,24 @@ def build_result_summary_prompt(
 
 
 @mcp.prompt()
-def build_log_analysis_prompt(
-    server_name: str, job_name: str, build_number: int, log_excerpt: str
+async def build_log_analysis_prompt(
+    server_name: str, job_name: str, build_number: int, log_excerpt: str = ""
 ) -> str:
-    """Generate a Jenkins build log analysis prompt."""
+    """Generate a Jenkins build log analysis prompt.
+
+    When no excerpt is given, the failure-relevant parts of the log are
+    extracted automatically.
+    """
+    if not log_excerpt:
+        try:
+            client = AsyncJenkinsAPIClient(server_name)
+            summary = await client.get_build_failure_summary(job_name, build_number)
+            log_excerpt = format_failure_summary(summary)
+        except JenkinsError as e:
+            return (
+                f"Could not read the log of build #{build_number} for job `{job_name}` on Jenkins server `{server_name}`: {e}\n"
+                "Please call the get_build_failure_summary tool once the build is reachable, then analyze the excerpts it returns."
+            )
     return (
         f"Please analyze the following log excerpt from build #{build_number} for job `{job_name}` on Jenkins server `{server_name}` and identify any errors or exceptions:\n"
         f"Log excerpt:\n{log_excerpt}"
@@ -1 +1,3 @@
 """MCP resources package."""
+
+from .jenkins_resources import *  # noqa
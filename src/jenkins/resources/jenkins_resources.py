@@ -1,10 +1,43 @@
 """Jenkins related resource management."""
 
 from ..server import mcp
+from ..tools.cache import metadata_cache
+from ..tools.executor import executor_pool
+from ..tools.log_cache import log_cache
+from ..tools.session import async_session_pool
+from ..tools.session import session_pool
+from ..tools.watcher import WATCHES_URI
+from ..tools.watcher import build_watcher
 
 
-@mcp.resource()
-def jenkins_connection_pool():
-    """Jenkins connection pool resource (example, can be extended to actual pool implementation)."""
-    # This is just an example, can be extended to a real connection pool or global session management
-    return {"desc": "Jenkins connection pool/global session example resource"}
+@mcp.resource("jenkins://connection-pool", mime_type="application/json")
+def jenkins_connection_pool() -> dict:
+    """Jenkins connection pool resource, reports per-server HTTP pool stats.
+
+    The tools use the async clients, reported under ``async``.
+    """
+    return {**session_pool.stats(), "async": async_session_pool.stats()}
+
+
+@mcp.resource("jenkins://executor-pool", mime_type="application/json")
+def jenkins_executor_pool() -> dict:
+    """Jenkins executor pool resource, reports per-server pending and rejected calls."""
+    return executor_pool.stats()
+
+
+@mcp.resource("jenkins://metadata-cache", mime_type="application/json")
+def jenkins_metadata_cache() -> dict:
+    """Jenkins metadata cache resource, reports size and hit/miss counters."""
+    return metadata_cache.stats()
+
+
+@mcp.resource("jenkins://log-cache", mime_type="application/json")
+def jenkins_log_cache() -> dict:
+    """Jenkins build log cache resource, reports disk usage and hit/miss counters."""
+    return log_cache.stats()
+
+
+@mcp.resource(WATCHES_URI, mime_type="application/json")
+def jenkins_watches() -> list:
+    """Jenkins build watcher resource, lists watched builds and their state."""
+    return build_watcher.list()
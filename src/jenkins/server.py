@@ -12,7 +12,8 @@ from dataclasses import dataclass
 from mcp.server.fastmcp import FastMCP
 
 # Import config management
-from .config import load_config
+from .config import ConfigStore
+from .config import config_store
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,6 +27,7 @@ class AppContext:
     """
 
     config: dict
+    config_store: ConfigStore
 
 
 @asynccontextmanager
@@ -40,17 +42,25 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     Yields:
         The application context with initialized resources
     """
-    # Load configuration with global args
-    config = load_config(
-        config_path=_config_args.get("config_path"),
-        scenarios_path=_config_args.get("scenarios_path"),
-    )
+    # Load configuration once; tools share the cached snapshot from config_store
+    config = config_store.get()
     logger.info("Server starting up...")
     try:
-        context = AppContext(config=config)
+        context = AppContext(config=config, config_store=config_store)
         yield context
     finally:
         logging.info("Server shutting down...")
+        from .tools.executor import executor_pool
+        from .tools.job_index import job_index
+        from .tools.session import async_session_pool
+        from .tools.session import session_pool
+        from .tools.watcher import build_watcher
+
+        await build_watcher.aclose()
+        session_pool.close_all()
+        await async_session_pool.aclose_all()
+        job_index.close()
+        executor_pool.shutdown()
 
 
 # Global configuration storage
@@ -67,6 +77,7 @@ def set_config_args(config_path: str = None, scenarios_path: str = None):
         "config_path": config_path,
         "scenarios_path": scenarios_path,
     }
+    config_store.configure(config_path=config_path, scenarios_path=scenarios_path)
 
 
 def create_mcp_server(host: str = "0.0.0.0", port: int = 8000) -> FastMCP:
@@ -4,18 +4,29 @@
 from .mcp_tools import *  # noqa
 
 # 导入核心组件供内部使用
+from .async_client import AsyncJenkinsAPIClient
+from .cache import MetadataCache
 from .client import JenkinsAPIClient
+from .crawler import JobTreeCrawler
+from .executor import ServerExecutorPool
 from .exceptions import (
     JenkinsError,
     JenkinsServerNotFoundError,
     JenkinsJobNotFoundError,
     JenkinsBuildNotFoundError,
     JenkinsPermissionError,
+    JenkinsServerBusyError,
     JenkinsConfigurationError,
     JenkinsParameterError,
     JenkinsTimeoutError,
 )
+from .job_index import JobIndex
+from .log_cache import LogCache
+from .registry import ServerRegistry
 from .scenarios import ScenarioManager
+from .search_index import TrigramIndex
+from .session import AsyncSessionPool
+from .session import SessionPool
 from .types import (
     BuildStatus,
     JobColor,
@@ -24,9 +35,25 @@ from .types import (
     JobInfo,
     JobParameter,
     BuildInfo,
+    BuildStatusResult,
+    BuildWatchInfo,
+    BuildLogChunk,
+    LogMatch,
+    LogSearchResult,
+    LogExcerpt,
+    FailureSummary,
+    PipelineStage,
+    PipelineRun,
+    PipelineNodeLog,
+    StageLog,
     QueueInfo,
+    QueueItem,
+    QueueCancelResult,
     TriggerResult,
+    BatchTriggerResult,
     StopResult,
+    BulkStopItem,
+    BulkStopResult,
     ScenarioConfig,
     ScenarioInfo,
     JenkinsClient,
@@ -35,14 +62,25 @@ from .types import (
 __all__ = [
     # MCP 工具函数（自动从 mcp_tools 导入）
     # 核心组件
+    "AsyncJenkinsAPIClient",
     "JenkinsAPIClient",
+    "JobIndex",
+    "LogCache",
+    "MetadataCache",
+    "JobTreeCrawler",
     "ScenarioManager",
+    "ServerExecutorPool",
+    "ServerRegistry",
+    "AsyncSessionPool",
+    "SessionPool",
+    "TrigramIndex",
     # 异常类
     "JenkinsError",
     "JenkinsServerNotFoundError",
     "JenkinsJobNotFoundError",
     "JenkinsBuildNotFoundError",
     "JenkinsPermissionError",
+    "JenkinsServerBusyError",
     "JenkinsConfigurationError",
     "JenkinsParameterError",
     "JenkinsTimeoutError",
@@ -54,9 +92,25 @@ __all__ = [
     "JobInfo",
     "JobParameter",
     "BuildInfo",
+    "BuildStatusResult",
+    "BuildWatchInfo",
+    "BuildLogChunk",
+    "LogMatch",
+    "LogSearchResult",
+    "LogExcerpt",
+    "FailureSummary",
+    "PipelineStage",
+    "PipelineRun",
+    "PipelineNodeLog",
+    "StageLog",
     "QueueInfo",
+    "QueueItem",
+    "QueueCancelResult",
     "TriggerResult",
+    "BatchTriggerResult",
     "StopResult",
+    "BulkStopItem",
+    "BulkStopResult",
     "ScenarioConfig",
     "ScenarioInfo",
     "JenkinsClient",
@@ -0,0 +1,960 @@
+"""Jenkins REST API trees and response handling shared by the clients."""
+
+import codecs
+import html
+import re
+import time
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.parse import unquote
+from urllib.parse import urlparse
+
+from ..config import get_config
+from .exceptions import JenkinsParameterError
+from .log_cache import CachedLog
+from .types import BatchTriggerResult
+from .types import BuildInfo
+from .types import BuildLogChunk
+from .types import BuildStatusResult
+from .types import BulkStopItem
+from .types import JobInfo
+from .types import JobParameter
+from .types import ParameterDict
+from .types import PipelineNodeLog
+from .types import PipelineRun
+from .types import PipelineStage
+from .types import QueueCancelResult
+from .types import QueueInfo
+from .types import QueueItem
+from .types import TriggerResult
+
+# Queue ID, queue location and error of one trigger of a batch
+SubmittedBuild = Tuple[Optional[int], str, Optional[str]]
+
+PARAMETER_DEFINITIONS_TREE = (
+    "parameterDefinitions[name,type,defaultParameterValue[value],choices]"
+)
+JOB_PARAMETERS_TREE = (
+    f"actions[{PARAMETER_DEFINITIONS_TREE}],property[{PARAMETER_DEFINITIONS_TREE}]"
+)
+JOB_INFO_TREE = (
+    "name,fullName,url,description,buildable,color,lastBuild[number,url],"
+    f"{JOB_PARAMETERS_TREE}"
+)
+
+# Fields needed to build JobInfo for every job of a tree listing
+SEARCH_JOB_FIELDS = (
+    "name,url,fullName,description,buildable,color,lastBuild[number,url],"
+    "property[parameterDefinitions[name]]"
+)
+# One page of a folder listing; "jobs" is only present on (non-empty) folders
+FOLDER_JOBS_TREE = "jobs[{fields},jobs[name]{{0,1}}]{{{start},{end}}}"
+
+# Fields of a build returned by get_build_status
+BUILD_INFO_TREE = "number,result,building,url,timestamp,duration"
+
+# Most recent builds of a job with the get_build_status fields
+RECENT_BUILDS_TREE = "builds[" + BUILD_INFO_TREE + "]{{0,{count}}}"
+
+# Queue polling after a trigger: fast first polls, backing off to a ceiling
+DEFAULT_QUEUE_MAX_WAIT = 10.0
+QUEUE_POLL_INITIAL = 0.1
+QUEUE_POLL_MAX = 2.0
+QUEUE_POLL_FACTOR = 1.5
+
+# Whole build queue in one request, with each item's parameters
+QUEUE_ITEMS_TREE = (
+    "items[id,task[name,url],why,inQueueSince,blocked,buildable,stuck,"
+    "actions[parameters[name,value]]]"
+)
+
+# Bulk stop: one query per job returns its child jobs (for folders) and its
+# recent builds with their parameters
+STOP_SCAN_TREE = (
+    "jobs[fullName],"
+    "builds[number,building,timestamp,actions[parameters[name,value]]]{{0,{count}}}"
+)
+# Recent builds checked per job; older builds are not expected to be running
+STOP_SCAN_BUILDS = 50
+# Jobs and folders a bulk stop may scan
+MAX_STOP_JOBS = 200
+
+# Seconds a refused stop is confirmed in the background before it is
+# reported as a permission error
+STOP_CONFIRM_TIMEOUT = 30.0
+
+# Build log reads through logText/progressiveText
+DEFAULT_LOG_MAX_BYTES = 256 * 1024
+LOG_READ_CHUNK_SIZE = 64 * 1024
+# First tail window; doubled until it holds enough lines
+LOG_TAIL_WINDOW = 16 * 1024
+
+# Pipeline REST API (wfapi); step logs come with HTML console annotations
+FAILED_STEP_STATUSES = frozenset({"FAILED", "UNSTABLE", "ABORTED"})
+# Step logs of one stage fetched concurrently
+STAGE_LOG_CONCURRENCY = 8
+_HTML_TAG = re.compile(r"<[^>]*>")
+
+FOLDER_MODE = "com.cloudbees.hudson.plugins.folder.Folder"
+
+# Folder configuration XML
+FOLDER_CONFIG_XML = """<?xml version='1.1' encoding='UTF-8'?>
+<com.cloudbees.hudson.plugins.folder.Folder plugin="cloudbees-folder">
+  <actions/>
+  <description></description>
+  <properties/>
+  <folderViews class="com.cloudbees.hudson.plugins.folder.views.DefaultFolderViewHolder">
+    <views>
+      <hudson.model.AllView>
+        <owner class="com.cloudbees.hudson.plugins.folder.Folder" reference="../../../.."/>
+        <name>all</name>
+        <filterExecutors>false</filterExecutors>
+        <filterQueue>false</filterQueue>
+        <properties class="hudson.model.View$PropertyList"/>
+      </hudson.model.AllView>
+    </views>
+    <tabBar class="hudson.views.DefaultViewsTabBar"/>
+  </folderViews>
+  <healthMetrics/>
+  <icon class="com.cloudbees.hudson.plugins.folder.icons.StockFolderIcon"/>
+</com.cloudbees.hudson.plugins.folder.Folder>"""
+
+
+def get_queue_max_wait() -> float:
+    """Get how long a trigger waits for its build to leave the queue.
+
+    Returns:
+        Seconds, from ``trigger.max_queue_wait`` (defaults to 10)
+    """
+    trigger_config = get_config().get("trigger") or {}
+    return float(trigger_config.get("max_queue_wait", DEFAULT_QUEUE_MAX_WAIT))
+
+
+def next_queue_poll_delay(delay: float) -> float:
+    """Get the delay before the next queue poll.
+
+    Args:
+        delay: Previous delay (seconds)
+
+    Returns:
+        Backed-off delay, capped at ``QUEUE_POLL_MAX``
+    """
+    return min(delay * QUEUE_POLL_FACTOR, QUEUE_POLL_MAX)
+
+
+def check_required_parameters(
+    job_params: List[JobParameter], params: Optional[ParameterDict]
+) -> None:
+    """Check that a build gets every parameter that has no default.
+
+    Args:
+        job_params: Parameter definitions of the job
+        params: Build parameters
+
+    Raises:
+        JenkinsParameterError: Missing required parameters
+    """
+    missing_params = [
+        param
+        for param in job_params
+        if param["default"] is None and (not params or param["name"] not in params)
+    ]
+    if not missing_params:
+        return
+
+    # Build detailed error message
+    param_details = []
+    for param in missing_params:
+        detail = f"{param['name']} (type: {param['type']}, default: {param['default']}"
+        if param.get("choices"):
+            detail += f", choices: {param['choices']}"
+        detail += ")"
+        param_details.append(detail)
+
+    raise JenkinsParameterError(
+        "This job requires required parameters, please provide them before "
+        f"execution. Missing parameters: {', '.join(param_details)}",
+        [param["name"] for param in missing_params],
+    )
+
+
+def parse_parameter_definitions(data: Dict[str, Any]) -> List[JobParameter]:
+    """Parse parameter definitions from a job API response.
+
+    Args:
+        data: Job JSON containing ``property``/``actions`` parameter definitions
+
+    Returns:
+        List of parameter definitions (deduplicated by name)
+    """
+    params: List[JobParameter] = []
+    seen = set()
+
+    # Process property field, then actions field (compatibility)
+    for holder in (*(data.get("property") or []), *(data.get("actions") or [])):
+        for param_def in (holder or {}).get("parameterDefinitions") or []:
+            name = param_def.get("name", "")
+            if name in seen:
+                continue
+            seen.add(name)
+
+            param_info: JobParameter = {
+                "name": name,
+                "type": param_def.get("type", ""),
+                "default": (param_def.get("defaultParameterValue") or {}).get("value"),
+                "choices": None,
+            }
+
+            # If Choice Parameter, add choices list
+            if (
+                param_def.get("type") == "ChoiceParameterDefinition"
+                and "choices" in param_def
+            ):
+                param_info["choices"] = param_def.get("choices", [])
+
+            params.append(param_info)
+
+    return params
+
+
+def parse_job_info(data: Dict[str, Any], job_full_name: str) -> JobInfo:
+    """Build job info from a job API response.
+
+    Args:
+        data: Job JSON fetched with ``JOB_INFO_TREE`` fields
+        job_full_name: Full job name (fallback when missing from the response)
+
+    Returns:
+        Job info
+    """
+    # Get last build info
+    last_build = data.get("lastBuild") or {}
+
+    return {
+        "name": data.get("name", ""),
+        "fullName": data.get("fullName", job_full_name),
+        "url": data.get("url", ""),
+        "description": data.get("description"),
+        "buildable": data.get("buildable", False),
+        "color": data.get("color", "grey"),
+        "is_parameterized": any(
+            (prop or {}).get("parameterDefinitions")
+            for prop in (*(data.get("property") or []), *(data.get("actions") or []))
+        ),
+        "last_build_number": last_build.get("number"),
+        "last_build_url": last_build.get("url"),
+    }
+
+
+def parse_queue_info(data: Dict[str, Any], queue_id: int) -> QueueInfo:
+    """Build queue info from a queue item API response.
+
+    Args:
+        data: Queue item JSON
+        queue_id: Queue ID
+
+    Returns:
+        Queue info
+    """
+    result: QueueInfo = {
+        "queue_id": queue_id,
+        "blocked": data.get("blocked", False),
+        "buildable": data.get("buildable", False),
+        "stuck": data.get("stuck", False),
+        "why": data.get("why"),
+        "build_number": None,
+        "build_url": None,
+        "status": "QUEUED",
+    }
+
+    # Check if build has started
+    executable = data.get("executable")
+    if executable:
+        result["build_number"] = executable.get("number")
+        result["build_url"] = executable.get("url")
+        result["status"] = "BUILD_STARTED"
+
+    return result
+
+
+def queue_item_not_found(queue_id: int) -> QueueInfo:
+    """Build queue info for a queue item that no longer exists.
+
+    Args:
+        queue_id: Queue ID
+
+    Returns:
+        Queue info with ``NOT_FOUND`` status
+    """
+    return {
+        "queue_id": queue_id,
+        "blocked": False,
+        "buildable": False,
+        "stuck": False,
+        "why": "Item not found",
+        "build_number": None,
+        "build_url": None,
+        "status": "NOT_FOUND",
+    }
+
+
+def parse_queue_id(queue_location: str) -> Optional[int]:
+    """Extract the queue ID from a trigger response ``Location`` header.
+
+    Args:
+        queue_location: Queue location URL
+
+    Returns:
+        Queue ID, or None if the location is not a queue item
+    """
+    match = re.search(r"/queue/item/(\d+)/", queue_location)
+    return int(match.group(1)) if match else None
+
+
+def parse_build_info(data: Dict[str, Any], build_number: int) -> BuildInfo:
+    """Build build info from a build API response.
+
+    Args:
+        data: Build JSON
+        build_number: Build number (fallback when missing from the response)
+
+    Returns:
+        Build info
+    """
+    return {
+        "number": data.get("number", build_number),
+        "result": data.get("result"),
+        "building": data.get("building", False),
+        "url": data.get("url", ""),
+        "timestamp": data.get("timestamp", 0),
+        "duration": data.get("duration", 0),
+    }
+
+
+def build_status_result(
+    job_full_name: str,
+    build_number: int,
+    status: Optional[BuildInfo],
+    error: Optional[Exception],
+) -> BuildStatusResult:
+    """Build the batch result of one build status lookup.
+
+    Args:
+        job_full_name: Full job name
+        build_number: Build number
+        status: Build info, if the lookup succeeded
+        error: Lookup error, if it failed
+
+    Returns:
+        Batch item result
+    """
+    return {
+        "job_full_name": job_full_name,
+        "build_number": build_number,
+        "status": status,
+        "error": str(error) if error is not None else None,
+    }
+
+
+def parse_log_headers(headers: Any, start: int) -> Tuple[int, int, bool]:
+    """Read a progressiveText response's headers.
+
+    Args:
+        headers: Response headers
+        start: Requested start offset
+
+    Returns:
+        (actual start offset, log size, whether the build is still logging)
+    """
+    size = int(headers.get("X-Text-Size") or 0)
+    # Jenkins restarts from 0 when start is past the end ("text rolled over")
+    actual_start = start if start <= size else 0
+    more_data = (headers.get("X-More-Data") or "").lower() == "true"
+    return actual_start, size, more_data
+
+
+def _decode_complete(data: bytes) -> Tuple[str, int]:
+    """Decode UTF-8 bytes, leaving out an incomplete trailing character.
+
+    Returns:
+        (text, number of bytes decoded)
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    text = decoder.decode(data, final=False)
+    return text, len(data) - len(decoder.getstate()[0])
+
+
+def make_log_chunk(
+    data: bytes, start: int, max_bytes: int, more_data: bool
+) -> BuildLogChunk:
+    """Build a log chunk from bytes read at ``start``.
+
+    When ``data`` exceeds ``max_bytes`` it is cut at the last line break
+    within the limit (or the last complete character for a single huge
+    line), so ``offset`` can be used as the next ``start``.
+
+    Args:
+        data: Bytes read from ``start`` (at most ``max_bytes + 1`` are needed)
+        start: Byte offset of ``data``
+        max_bytes: Max bytes to return
+        more_data: Whether Jenkins reported the build as still logging
+
+    Returns:
+        Log chunk
+    """
+    truncated = len(data) > max_bytes
+    if truncated:
+        data = data[:max_bytes]
+        line_end = data.rfind(b"\n")
+        if line_end >= 0:
+            data = data[: line_end + 1]
+
+    text, length = _decode_complete(data)
+    return {
+        "text": text,
+        "start": start,
+        "offset": start + length,
+        "more_data": truncated or more_data,
+    }
+
+
+def make_log_tail(
+    data: bytes,
+    start: int,
+    tail_lines: int,
+    max_bytes: int,
+    more_data: bool,
+) -> Optional[BuildLogChunk]:
+    """Build a log chunk holding the last lines of ``data``.
+
+    Args:
+        data: Bytes read from ``start`` up to the end of the log
+        start: Byte offset of ``data``
+        tail_lines: Number of lines wanted
+        max_bytes: Max bytes to return
+        more_data: Whether Jenkins reported the build as still logging
+
+    Returns:
+        Log chunk, or None if ``data`` does not hold enough complete lines
+        and a larger window starting earlier is needed
+    """
+    lines = data.splitlines(keepends=True)
+    # The first line may start before the window unless the window is the log
+    complete = lines if start == 0 else lines[1:]
+    if len(complete) < tail_lines and start > 0 and len(data) < max_bytes:
+        return None
+
+    tail = b"".join(complete[-tail_lines:])[-max_bytes:]
+    text, _ = _decode_complete(tail)
+    tail_start = start + len(data) - len(tail)
+    return {
+        "text": text,
+        "start": tail_start,
+        "offset": start + len(data),
+        "more_data": more_data,
+    }
+
+
+def read_cached_log(
+    cached: CachedLog, start: int, max_bytes: int, tail_lines: Optional[int]
+) -> BuildLogChunk:
+    """Read a log chunk from a cached (completed) log.
+
+    Args:
+        cached: Cached log
+        start: Byte offset to read from
+        max_bytes: Max bytes to return
+        tail_lines: Return only the last lines of the log (ignores ``start``)
+
+    Returns:
+        Log chunk, as Jenkins would have served it
+    """
+    if tail_lines:
+        window = LOG_TAIL_WINDOW
+        while True:
+            start = max(0, cached.size - window)
+            data = cached.read(start, cached.size - start)
+            chunk = make_log_tail(data, start, tail_lines, max_bytes, False)
+            if chunk is not None:
+                return chunk
+            window *= 2
+
+    if start > cached.size:
+        # Same as Jenkins: a start past the end restarts from 0
+        start = 0
+    return make_log_chunk(cached.read(start, max_bytes + 1), start, max_bytes, False)
+
+
+def parse_folder_jobs(
+    data: Dict[str, Any], folder_full_name: str
+) -> List[Tuple[JobInfo, bool]]:
+    """Build job info for one page of a folder listing.
+
+    Args:
+        data: Folder JSON fetched with ``FOLDER_JOBS_TREE``
+        folder_full_name: Full folder name ("" for the root)
+
+    Returns:
+        List of (job info, whether it is a non-empty folder) tuples
+    """
+    children = []
+    for node in data.get("jobs") or []:
+        full_name = node.get("fullName") or (
+            f"{folder_full_name}/{node['name']}" if folder_full_name else node["name"]
+        )
+        children.append((parse_job_info(node, full_name), bool(node.get("jobs"))))
+    return children
+
+
+def parse_pipeline_stage(data: Dict[str, Any]) -> PipelineStage:
+    """Build stage info from a ``wfapi/describe`` stage.
+
+    Args:
+        data: Stage JSON
+
+    Returns:
+        Stage info
+    """
+    return {
+        "id": str(data.get("id", "")),
+        "name": data.get("name", ""),
+        "status": data.get("status", ""),
+        "exec_node": data.get("execNode", ""),
+        "start_time_millis": data.get("startTimeMillis", 0),
+        "duration_millis": data.get("durationMillis", 0),
+        "pause_duration_millis": data.get("pauseDurationMillis", 0),
+    }
+
+
+def parse_pipeline_run(data: Dict[str, Any], build_number: int) -> PipelineRun:
+    """Build run info from a build's ``wfapi/describe`` response.
+
+    Args:
+        data: Run JSON
+        build_number: Build number (fallback when missing from the response)
+
+    Returns:
+        Run info with its stages in execution order
+    """
+    return {
+        "number": int(data.get("id") or build_number),
+        "status": data.get("status", ""),
+        "start_time_millis": data.get("startTimeMillis", 0),
+        "duration_millis": data.get("durationMillis", 0),
+        "stages": [parse_pipeline_stage(stage) for stage in data.get("stages") or []],
+    }
+
+
+def find_pipeline_stage(run: PipelineRun, stage: str) -> PipelineStage:
+    """Find a stage by ID or name.
+
+    Args:
+        run: Run info
+        stage: Stage ID or name (the first stage with that name wins)
+
+    Returns:
+        Stage info
+
+    Raises:
+        JenkinsParameterError: No such stage
+    """
+    for candidate in run["stages"]:
+        if stage in (candidate["id"], candidate["name"]):
+            return candidate
+    names = ", ".join(candidate["name"] for candidate in run["stages"])
+    raise JenkinsParameterError(
+        f"Stage '{stage}' not found in build #{run['number']}; stages: {names}"
+    )
+
+
+def select_stage_nodes(
+    data: Dict[str, Any], node_id: Optional[str], failed_only: bool
+) -> List[Dict[str, Any]]:
+    """Pick the steps of a stage whose logs are wanted.
+
+    Args:
+        data: Stage ``wfapi/describe`` JSON
+        node_id: Only this step (flow node ID)
+        failed_only: Only steps that did not succeed
+
+    Returns:
+        Step JSON objects, in execution order
+
+    Raises:
+        JenkinsParameterError: ``node_id`` is not a step of the stage
+    """
+    nodes = data.get("stageFlowNodes") or []
+    if node_id is not None:
+        nodes = [node for node in nodes if str(node.get("id")) == str(node_id)]
+        if not nodes:
+            raise JenkinsParameterError(
+                f"Node '{node_id}' not found in stage '{data.get('name', '')}'"
+            )
+    if failed_only:
+        nodes = [node for node in nodes if node.get("status") in FAILED_STEP_STATUSES]
+    return nodes
+
+
+def parse_node_log(node: Dict[str, Any], data: Dict[str, Any]) -> PipelineNodeLog:
+    """Build a step log from its ``wfapi/log`` response.
+
+    Args:
+        node: Step JSON from the stage description
+        data: Log JSON
+
+    Returns:
+        Step log as plain text
+    """
+    return {
+        "id": str(node.get("id", "")),
+        "name": node.get("name", ""),
+        "status": node.get("status", ""),
+        "parameter_description": node.get("parameterDescription", ""),
+        "text": html.unescape(_HTML_TAG.sub("", data.get("text") or "")),
+        "length": data.get("length", 0),
+        "has_more": bool(data.get("hasMore", False)),
+    }
+
+
+def parse_parameter_values(actions: Optional[List[Any]]) -> Dict[str, Any]:
+    """Collect the parameter values of a build or queue item.
+
+    Args:
+        actions: ``actions[parameters[name,value]]`` JSON
+
+    Returns:
+        Parameter values by name
+    """
+    values = {}
+    for action in actions or []:
+        for parameter in (action or {}).get("parameters") or []:
+            if "name" in parameter:
+                values[parameter["name"]] = parameter.get("value")
+    return values
+
+
+def _parameter_text(value: Any) -> str:
+    """Render a parameter value the way it is typed in a build form."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def parameters_match(values: Dict[str, Any], wanted: Dict[str, Any]) -> bool:
+    """Check that parameter values include the wanted ones.
+
+    Values are compared as text, booleans written ``true``/``false`` as in
+    build forms.
+
+    Args:
+        values: Parameter values of a build or queue item
+        wanted: Required parameter values
+
+    Returns:
+        Whether every wanted parameter has the wanted value
+    """
+    return all(
+        name in values and _parameter_text(values[name]) == _parameter_text(value)
+        for name, value in wanted.items()
+    )
+
+
+def job_name_from_url(url: str) -> Optional[str]:
+    """Get a job's full name from its URL.
+
+    Args:
+        url: Job URL, e.g. ``https://jenkins/job/folder/job/app/``
+
+    Returns:
+        Full job name, or None if the URL is not a job URL
+    """
+    parts = urlparse(url).path.split("/job/")
+    if len(parts) < 2:
+        return None
+    return "/".join(unquote(part.strip("/")) for part in parts[1:])
+
+
+def parse_queue_item(data: Dict[str, Any]) -> QueueItem:
+    """Build a queue item from the queue API response.
+
+    Args:
+        data: Queue item JSON
+
+    Returns:
+        Queue item
+    """
+    task = data.get("task") or {}
+    return {
+        "queue_id": data.get("id", 0),
+        "job_full_name": job_name_from_url(task.get("url") or ""),
+        "task_name": task.get("name", ""),
+        "why": data.get("why"),
+        "in_queue_since": data.get("inQueueSince", 0),
+        "blocked": data.get("blocked", False),
+        "buildable": data.get("buildable", False),
+        "stuck": data.get("stuck", False),
+        "parameters": parse_parameter_values(data.get("actions")),
+    }
+
+
+def filter_queue_items(items: List[QueueItem], job_prefix: str) -> List[QueueItem]:
+    """Keep the queue items of jobs whose full name starts with a prefix.
+
+    Args:
+        items: Queue items
+        job_prefix: Job full name prefix, e.g. a folder path ("" keeps all)
+
+    Returns:
+        Matching items; items that are not jobs only match an empty prefix
+    """
+    if not job_prefix:
+        return items
+    return [
+        item
+        for item in items
+        if item["job_full_name"] and item["job_full_name"].startswith(job_prefix)
+    ]
+
+
+def queue_cancel_result(
+    queue_id: int, cancelled: Optional[bool], error: Optional[Exception]
+) -> QueueCancelResult:
+    """Build the batch result of one queue item cancellation.
+
+    Args:
+        queue_id: Queue ID
+        cancelled: Whether the item was still queued, if the request succeeded
+        error: Request error, if it failed
+
+    Returns:
+        Batch item result
+    """
+    if error is not None:
+        return {"queue_id": queue_id, "status": "FAILED", "error": str(error)}
+    status = "CANCELLED" if cancelled else "NOT_FOUND"
+    return {"queue_id": queue_id, "status": status, "error": None}
+
+
+def parse_stop_scan(
+    data: Dict[str, Any],
+) -> Tuple[List[str], Optional[List[Dict[str, Any]]]]:
+    """Read a bulk stop scan response.
+
+    Args:
+        data: Job JSON queried with ``STOP_SCAN_TREE``
+
+    Returns:
+        (child job names, running builds); running builds are None for
+        folders, which have no builds
+    """
+    children = [job["fullName"] for job in data.get("jobs") or [] if "fullName" in job]
+    if "builds" not in data:
+        return children, None
+    return children, [build for build in data["builds"] or [] if build.get("building")]
+
+
+def select_stop_targets(
+    jobs: Dict[str, List[Dict[str, Any]]],
+    queue: Optional[List[QueueItem]],
+    older_than: Optional[float],
+    parameters: Optional[Dict[str, Any]],
+) -> List[BulkStopItem]:
+    """Pick the builds and queue items a bulk stop applies to.
+
+    Args:
+        jobs: Running builds by job full name
+        queue: Build queue, or None to leave queued items alone
+        older_than: Only builds started (items queued) this many seconds ago
+            or earlier
+        parameters: Only builds and items with these parameter values
+
+    Returns:
+        ``MATCHED`` items, queue items first
+    """
+    before = None
+    if older_than is not None:
+        before = int((time.time() - older_than) * 1000)
+
+    def selected(since: int, values: Dict[str, Any]) -> bool:
+        if before is not None and since > before:
+            return False
+        return not parameters or parameters_match(values, parameters)
+
+    targets: List[BulkStopItem] = []
+    for item in queue or []:
+        if item["job_full_name"] in jobs and selected(
+            item["in_queue_since"], item["parameters"]
+        ):
+            targets.append(
+                bulk_stop_item(item["job_full_name"], None, item["queue_id"])
+            )
+    for job_full_name, builds in jobs.items():
+        for build in builds:
+            values = parse_parameter_values(build.get("actions"))
+            if selected(build.get("timestamp", 0), values):
+                targets.append(bulk_stop_item(job_full_name, build["number"], None))
+    return targets
+
+
+def bulk_stop_item(
+    job_full_name: str, build_number: Optional[int], queue_id: Optional[int]
+) -> BulkStopItem:
+    """Build a bulk stop item not acted upon yet.
+
+    Args:
+        job_full_name: Full job name
+        build_number: Build number, for running builds
+        queue_id: Queue ID, for queued items
+
+    Returns:
+        Item with ``MATCHED`` status
+    """
+    return {
+        "job_full_name": job_full_name,
+        "build_number": build_number,
+        "queue_id": queue_id,
+        "status": "MATCHED",
+        "error": None,
+    }
+
+
+def too_many_stop_jobs(job_full_name: str) -> JenkinsParameterError:
+    """Build the error for a bulk stop spanning too many jobs.
+
+    Args:
+        job_full_name: Job or folder the stop was requested for
+
+    Returns:
+        Parameter error
+    """
+    return JenkinsParameterError(
+        f"'{job_full_name}' holds more than {MAX_STOP_JOBS} jobs and folders; "
+        "stop a subfolder instead"
+    )
+
+
+def build_queued_result(
+    queue_id: Optional[int], queue_location: str, message: str
+) -> TriggerResult:
+    """Build the trigger result of a build that has not started yet.
+
+    Args:
+        queue_id: Queue ID
+        queue_location: Queue location URL
+        message: Explanation for the caller
+
+    Returns:
+        Trigger result with ``QUEUED`` status
+    """
+    return {
+        "status": "QUEUED",
+        "build_number": None,
+        "build_url": None,
+        "queue_id": queue_id,
+        "queue_url": queue_location,
+        "message": message,
+    }
+
+
+def build_started_result(
+    queue_info: QueueInfo, queue_location: str
+) -> TriggerResult:
+    """Build the trigger result of a build that left the queue.
+
+    Args:
+        queue_info: Queue info with a build number
+        queue_location: Queue location URL
+
+    Returns:
+        Trigger result with ``BUILD_STARTED`` status
+    """
+    return {
+        "status": "BUILD_STARTED",
+        "build_number": queue_info["build_number"],
+        "build_url": queue_info.get("build_url"),
+        "queue_id": queue_info["queue_id"],
+        "queue_url": queue_location,
+        "message": None,
+    }
+
+
+def check_batch_parameters(
+    builds: List[Tuple[str, Optional[ParameterDict]]],
+    definitions: List[Any],
+) -> None:
+    """Check every build of a batch trigger before any is triggered.
+
+    Args:
+        builds: (full job name, parameters) pairs
+        definitions: Parameter definitions of each build's job, or the error
+            that prevented fetching them
+
+    Raises:
+        JenkinsParameterError: Some builds lack parameters or their job could
+            not be looked up; lists every problem
+    """
+    problems = []
+    missing = []
+    for (job_full_name, params), job_params in zip(builds, definitions):
+        if isinstance(job_params, Exception):
+            problems.append(f"{job_full_name}: {job_params}")
+            continue
+        try:
+            check_required_parameters(job_params, params)
+        except JenkinsParameterError as e:
+            problems.append(f"{job_full_name}: {e}")
+            missing.extend(f"{job_full_name}:{name}" for name in e.missing_params)
+
+    if problems:
+        raise JenkinsParameterError(
+            f"{len(problems)} of {len(builds)} builds cannot be triggered, "
+            f"nothing was triggered. {'; '.join(problems)}",
+            missing,
+        )
+
+
+def batch_trigger_results(
+    builds: List[Tuple[str, Optional[ParameterDict]]],
+    submitted: List[SubmittedBuild],
+    started: Dict[int, TriggerResult],
+) -> List[BatchTriggerResult]:
+    """Build the results of a batch trigger.
+
+    Args:
+        builds: (full job name, parameters) pairs
+        submitted: Queue ID, queue location and error of each trigger
+        started: Trigger result of each waited-for queue ID
+
+    Returns:
+        One result per build, in input order
+    """
+    results: List[BatchTriggerResult] = []
+    for (job_full_name, _), (queue_id, queue_location, error) in zip(
+        builds, submitted
+    ):
+        result: Optional[TriggerResult] = None
+        if error is None:
+            result = started.get(queue_id) if queue_id else None
+            if result is None:
+                result = build_queued_result(
+                    queue_id, queue_location, "Jenkins did not return a queue item"
+                )
+        results.append(
+            {"job_full_name": job_full_name, "result": result, "error": error}
+        )
+    return results
+
+
+def queue_wait_timeout_message(max_wait: float) -> str:
+    """Build the message of a build that did not leave the queue in time.
+
+    Args:
+        max_wait: Seconds waited
+
+    Returns:
+        Message for the caller
+    """
+    return f"Build is queued but did not start within {max_wait:g} seconds"
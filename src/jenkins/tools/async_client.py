@@ -0,0 +1,1761 @@
+"""Asyncio Jenkins API client built on httpx."""
+
+import asyncio
+import logging
+import time
+from contextlib import aclosing
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+import httpx
+
+from ..config import get_config
+from .api import BUILD_INFO_TREE
+from .api import DEFAULT_LOG_MAX_BYTES
+from .api import FOLDER_CONFIG_XML
+from .api import FOLDER_JOBS_TREE
+from .api import FOLDER_MODE
+from .api import JOB_INFO_TREE
+from .api import JOB_PARAMETERS_TREE
+from .api import LOG_READ_CHUNK_SIZE
+from .api import LOG_TAIL_WINDOW
+from .api import MAX_STOP_JOBS
+from .api import QUEUE_ITEMS_TREE
+from .api import QUEUE_POLL_INITIAL
+from .api import RECENT_BUILDS_TREE
+from .api import SEARCH_JOB_FIELDS
+from .api import STAGE_LOG_CONCURRENCY
+from .api import STOP_SCAN_BUILDS
+from .api import STOP_SCAN_TREE
+from .api import SubmittedBuild
+from .api import batch_trigger_results
+from .api import build_queued_result
+from .api import build_started_result
+from .api import build_status_result
+from .api import check_batch_parameters
+from .api import find_pipeline_stage
+from .api import get_queue_max_wait
+from .api import make_log_chunk
+from .api import make_log_tail
+from .api import next_queue_poll_delay
+from .api import parse_build_info
+from .api import parse_folder_jobs
+from .api import parse_job_info
+from .api import parse_log_headers
+from .api import parse_node_log
+from .api import parse_parameter_definitions
+from .api import parse_pipeline_run
+from .api import parse_queue_id
+from .api import parse_queue_info
+from .api import parse_queue_item
+from .api import parse_stop_scan
+from .api import queue_cancel_result
+from .api import queue_item_not_found
+from .api import queue_wait_timeout_message
+from .api import read_cached_log
+from .api import select_stage_nodes
+from .api import select_stop_targets
+from .api import too_many_stop_jobs
+from .cache import folder_key
+from .cache import job_info_key
+from .cache import log_size_key
+from .cache import metadata_cache
+from .cache import parameters_key
+from .crawler import DEFAULT_MAX_WORKERS
+from .crawler import DEFAULT_PAGE_SIZE
+from .crawler import AsyncJobTreeCrawler
+from .exceptions import JenkinsBuildNotFoundError
+from .exceptions import JenkinsError
+from .exceptions import JenkinsJobNotFoundError
+from .exceptions import JenkinsServerBusyError
+from .executor import executor_pool
+from .log_cache import BLOCK_SIZE
+from .log_cache import CachedLog
+from .log_cache import LogCacheWriter
+from .log_cache import log_cache
+from .log_search import DEFAULT_CONTEXT_LINES
+from .log_search import DEFAULT_MAX_MATCHES
+from .log_search import LogSearcher
+from .log_summary import DEFAULT_MAX_EXCERPTS
+from .log_summary import DEFAULT_SUMMARY_CONTEXT_LINES
+from .log_summary import DEFAULT_SUMMARY_MAX_BYTES
+from .log_summary import FailureSummarizer
+from .registry import server_registry
+from .search_index import TrigramIndex
+from .session import async_session_pool
+from .singleflight import async_request_flights
+from .singleflight import request_key
+from .types import BatchTriggerResult
+from .types import BuildInfo
+from .types import BuildLogChunk
+from .types import BuildStatusResult
+from .types import BulkStopItem
+from .types import BulkStopResult
+from .types import FailureSummary
+from .types import JenkinsClient
+from .types import JenkinsServerConfig
+from .types import JobInfo
+from .types import JobParameter
+from .types import LogSearchResult
+from .types import ParameterDict
+from .types import PipelineNodeLog
+from .types import PipelineRun
+from .types import QueueCancelResult
+from .types import QueueInfo
+from .types import QueueItem
+from .types import StageLog
+from .types import StopResult
+from .types import TriggerResult
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Awaited with (elapsed seconds, max wait seconds, status message)
+ProgressCallback = Callable[[float, float, str], Awaitable[None]]
+
+
+class AsyncJenkinsAPIClient:
+    """Asyncio Jenkins API client.
+
+    The client every tool uses: the ``JenkinsAPIClient`` operations as
+    coroutines, plus the log, Pipeline, queue and batch operations, so tools
+    can await Jenkins I/O without blocking the MCP event loop. Connections
+    are pooled per server by ``async_session_pool``.
+    """
+
+    def __init__(self, server_name: str, timeout: int = 30) -> None:
+        """Initialize async Jenkins API client.
+
+        Must be created from a running event loop.
+
+        Args:
+            server_name: Jenkins server name
+            timeout: Request timeout (seconds)
+
+        Raises:
+            JenkinsServerNotFoundError: Server not found
+        """
+        self.server_name = server_name
+        self.timeout = timeout
+        self._client: JenkinsClient = server_registry.get(server_name)
+        self._server_config: JenkinsServerConfig = self._client.server_config
+        self._http = async_session_pool.get_client(
+            server_name, self._server_config.get("max_connections")
+        )
+
+    @property
+    def max_concurrency(self) -> int:
+        """Max concurrent requests batch operations send to this server."""
+        max_connections = self._server_config.get("max_connections")
+        return max_connections or async_session_pool.max_connections
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send HTTP request.
+
+        Concurrent identical GETs (same server, URL and parameters) share one
+        upstream request and its response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            **kwargs: Other request parameters
+
+        Returns:
+            HTTP response object
+
+        Raises:
+            JenkinsError: Request failed
+        """
+        if method == "GET" and not kwargs:
+            key = request_key(self.server_name, method, url, params)
+            return await async_request_flights.do(
+                key, lambda: self._send(method, url, params)
+            )
+        return await self._send(method, url, params, **kwargs)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send HTTP request upstream.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            **kwargs: Other request parameters
+
+        Returns:
+            HTTP response object
+
+        Raises:
+            JenkinsError: Request failed
+        """
+        headers = kwargs.pop("headers", None) or {}
+        if self._client.authorization:
+            headers = {"Authorization": self._client.authorization, **headers}
+
+        try:
+            response = await self._http.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                timeout=self.timeout,
+                **kwargs,
+            )
+            logger.debug(
+                f"Jenkins API request: {method} {url} -> {response.status_code}"
+            )
+            return response
+        except httpx.HTTPError as e:
+            logger.error(f"Jenkins API request failed: {e}")
+            raise JenkinsError(f"Jenkins API request failed: {e}") from e
+
+    def _build_job_url(self, job_full_name: str) -> str:
+        """Build job URL.
+
+        Args:
+            job_full_name: Full job name
+
+        Returns:
+            Job URL
+        """
+        parts = job_full_name.split("/")
+        job_path = "".join(f"/job/{part}" for part in parts)
+        return f"{self._client.base_url}{job_path}"
+
+    async def get_job_info(
+        self, job_full_name: str, include_parameters: bool = False
+    ) -> JobInfo:
+        """Get job info.
+
+        Job info and parameter definitions are cached for
+        ``metadata_cache.job_info_ttl`` seconds.
+
+        Args:
+            job_full_name: Full job name
+            include_parameters: Whether to include parsed parameter definitions
+
+        Returns:
+            Job info
+
+        Raises:
+            JenkinsJobNotFoundError: Job not found
+            JenkinsError: API request failed
+        """
+        cache_key = job_info_key(self.server_name, job_full_name)
+        job_info = metadata_cache.get(cache_key)
+        if job_info is None:
+            api_url = f"{self._build_job_url(job_full_name)}/api/json"
+
+            response = await self._make_request(
+                "GET", api_url, params={"tree": JOB_INFO_TREE}
+            )
+
+            if response.status_code == 404:
+                raise JenkinsJobNotFoundError(job_full_name, self.server_name)
+
+            response.raise_for_status()
+            data = response.json()
+
+            job_info = parse_job_info(data, job_full_name)
+            job_info["parameters"] = parse_parameter_definitions(data)
+            metadata_cache.set(cache_key, job_info, metadata_cache.job_info_ttl)
+            metadata_cache.set(
+                parameters_key(self.server_name, job_full_name),
+                job_info["parameters"],
+                metadata_cache.parameters_ttl,
+            )
+
+        if not include_parameters:
+            del job_info["parameters"]
+        return job_info
+
+    async def get_job_parameters(self, job_full_name: str) -> List[JobParameter]:
+        """Get job parameter definitions.
+
+        Definitions are served from ``metadata_cache`` for
+        ``metadata_cache.parameters_ttl`` seconds after a fetch.
+
+        Args:
+            job_full_name: Full job name
+
+        Returns:
+            List of parameter definitions
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        cache_key = parameters_key(self.server_name, job_full_name)
+        cached = metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        api_url = f"{self._build_job_url(job_full_name)}/api/json"
+
+        response = await self._make_request(
+            "GET", api_url, params={"tree": JOB_PARAMETERS_TREE}
+        )
+        response.raise_for_status()
+
+        params = parse_parameter_definitions(response.json())
+        metadata_cache.set(cache_key, params, metadata_cache.parameters_ttl)
+        return params
+
+    async def trigger_build(
+        self,
+        job_full_name: str,
+        params: Optional[ParameterDict] = None,
+        job_params: Optional[List[JobParameter]] = None,
+        max_wait: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> TriggerResult:
+        """Trigger build.
+
+        Args:
+            job_full_name: Full job name
+            params: Build parameters
+            job_params: Already fetched parameter definitions (skips the lookup)
+            max_wait: Seconds to wait for the build to start (defaults to config)
+            on_progress: Called after every queue poll while the build waits
+
+        Returns:
+            Trigger result
+
+        Raises:
+            JenkinsError: Trigger failed
+        """
+        # Check job parameters
+        if job_params is None:
+            job_params = await self.get_job_parameters(job_full_name)
+
+        queue_id, queue_location = await self._submit_build(
+            job_full_name, params, job_params
+        )
+
+        # Wait for build to start
+        return await self._wait_for_build_start(
+            queue_id, queue_location, max_wait, on_progress
+        )
+
+    async def _submit_build(
+        self,
+        job_full_name: str,
+        params: Optional[ParameterDict],
+        job_params: List[JobParameter],
+    ) -> Tuple[Optional[int], str]:
+        """Ask Jenkins to queue a build.
+
+        Args:
+            job_full_name: Full job name
+            params: Build parameters
+            job_params: Parameter definitions of the job
+
+        Returns:
+            (queue ID, queue location URL)
+
+        Raises:
+            JenkinsError: Trigger failed
+        """
+        job_url = self._build_job_url(job_full_name)
+
+        if job_params:
+            # Parameterized build
+            build_url = f"{job_url}/buildWithParameters"
+            build_params = params or {}
+        else:
+            # Non-parameterized build
+            build_url = f"{job_url}/build"
+            build_params = {}
+
+        response = await self._make_request("POST", build_url, params=build_params)
+        response.raise_for_status()
+
+        # Get queue location
+        queue_location = response.headers.get("Location", "")
+        return parse_queue_id(queue_location), queue_location
+
+    async def trigger_builds(
+        self,
+        builds: List[Tuple[str, Optional[ParameterDict]]],
+        max_wait: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> List[BatchTriggerResult]:
+        """Trigger many builds and wait for them to start together.
+
+        Every build's parameters are checked before anything is triggered.
+        The triggers then run concurrently, at most the server's
+        ``max_connections`` at once, and one wait covers all of them. A trigger
+        that fails is reported in its item's ``error``.
+
+        Args:
+            builds: (full job name, parameters) pairs
+            max_wait: Seconds to wait for the builds to start (defaults to config)
+            on_progress: Called after every queue poll while builds wait
+
+        Returns:
+            One result per build, in input order
+
+        Raises:
+            JenkinsParameterError: Some builds cannot be triggered
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def definitions(job_full_name: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self.get_job_parameters(job_full_name)
+                except (JenkinsError, httpx.HTTPError) as e:
+                    return e
+
+        job_params = await asyncio.gather(*(definitions(job) for job, _ in builds))
+        check_batch_parameters(builds, job_params)
+
+        async def submit(
+            build: Tuple[str, Optional[ParameterDict]],
+            build_job_params: List[JobParameter],
+        ) -> SubmittedBuild:
+            async with semaphore:
+                try:
+                    return (*await self._submit_build(*build, build_job_params), None)
+                except (JenkinsError, httpx.HTTPError) as e:
+                    return None, "", str(e)
+
+        submitted = await asyncio.gather(
+            *(submit(build, params) for build, params in zip(builds, job_params))
+        )
+
+        started = await self._wait_for_builds_start(
+            {queue_id: location for queue_id, location, _ in submitted if queue_id},
+            max_wait,
+            on_progress,
+        )
+        return batch_trigger_results(builds, submitted, started)
+
+    async def _wait_for_build_start(
+        self,
+        queue_id: Optional[int],
+        queue_location: str,
+        max_wait: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> TriggerResult:
+        """Wait for build to start without blocking the event loop.
+
+        The queue is polled with a backoff that starts at ``QUEUE_POLL_INITIAL``
+        so short queues resolve quickly.
+
+        Args:
+            queue_id: Queue ID
+            queue_location: Queue location URL
+            max_wait: Seconds to wait (defaults to config)
+            on_progress: Called after every poll that finds the build queued
+
+        Returns:
+            Trigger result
+        """
+        if max_wait is None:
+            max_wait = get_queue_max_wait()
+        if not queue_id:
+            return build_queued_result(
+                queue_id, queue_location, "Jenkins did not return a queue item"
+            )
+
+        started = time.monotonic()
+        delay = QUEUE_POLL_INITIAL
+        while True:
+            queue_info = await self.get_queue_info(queue_id)
+            if queue_info.get("build_number"):
+                return build_started_result(queue_info, queue_location)
+
+            elapsed = time.monotonic() - started
+            remaining = max_wait - elapsed
+            if remaining <= 0:
+                break
+            if on_progress:
+                await on_progress(
+                    elapsed, max_wait, queue_info.get("why") or "Waiting in queue"
+                )
+            await asyncio.sleep(min(delay, remaining))
+            delay = next_queue_poll_delay(delay)
+
+        # Timeout, return queue info
+        return build_queued_result(
+            queue_id, queue_location, queue_wait_timeout_message(max_wait)
+        )
+
+    async def _wait_for_builds_start(
+        self,
+        queue_items: Dict[int, str],
+        max_wait: Optional[float] = None,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Dict[int, TriggerResult]:
+        """Wait for many queued builds to start.
+
+        Each poll reads the whole queue with one request, however many builds
+        wait; only items that left the queue are looked up for their build
+        number. Polls back off like ``_wait_for_build_start``.
+
+        Args:
+            queue_items: Queue location URL of each queue ID
+            max_wait: Seconds to wait (defaults to config)
+            on_progress: Called after every poll that finds builds queued
+
+        Returns:
+            Trigger result of each queue ID
+        """
+        if max_wait is None:
+            max_wait = get_queue_max_wait()
+
+        waiting = dict(queue_items)
+        results: Dict[int, TriggerResult] = {}
+        started = time.monotonic()
+        delay = QUEUE_POLL_INITIAL
+        while waiting:
+            queued = {item["queue_id"] for item in await self.get_queue()}
+            departed = [queue_id for queue_id in waiting if queue_id not in queued]
+            for queue_info in await asyncio.gather(
+                *(self.get_queue_info(queue_id) for queue_id in departed)
+            ):
+                queue_id = queue_info["queue_id"]
+                if queue_info.get("build_number"):
+                    results[queue_id] = build_started_result(
+                        queue_info, waiting.pop(queue_id)
+                    )
+                elif queue_info["status"] == "NOT_FOUND":
+                    results[queue_id] = build_queued_result(
+                        queue_id, waiting.pop(queue_id), "Queue item no longer exists"
+                    )
+
+            elapsed = time.monotonic() - started
+            remaining = max_wait - elapsed
+            if not waiting or remaining <= 0:
+                break
+            if on_progress:
+                await on_progress(
+                    elapsed,
+                    max_wait,
+                    f"{len(waiting)} of {len(queue_items)} builds waiting in queue",
+                )
+            await asyncio.sleep(min(delay, remaining))
+            delay = next_queue_poll_delay(delay)
+
+        # Timeout, return queue info
+        for queue_id, queue_location in waiting.items():
+            results[queue_id] = build_queued_result(
+                queue_id, queue_location, queue_wait_timeout_message(max_wait)
+            )
+        return results
+
+    async def get_queue_info(self, queue_id: int) -> QueueInfo:
+        """Get queue info.
+
+        Args:
+            queue_id: Queue ID
+
+        Returns:
+            Queue info
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        api_url = f"{self._client.base_url}/queue/item/{queue_id}/api/json"
+
+        response = await self._make_request("GET", api_url)
+
+        if response.status_code == 404:
+            return queue_item_not_found(queue_id)
+
+        response.raise_for_status()
+        return parse_queue_info(response.json(), queue_id)
+
+    async def get_queue(self) -> List[QueueItem]:
+        """Get every item of the build queue in one request.
+
+        Returns:
+            Queue items
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        api_url = f"{self._client.base_url}/queue/api/json"
+
+        response = await self._make_request(
+            "GET", api_url, params={"tree": QUEUE_ITEMS_TREE}
+        )
+
+        response.raise_for_status()
+        return [parse_queue_item(item) for item in response.json().get("items") or []]
+
+    async def cancel_queue_item(self, queue_id: int) -> bool:
+        """Cancel a queue item.
+
+        Args:
+            queue_id: Queue ID
+
+        Returns:
+            Whether the item was still queued
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        cancel_url = f"{self._client.base_url}/queue/cancelItem"
+
+        response = await self._make_request(
+            "POST", cancel_url, params={"id": queue_id}
+        )
+
+        if response.status_code == 404:
+            return False
+
+        # Jenkins answers with a redirect to the queue page
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return True
+
+    async def cancel_queue_items(
+        self, queue_ids: List[int]
+    ) -> List[QueueCancelResult]:
+        """Cancel many queue items concurrently.
+
+        At most the server's ``max_connections`` requests run at once. A failed
+        cancellation is reported in its item's ``error``.
+
+        Args:
+            queue_ids: Queue IDs
+
+        Returns:
+            One result per queue ID, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def cancel(queue_id: int) -> QueueCancelResult:
+            async with semaphore:
+                try:
+                    cancelled = await self.cancel_queue_item(queue_id)
+                except (JenkinsError, httpx.HTTPError) as e:
+                    return queue_cancel_result(queue_id, None, e)
+            return queue_cancel_result(queue_id, cancelled, None)
+
+        return list(await asyncio.gather(*(cancel(id_) for id_ in queue_ids)))
+
+    async def get_build_status(
+        self, job_full_name: str, build_number: int
+    ) -> BuildInfo:
+        """Get build status.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Build info
+
+        Raises:
+            JenkinsBuildNotFoundError: Build not found
+            JenkinsError: API request failed
+        """
+        api_url = f"{self._build_job_url(job_full_name)}/{build_number}/api/json"
+
+        response = await self._make_request(
+            "GET", api_url, params={"tree": BUILD_INFO_TREE}
+        )
+
+        if response.status_code == 404:
+            raise JenkinsBuildNotFoundError(
+                build_number, job_full_name, self.server_name
+            )
+
+        response.raise_for_status()
+        return parse_build_info(response.json(), build_number)
+
+    async def get_recent_builds(
+        self, job_full_name: str, count: int
+    ) -> List[BuildInfo]:
+        """Get the most recent builds of a job in one request.
+
+        Args:
+            job_full_name: Full job name
+            count: Number of builds, newest first
+
+        Returns:
+            Build info of up to ``count`` builds, newest first
+
+        Raises:
+            JenkinsJobNotFoundError: Job not found
+            JenkinsError: API request failed
+        """
+        api_url = f"{self._build_job_url(job_full_name)}/api/json"
+
+        response = await self._make_request(
+            "GET", api_url, params={"tree": RECENT_BUILDS_TREE.format(count=count)}
+        )
+
+        if response.status_code == 404:
+            raise JenkinsJobNotFoundError(job_full_name, self.server_name)
+
+        response.raise_for_status()
+        return [
+            parse_build_info(build, build.get("number", 0))
+            for build in response.json().get("builds") or []
+        ]
+
+    async def get_builds_status(
+        self, builds: List[Tuple[str, int]]
+    ) -> List[BuildStatusResult]:
+        """Get the status of many builds concurrently.
+
+        At most the server's ``max_connections`` lookups run at once. A failed
+        lookup is reported in its item's ``error`` instead of failing the
+        batch.
+
+        Args:
+            builds: (job full name, build number) pairs
+
+        Returns:
+            One result per build, in input order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def lookup(job_full_name: str, build_number: int) -> BuildStatusResult:
+            async with semaphore:
+                try:
+                    status = await self.get_build_status(job_full_name, build_number)
+                except (JenkinsError, httpx.HTTPError) as e:
+                    return build_status_result(job_full_name, build_number, None, e)
+            return build_status_result(job_full_name, build_number, status, None)
+
+        return list(await asyncio.gather(*(lookup(*build) for build in builds)))
+
+    async def get_pipeline_stages(
+        self, job_full_name: str, build_number: int
+    ) -> PipelineRun:
+        """Get the stages of a Pipeline build with their status and timings.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Run info with its stages in execution order
+
+        Raises:
+            JenkinsError: Not a Pipeline build, or API request failed
+        """
+        data = await self._get_wfapi(job_full_name, build_number, "wfapi/describe")
+        return parse_pipeline_run(data, build_number)
+
+    async def get_stage_log(
+        self,
+        job_full_name: str,
+        build_number: int,
+        stage: str,
+        node_id: Optional[str] = None,
+        failed_only: bool = False,
+    ) -> StageLog:
+        """Get the logs of the steps of one Pipeline stage.
+
+        Only the selected stage's steps are downloaded, never the whole
+        console log.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            stage: Stage ID or name
+            node_id: Only this step (flow node ID)
+            failed_only: Only steps that did not succeed
+
+        Returns:
+            Stage info and step logs
+
+        Raises:
+            JenkinsParameterError: Unknown stage or step
+            JenkinsError: Not a Pipeline build, or API request failed
+        """
+        run = await self.get_pipeline_stages(job_full_name, build_number)
+        stage_info = find_pipeline_stage(run, stage)
+        described = await self._get_wfapi(
+            job_full_name,
+            build_number,
+            f"execution/node/{stage_info['id']}/wfapi/describe",
+        )
+        nodes = select_stage_nodes(described, node_id, failed_only)
+        semaphore = asyncio.Semaphore(STAGE_LOG_CONCURRENCY)
+
+        async def fetch(node: Dict[str, Any]) -> PipelineNodeLog:
+            async with semaphore:
+                data = await self._get_wfapi(
+                    job_full_name,
+                    build_number,
+                    f"execution/node/{node['id']}/wfapi/log",
+                )
+            return parse_node_log(node, data)
+
+        steps = await asyncio.gather(*(fetch(node) for node in nodes))
+        return {"stage": stage_info, "steps": list(steps)}
+
+    async def _get_wfapi(
+        self, job_full_name: str, build_number: int, path: str
+    ) -> Dict[str, Any]:
+        """Get a Pipeline REST API resource of a build.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            path: Path below the build URL
+
+        Returns:
+            Response JSON
+
+        Raises:
+            JenkinsError: Not a Pipeline build, or API request failed
+        """
+        url = f"{self._build_job_url(job_full_name)}/{build_number}/{path}"
+
+        response = await self._make_request("GET", url)
+
+        if response.status_code == 404:
+            raise JenkinsError(
+                f"Pipeline data not found for build #{build_number} of job "
+                f"'{job_full_name}' on server '{self.server_name}' (not a "
+                "Pipeline build, or the Pipeline: Stage View plugin is missing)",
+                status_code=404,
+            )
+
+        response.raise_for_status()
+        return response.json()
+
+    async def stop_build(self, job_full_name: str, build_number: int) -> StopResult:
+        """Stop build.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Stop result
+
+        Raises:
+            JenkinsError: Stop failed
+        """
+        stop_url = f"{self._build_job_url(job_full_name)}/{build_number}/stop"
+
+        response = await self._make_request("POST", stop_url)
+
+        if response.status_code == 404:
+            return {"status": "NOT_FOUND", "url": None}
+
+        if response.status_code == 403:
+            # Permission error, check build status
+            return await self._handle_stop_permission_error(
+                job_full_name, build_number
+            )
+
+        # Jenkins answers with a redirect to the build page
+        if response.status_code >= 400:
+            response.raise_for_status()
+        return {"status": "STOP_REQUESTED", "url": stop_url}
+
+    async def _handle_stop_permission_error(
+        self, job_full_name: str, build_number: int
+    ) -> StopResult:
+        """Handle permission error when stopping build.
+
+        Jenkins may refuse the request while the build stops anyway, so the
+        build is checked once; a build still running is reported as pending
+        rather than polled here, leaving confirmation to the caller.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Stop result
+        """
+        try:
+            build_info = await self.get_build_status(job_full_name, build_number)
+            if not build_info.get("building", True):
+                return {"status": "ALREADY_TERMINATED", "url": None}
+        except (JenkinsBuildNotFoundError, JenkinsError):
+            # Build not found or query failed, consider as terminated
+            return {"status": "ALREADY_TERMINATED", "url": None}
+
+        return {"status": "STOP_PENDING_CONFIRMATION", "url": None}
+
+    async def stop_builds(
+        self,
+        job_full_name: str,
+        running: bool = True,
+        queued: bool = True,
+        older_than: Optional[float] = None,
+        parameters: Optional[Dict[str, Any]] = None,
+        dry_run: bool = False,
+    ) -> BulkStopResult:
+        """Stop the running builds and cancel the queued items of a job or folder.
+
+        Folders are expanded into their jobs; each job is scanned with one
+        tree query and the queue with a single one. Queued items are
+        cancelled before running builds are stopped, so a queued sibling
+        cannot take a freed executor. At most ``max_concurrency`` requests
+        run at once; a failed stop is reported in its item's ``error``.
+
+        Args:
+            job_full_name: Full job or folder name
+            running: Stop running builds
+            queued: Cancel queued items of the jobs
+            older_than: Only builds started (items queued) at least this many
+                seconds ago
+            parameters: Only builds and items with these parameter values
+            dry_run: Only report what would be stopped
+
+        Returns:
+            Matched builds and queue items with the outcome of each
+
+        Raises:
+            JenkinsJobNotFoundError: Job not found
+            JenkinsParameterError: More than ``MAX_STOP_JOBS`` jobs to scan
+            JenkinsError: API request failed
+        """
+        jobs = await self._scan_jobs_to_stop(job_full_name)
+        queue = await self.get_queue() if queued else None
+        running_builds = jobs if running else {job: [] for job in jobs}
+        targets = select_stop_targets(running_builds, queue, older_than, parameters)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def stop(item: BulkStopItem) -> None:
+            async with semaphore:
+                try:
+                    if item["queue_id"] is not None:
+                        cancelled = await self.cancel_queue_item(item["queue_id"])
+                        item["status"] = "CANCELLED" if cancelled else "NOT_FOUND"
+                    else:
+                        result = await self.stop_build(
+                            item["job_full_name"], item["build_number"]
+                        )
+                        item["status"] = result["status"]
+                except (JenkinsError, httpx.HTTPError) as e:
+                    item["status"] = "FAILED"
+                    item["error"] = str(e)
+
+        if not dry_run:
+            queue_items = [item for item in targets if item["queue_id"] is not None]
+            builds = [item for item in targets if item["queue_id"] is None]
+            await asyncio.gather(*(stop(item) for item in queue_items))
+            await asyncio.gather(*(stop(item) for item in builds))
+
+        return {"jobs_scanned": len(jobs), "matched": len(targets), "items": targets}
+
+    async def _scan_jobs_to_stop(
+        self, job_full_name: str
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Find the jobs under a job or folder, with their running builds.
+
+        Args:
+            job_full_name: Full job or folder name
+
+        Returns:
+            Running builds by job full name
+
+        Raises:
+            JenkinsJobNotFoundError: Job not found
+            JenkinsParameterError: More than ``MAX_STOP_JOBS`` jobs to scan
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def scan(
+            name: str,
+        ) -> Tuple[List[str], Optional[List[Dict[str, Any]]]]:
+            async with semaphore:
+                return await self._scan_job_to_stop(name)
+
+        jobs: Dict[str, List[Dict[str, Any]]] = {}
+        level = [job_full_name]
+        scanned = 0
+        while level:
+            scanned += len(level)
+            if scanned > MAX_STOP_JOBS:
+                raise too_many_stop_jobs(job_full_name)
+            results = await asyncio.gather(*(scan(name) for name in level))
+            names, level = level, []
+            for name, (children, builds) in zip(names, results):
+                if builds is not None:
+                    jobs[name] = builds
+                level.extend(children)
+        return jobs
+
+    async def _scan_job_to_stop(
+        self, job_full_name: str
+    ) -> Tuple[List[str], Optional[List[Dict[str, Any]]]]:
+        """Query a job's children and running builds.
+
+        Args:
+            job_full_name: Full job or folder name
+
+        Returns:
+            (child job names, running builds or None for folders)
+
+        Raises:
+            JenkinsJobNotFoundError: Job not found
+        """
+        api_url = f"{self._build_job_url(job_full_name)}/api/json"
+        tree = STOP_SCAN_TREE.format(count=STOP_SCAN_BUILDS)
+
+        response = await self._make_request("GET", api_url, params={"tree": tree})
+
+        if response.status_code == 404:
+            raise JenkinsJobNotFoundError(job_full_name, self.server_name)
+
+        response.raise_for_status()
+        return parse_stop_scan(response.json())
+
+    async def get_build_log(
+        self,
+        job_full_name: str,
+        build_number: int,
+        start: int = 0,
+        max_bytes: int = DEFAULT_LOG_MAX_BYTES,
+        tail_lines: Optional[int] = None,
+    ) -> BuildLogChunk:
+        """Get a range of the build log.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            start: Byte offset to read from (``offset`` of the previous chunk)
+            max_bytes: Max bytes to return
+            tail_lines: Return only the last lines of the log (ignores ``start``)
+
+        Returns:
+            Log chunk with the offset to continue from and a ``more_data`` flag
+
+        Raises:
+            JenkinsBuildNotFoundError: Build not found
+            JenkinsError: API request failed
+        """
+        cached = self._open_cached_log(job_full_name, build_number)
+        if cached is not None:
+            return await self._read_cached_log(
+                cached, read_cached_log, start, max_bytes, tail_lines
+            )
+
+        if tail_lines:
+            return await self._get_build_log_tail(
+                job_full_name, build_number, tail_lines, max_bytes
+            )
+
+        async with self._open_log_stream(
+            job_full_name, build_number, start
+        ) as response:
+            start, _, more_data = parse_log_headers(response.headers, start)
+            data = await self._read_log(response, max_bytes + 1)
+        return make_log_chunk(data, start, max_bytes, more_data)
+
+    async def _get_build_log_tail(
+        self, job_full_name: str, build_number: int, tail_lines: int, max_bytes: int
+    ) -> BuildLogChunk:
+        """Get the last lines of the build log.
+
+        Jenkins has no cheap source of a log's size: progressiveText renders
+        the log from ``start`` to its end before reporting ``X-Text-Size``,
+        and treats a start past the end as 0. Logs only grow, so the size
+        seen by the last read of this build is used as the first start, and
+        the read costs only what was logged since. Without a known size, the
+        whole log is streamed once, keeping only its last ``max_bytes`` (and
+        caching it if the build is completed).
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            tail_lines: Number of lines wanted
+            max_bytes: Max bytes to return
+
+        Returns:
+            Log chunk
+        """
+        start = metadata_cache.get(
+            log_size_key(self.server_name, job_full_name, build_number)
+        )
+        async with self._open_log_stream(
+            job_full_name, build_number, start or 0
+        ) as response:
+            start, size, more_data = parse_log_headers(response.headers, start or 0)
+            writer = self._log_cache_writer(
+                job_full_name, build_number, start, size, more_data
+            )
+            try:
+                data, start, writer = await self._read_log_tail(
+                    response, start, max_bytes, writer
+                )
+                await self._commit_log_cache(writer, size)
+            finally:
+                if writer is not None:
+                    writer.abort()
+        chunk = make_log_tail(data, start, tail_lines, max_bytes, more_data)
+
+        # Too little was logged since the known size: read windows before it
+        window = LOG_TAIL_WINDOW
+        while chunk is None:
+            start = max(0, size - window)
+            async with self._open_log_stream(
+                job_full_name, build_number, start
+            ) as response:
+                start, size, more_data = parse_log_headers(response.headers, start)
+                data = await self._read_log(response, size - start)
+            chunk = make_log_tail(data, start, tail_lines, max_bytes, more_data)
+            window *= 2
+        return chunk
+
+    async def iter_build_log(
+        self, job_full_name: str, build_number: int, start: int = 0
+    ) -> AsyncIterator[bytes]:
+        """Stream the build log from ``start`` to its current end.
+
+        Close the iterator (e.g. with ``contextlib.aclosing``) when stopping
+        early, so the connection is released. A completed build's log read
+        through to its end is cached on the way.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            start: Byte offset to read from
+
+        Yields:
+            Raw log bytes, ``LOG_READ_CHUNK_SIZE`` at a time
+
+        Raises:
+            JenkinsBuildNotFoundError: Build not found
+            JenkinsError: API request failed
+        """
+        async with self._open_log_stream(
+            job_full_name, build_number, start
+        ) as response:
+            start, size, more_data = parse_log_headers(response.headers, start)
+            writer = self._log_cache_writer(
+                job_full_name, build_number, start, size, more_data
+            )
+            try:
+                async for block in response.aiter_bytes(LOG_READ_CHUNK_SIZE):
+                    writer = await self._write_log_cache(writer, block)
+                    yield block
+                await self._commit_log_cache(writer, size)
+            except httpx.HTTPError as e:
+                raise JenkinsError(f"Jenkins API request failed: {e}") from e
+            finally:
+                if writer is not None:
+                    writer.abort()
+
+    async def search_build_log(
+        self,
+        job_full_name: str,
+        build_number: int,
+        pattern: str,
+        context_lines: int = DEFAULT_CONTEXT_LINES,
+        max_matches: int = DEFAULT_MAX_MATCHES,
+    ) -> LogSearchResult:
+        """Search the build log with a regular expression.
+
+        The log is streamed and matched chunk by chunk; the download stops as
+        soon as ``max_matches`` matches and their context are collected. Logs
+        of completed builds are searched in the local log cache.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            pattern: Regular expression matched against each line
+            context_lines: Lines of context before and after each match
+            max_matches: Max matches to return
+
+        Returns:
+            Matching lines with line numbers and context
+
+        Raises:
+            JenkinsParameterError: Invalid pattern
+            JenkinsBuildNotFoundError: Build not found
+            JenkinsError: API request failed
+        """
+        searcher = LogSearcher(pattern, context_lines, max_matches)
+        cached = self._open_cached_log(job_full_name, build_number)
+        if cached is not None:
+            return await self._read_cached_log(
+                cached, lambda log: searcher.search(log.iter_blocks())
+            )
+
+        async with aclosing(
+            self.iter_build_log(job_full_name, build_number)
+        ) as blocks:
+            async for block in blocks:
+                searcher.feed(block)
+                if searcher.done:
+                    return searcher.result(complete=False)
+        return searcher.result(complete=True)
+
+    async def get_build_failure_summary(
+        self,
+        job_full_name: str,
+        build_number: int,
+        context_lines: int = DEFAULT_SUMMARY_CONTEXT_LINES,
+        max_excerpts: int = DEFAULT_MAX_EXCERPTS,
+        max_bytes: int = DEFAULT_SUMMARY_MAX_BYTES,
+    ) -> FailureSummary:
+        """Summarize the failure-relevant regions of the build log.
+
+        The log is streamed once and matched against the failure markers;
+        only the excerpts around them are kept.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            context_lines: Lines of context around failure markers
+            max_excerpts: Max excerpts returned
+            max_bytes: Max total size of excerpt text
+
+        Returns:
+            First error and last failure excerpts, with pipeline stages
+
+        Raises:
+            JenkinsBuildNotFoundError: Build not found
+            JenkinsError: API request failed
+        """
+        summarizer = FailureSummarizer(context_lines, max_excerpts, max_bytes)
+        cached = self._open_cached_log(job_full_name, build_number)
+        if cached is not None:
+            return await self._read_cached_log(
+                cached, lambda log: summarizer.summarize(log.iter_blocks())
+            )
+
+        async with aclosing(
+            self.iter_build_log(job_full_name, build_number)
+        ) as blocks:
+            async for block in blocks:
+                summarizer.feed(block)
+        return summarizer.result()
+
+    def _open_cached_log(
+        self, job_full_name: str, build_number: int
+    ) -> Optional[CachedLog]:
+        """Open the cached log of a completed build.
+
+        Logs are not downloaded here: a read that streams a completed
+        build's whole log caches it on the way (see ``_log_cache_writer``).
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Cached log, or None if caching is disabled or the log is not
+            cached (yet)
+        """
+        if not log_cache.enabled:
+            return None
+        return log_cache.open(self.server_name, job_full_name, build_number)
+
+    def _log_cache_writer(
+        self,
+        job_full_name: str,
+        build_number: int,
+        start: int,
+        size: int,
+        more_data: bool,
+    ) -> Optional[LogCacheWriter]:
+        """Get a writer caching a log response, if it holds a whole log.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            start: Byte offset of the response body
+            size: Log size reported by Jenkins
+            more_data: Whether Jenkins reported the build as still logging
+
+        Returns:
+            Writer, or None if the response starts past the beginning, the
+            build is still running, the log is too large to cache or caching
+            is disabled
+        """
+        if start or more_data or not log_cache.enabled:
+            return None
+        if size > log_cache.max_log_bytes:
+            return None
+        return log_cache.writer(self.server_name, job_full_name, build_number)
+
+    async def _write_log_cache(
+        self, writer: Optional[LogCacheWriter], block: bytes
+    ) -> Optional[LogCacheWriter]:
+        """Feed a block to a log cache writer.
+
+        Blocks are only buffered here; each full ``BLOCK_SIZE`` of them is
+        compressed and written on the server's executor, off the event loop.
+
+        Args:
+            writer: Log cache writer, or None when not caching
+            block: Next log bytes
+
+        Returns:
+            The writer, or None if caching was given up because the
+            server's executor is saturated
+        """
+        if writer is None:
+            return None
+        writer.write(block)
+        if writer.pending < BLOCK_SIZE:
+            return writer
+        try:
+            await executor_pool.run(self.server_name, writer.flush)
+        except JenkinsServerBusyError:
+            writer.abort()
+            return None
+        return writer
+
+    async def _commit_log_cache(
+        self, writer: Optional[LogCacheWriter], size: int
+    ) -> None:
+        """Publish a cached log on the server's executor if it is whole.
+
+        Args:
+            writer: Log cache writer, or None when not caching
+            size: Log size reported by Jenkins
+        """
+        if writer is None or writer.size != size:
+            return
+        try:
+            await executor_pool.run(self.server_name, writer.commit)
+        except JenkinsServerBusyError:
+            # Not caching the log is harmless; the caller aborts the writer
+            pass
+
+    async def _read_cached_log(
+        self, cached: CachedLog, fn: Callable[..., T], *args: Any
+    ) -> T:
+        """Run a blocking read of a cached log on the server's executor.
+
+        Inflating and scanning a large log takes long enough to stall the
+        event loop, so it runs on a worker thread; the log is closed after.
+
+        Args:
+            cached: Cached log, closed when the read finishes
+            fn: Function called with the cached log and ``args``
+            *args: Further arguments for ``fn``
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            JenkinsServerBusyError: The server's executor is saturated
+        """
+
+        def read() -> T:
+            with cached:
+                return fn(cached, *args)
+
+        try:
+            return await executor_pool.run(self.server_name, read)
+        except JenkinsServerBusyError:
+            cached.close()
+            raise
+
+    @asynccontextmanager
+    async def _open_log_stream(
+        self, job_full_name: str, build_number: int, start: int
+    ) -> AsyncIterator[httpx.Response]:
+        """Open a streamed progressiveText response.
+
+        Args:
+            job_full_name: Full job name
+            build_number: Build number
+            start: Byte offset to read from
+
+        Yields:
+            Response whose body has not been read yet
+
+        Raises:
+            JenkinsBuildNotFoundError: Build not found
+            JenkinsError: API request failed
+        """
+        log_url = (
+            f"{self._build_job_url(job_full_name)}/{build_number}"
+            "/logText/progressiveText"
+        )
+        headers = {}
+        if self._client.authorization:
+            headers["Authorization"] = self._client.authorization
+
+        request = self._http.build_request(
+            "GET",
+            log_url,
+            params={"start": start},
+            headers=headers,
+            timeout=self.timeout,
+        )
+        try:
+            response = await self._http.send(request, stream=True)
+        except httpx.HTTPError as e:
+            logger.error(f"Jenkins API request failed: {e}")
+            raise JenkinsError(f"Jenkins API request failed: {e}") from e
+
+        try:
+            if response.status_code == 404:
+                raise JenkinsBuildNotFoundError(
+                    build_number, job_full_name, self.server_name
+                )
+            response.raise_for_status()
+            # Logs only grow, so the size seen now is a safe start for the
+            # next tail read
+            _, size, _ = parse_log_headers(response.headers, start)
+            metadata_cache.set(
+                log_size_key(self.server_name, job_full_name, build_number),
+                size,
+                metadata_cache.log_size_ttl,
+            )
+            yield response
+        finally:
+            await response.aclose()
+
+    @staticmethod
+    async def _read_log(response: httpx.Response, limit: int) -> bytes:
+        """Read up to ``limit`` bytes of a streamed log response.
+
+        Args:
+            response: Streamed response
+            limit: Max bytes to read
+
+        Returns:
+            Bytes read
+
+        Raises:
+            JenkinsError: Connection failed while reading
+        """
+        data = bytearray()
+        try:
+            async for block in response.aiter_bytes():
+                data += block
+                if len(data) >= limit:
+                    break
+        except httpx.HTTPError as e:
+            raise JenkinsError(f"Jenkins API request failed: {e}") from e
+        return bytes(data[:limit])
+
+    async def _read_log_tail(
+        self,
+        response: httpx.Response,
+        start: int,
+        keep: int,
+        writer: Optional[LogCacheWriter] = None,
+    ) -> Tuple[bytes, int, Optional[LogCacheWriter]]:
+        """Read a streamed log response to its end, keeping its last bytes.
+
+        Args:
+            response: Streamed response
+            start: Byte offset of the response body
+            keep: Bytes to keep from the end
+            writer: Log cache writer fed every block read
+
+        Returns:
+            (kept bytes, their byte offset, writer or None if caching was
+            given up)
+
+        Raises:
+            JenkinsError: Connection failed while reading
+        """
+        data = bytearray()
+        try:
+            async for block in response.aiter_bytes(LOG_READ_CHUNK_SIZE):
+                writer = await self._write_log_cache(writer, block)
+                data += block
+                # Trim in batches so memory stays within twice ``keep``
+                if len(data) > 2 * keep:
+                    start += len(data) - keep
+                    del data[: len(data) - keep]
+        except httpx.HTTPError as e:
+            raise JenkinsError(f"Jenkins API request failed: {e}") from e
+        if len(data) > keep:
+            start += len(data) - keep
+            del data[: len(data) - keep]
+        return bytes(data), start, writer
+
+    async def search_jobs(
+        self, keyword: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[JobInfo]:
+        """Search jobs.
+
+        Args:
+            keyword: Search keyword
+            limit: Max number of jobs to return (None for all)
+            offset: Number of ranked matches to skip
+
+        Returns:
+            List of matching jobs, best matches first
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        return TrigramIndex(await self.list_jobs()).search(keyword, limit, offset)
+
+    async def list_jobs(self) -> List[JobInfo]:
+        """List every job and folder on the server.
+
+        Returns:
+            List of job info
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        return [job async for job in self.iter_jobs()]
+
+    def iter_jobs(self) -> AsyncIterator[JobInfo]:
+        """Crawl every job and folder on the server, at any depth.
+
+        Page size and concurrency come from the ``job_index`` config section
+        (``crawl_page_size``, ``crawl_workers``).
+
+        Returns:
+            Async iterator of job info, as folder pages arrive
+        """
+        index_config = get_config().get("job_index") or {}
+        crawler = AsyncJobTreeCrawler(
+            self,
+            page_size=int(index_config.get("crawl_page_size", DEFAULT_PAGE_SIZE)),
+            max_workers=int(index_config.get("crawl_workers", DEFAULT_MAX_WORKERS)),
+        )
+        return crawler.crawl()
+
+    async def get_folder_jobs(
+        self, folder_full_name: str, start: int, end: int
+    ) -> List[Tuple[JobInfo, bool]]:
+        """Get one page of a folder's direct children.
+
+        Args:
+            folder_full_name: Full folder name ("" for the root)
+            start: Index of the first child (inclusive)
+            end: Index of the last child (exclusive)
+
+        Returns:
+            List of (job info, whether it is a non-empty folder) tuples
+
+        Raises:
+            JenkinsJobNotFoundError: Folder not found
+            JenkinsError: API request failed
+        """
+        if folder_full_name:
+            api_url = f"{self._build_job_url(folder_full_name)}/api/json"
+        else:
+            api_url = f"{self._client.base_url}/api/json"
+        tree = FOLDER_JOBS_TREE.format(fields=SEARCH_JOB_FIELDS, start=start, end=end)
+
+        response = await self._make_request("GET", api_url, params={"tree": tree})
+
+        if response.status_code == 404 and folder_full_name:
+            raise JenkinsJobNotFoundError(folder_full_name, self.server_name)
+
+        response.raise_for_status()
+        return parse_folder_jobs(response.json(), folder_full_name)
+
+    async def create_job(
+        self, job_name: str, job_config: str, folder_path: str = ""
+    ) -> dict:
+        """Create a new Jenkins job.
+
+        Args:
+            job_name: Name of the new job
+            job_config: XML configuration for the job
+            folder_path: Optional folder path (e.g., "test/folder1" for nested folders)
+
+        Returns:
+            Dict containing creation result with status and job_url
+
+        Raises:
+            JenkinsError: Job creation failed
+        """
+        # Create folders if they don't exist
+        if folder_path:
+            await self._ensure_folders_exist(folder_path)
+            folder_url = self._build_job_url(folder_path)
+            create_url = f"{folder_url}/createItem"
+            job_url = f"{folder_url}/job/{job_name}"
+        else:
+            create_url = f"{self._client.base_url}/createItem"
+            job_url = f"{self._client.base_url}/job/{job_name}"
+
+        headers = {"Content-Type": "application/xml"}
+        params = {"name": job_name}
+
+        response = await self._make_request(
+            "POST", create_url, params=params, content=job_config, headers=headers
+        )
+
+        if response.status_code == 400:
+            raise JenkinsError(
+                f"Job creation failed: Job '{job_name}' already exists or invalid configuration"
+            )
+
+        response.raise_for_status()
+
+        # Drop anything cached while the job did not exist yet
+        job_full_name = f"{folder_path}/{job_name}" if folder_path else job_name
+        metadata_cache.invalidate_job(self.server_name, job_full_name)
+
+        return {
+            "status": "CREATED",
+            "job_name": job_name,
+            "job_url": job_url,
+            "folder_path": folder_path,
+        }
+
+    async def _ensure_folders_exist(self, folder_path: str) -> None:
+        """Ensure all folders in the path exist, create them if they don't.
+
+        Args:
+            folder_path: Folder path (e.g., "MCPS/username/subfolder")
+
+        Raises:
+            JenkinsError: Folder creation failed
+        """
+        current_path = ""
+
+        for folder in folder_path.split("/"):
+            current_path = f"{current_path}/{folder}" if current_path else folder
+
+            if not await self._folder_exists(current_path):
+                await self._create_folder(current_path, folder)
+
+    async def _folder_exists(self, folder_path: str) -> bool:
+        """Check if a folder exists.
+
+        Existing folders are remembered for ``metadata_cache.folder_ttl`` seconds.
+
+        Args:
+            folder_path: Folder path to check
+
+        Returns:
+            True if folder exists, False otherwise
+        """
+        cache_key = folder_key(self.server_name, folder_path)
+        if metadata_cache.get(cache_key):
+            return True
+
+        try:
+            api_url = f"{self._build_job_url(folder_path)}/api/json"
+            response = await self._make_request("GET", api_url)
+        except Exception:
+            return False
+
+        exists = response.status_code == 200
+        if exists:
+            metadata_cache.set(cache_key, True, metadata_cache.folder_ttl)
+        return exists
+
+    async def _create_folder(self, folder_path: str, folder_name: str) -> None:
+        """Create a folder.
+
+        Args:
+            folder_path: Full folder path
+            folder_name: Name of the folder to create
+
+        Raises:
+            JenkinsError: Folder creation failed
+        """
+        parent_path = folder_path.rpartition("/")[0]
+        if parent_path:
+            create_url = f"{self._build_job_url(parent_path)}/createItem"
+        else:
+            create_url = f"{self._client.base_url}/createItem"
+
+        headers = {"Content-Type": "application/xml"}
+        params = {"name": folder_name, "mode": FOLDER_MODE}
+
+        response = await self._make_request(
+            "POST",
+            create_url,
+            params=params,
+            content=FOLDER_CONFIG_XML,
+            headers=headers,
+        )
+
+        if response.status_code == 400:
+            # Folder might already exist, check again
+            if not await self._folder_exists(folder_path):
+                raise JenkinsError(f"Failed to create folder '{folder_name}'")
+        else:
+            response.raise_for_status()
+            metadata_cache.set(
+                folder_key(self.server_name, folder_path),
+                True,
+                metadata_cache.folder_ttl,
+            )
+
+    async def update_job(
+        self, job_name: str, job_config: str, folder_path: str = ""
+    ) -> dict:
+        """Update an existing Jenkins job.
+
+        Args:
+            job_name: Name of the job to update
+            job_config: New XML configuration for the job
+            folder_path: Folder path where the job is located
+
+        Returns:
+            Dict containing update result with status and job_url
+
+        Raises:
+            JenkinsError: Job update failed
+        """
+        job_full_name = f"{folder_path}/{job_name}" if folder_path else job_name
+        job_url = self._build_job_url(job_full_name)
+
+        # Get CSRF token if needed
+        headers = {"Content-Type": "application/xml"}
+        crumb = await self._get_crumb()
+        if crumb:
+            headers[crumb["crumbRequestField"]] = crumb["crumb"]
+
+        response = await self._make_request(
+            "POST", f"{job_url}/config.xml", content=job_config, headers=headers
+        )
+
+        if response.status_code == 404:
+            raise JenkinsError(f"Job update failed: Job '{job_name}' not found")
+        response.raise_for_status()
+
+        # Job info and parameter definitions may have changed with the config
+        metadata_cache.invalidate_job(self.server_name, job_full_name)
+
+        return {
+            "status": "UPDATED",
+            "job_name": job_name,
+            "job_url": job_url,
+            "folder_path": folder_path,
+        }
+
+    async def _get_crumb(self) -> Optional[Dict[str, str]]:
+        """Get CSRF crumb from Jenkins.
+
+        Returns:
+            Dict with crumb info or None if CSRF is disabled
+        """
+        try:
+            crumb_url = f"{self._client.base_url}/crumbIssuer/api/json"
+            response = await self._make_request("GET", crumb_url)
+
+            if response.status_code == 200:
+                return response.json()
+            return None
+        except Exception:
+            return None
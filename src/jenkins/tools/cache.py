@@ -0,0 +1,270 @@
+"""Process-wide cache for Jenkins job metadata."""
+
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARAMETERS_TTL = 60.0
+DEFAULT_JOB_INFO_TTL = 15.0
+DEFAULT_FOLDER_TTL = 300.0
+DEFAULT_LOG_SIZE_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory footprint of a cached value from its JSON size."""
+    return len(json.dumps(value, default=str))
+
+
+@dataclass
+class _Entry:
+    """One cached value."""
+
+    expires_at: float
+    value: Any
+    size: int
+
+
+class MetadataCache:
+    """Thread-safe TTL + LRU cache of job metadata.
+
+    Each entry expires after its own TTL; when the cache exceeds
+    ``max_entries`` or ``max_bytes``, least recently used entries are evicted.
+    Values are deep-copied on the way in and out, so callers can mutate what
+    they get without corrupting the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """Initialize metadata cache.
+
+        Args:
+            max_entries: Max cached entries (defaults to config)
+            max_bytes: Max estimated size of cached values (defaults to config)
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _config() -> Dict[str, Any]:
+        """Get the ``metadata_cache`` config section."""
+        return get_config().get("metadata_cache") or {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether clients should cache metadata."""
+        return bool(self._config().get("enabled", True))
+
+    @property
+    def max_entries(self) -> int:
+        """Max cached entries."""
+        if self._max_entries is not None:
+            return self._max_entries
+        return int(self._config().get("max_entries", DEFAULT_MAX_ENTRIES))
+
+    @property
+    def max_bytes(self) -> int:
+        """Max estimated size of cached values."""
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return int(self._config().get("max_bytes", DEFAULT_MAX_BYTES))
+
+    @property
+    def parameters_ttl(self) -> float:
+        """Seconds parameter definitions stay cached (0 disables caching)."""
+        return float(self._config().get("parameters_ttl", DEFAULT_PARAMETERS_TTL))
+
+    @property
+    def job_info_ttl(self) -> float:
+        """Seconds job info stays cached (0 disables caching)."""
+        return float(self._config().get("job_info_ttl", DEFAULT_JOB_INFO_TTL))
+
+    @property
+    def folder_ttl(self) -> float:
+        """Seconds a folder is remembered as existing (0 disables caching)."""
+        return float(self._config().get("folder_ttl", DEFAULT_FOLDER_TTL))
+
+    @property
+    def log_size_ttl(self) -> float:
+        """Seconds a build's last seen log size is kept (0 disables caching)."""
+        return float(self._config().get("log_size_ttl", DEFAULT_LOG_SIZE_TTL))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry.value
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """Cache a value, evicting least recently used entries if needed.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds before the entry expires (<= 0 skips caching)
+        """
+        if ttl <= 0 or not self.enabled:
+            return
+        value = copy.deepcopy(value)
+        size = _estimate_size(value)
+        max_entries = self.max_entries
+        max_bytes = self.max_bytes
+        if size > max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(time.monotonic() + ttl, value, size)
+            self._bytes += size
+
+            while len(self._entries) > max_entries or self._bytes > max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a cached value.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_job(self, server_name: str, job_full_name: str) -> None:
+        """Drop everything cached about a job.
+
+        Args:
+            server_name: Jenkins server name
+            job_full_name: Full job name
+        """
+        self.invalidate(job_info_key(server_name, job_full_name))
+        self.invalidate(parameters_key(server_name, job_full_name))
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with size, limits and hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+def parameters_key(server_name: str, job_full_name: str) -> Tuple[str, str, str]:
+    """Build the cache key of a job's parameter definitions.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+
+    Returns:
+        Cache key
+    """
+    return ("parameters", server_name, job_full_name)
+
+
+def job_info_key(server_name: str, job_full_name: str) -> Tuple[str, str, str]:
+    """Build the cache key of a job's info.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+
+    Returns:
+        Cache key
+    """
+    return ("job_info", server_name, job_full_name)
+
+
+def folder_key(server_name: str, folder_path: str) -> Tuple[str, str, str]:
+    """Build the cache key of a folder's existence.
+
+    Args:
+        server_name: Jenkins server name
+        folder_path: Full folder path
+
+    Returns:
+        Cache key
+    """
+    return ("folder", server_name, folder_path)
+
+
+def log_size_key(
+    server_name: str, job_full_name: str, build_number: int
+) -> Tuple[str, str, str, int]:
+    """Build the cache key of a build's last seen log size.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+
+    Returns:
+        Cache key
+    """
+    return ("log_size", server_name, job_full_name, build_number)
+
+
+# Global metadata cache shared by all Jenkins API clients
+metadata_cache = MetadataCache()
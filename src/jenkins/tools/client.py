@@ -1,21 +1,52 @@
 """Jenkins API client."""
 
 import logging
-import re
 import time
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 import requests
 
-from ..config import get_jenkins_servers
+from ..config import get_config
+from .api import BUILD_INFO_TREE
+from .api import FOLDER_CONFIG_XML
+from .api import FOLDER_JOBS_TREE
+from .api import FOLDER_MODE
+from .api import JOB_INFO_TREE
+from .api import JOB_PARAMETERS_TREE
+from .api import QUEUE_POLL_INITIAL
+from .api import SEARCH_JOB_FIELDS
+from .api import build_queued_result
+from .api import build_started_result
+from .api import get_queue_max_wait
+from .api import next_queue_poll_delay
+from .api import parse_build_info
+from .api import parse_folder_jobs
+from .api import parse_job_info
+from .api import parse_parameter_definitions
+from .api import parse_queue_id
+from .api import parse_queue_info
+from .api import queue_item_not_found
+from .api import queue_wait_timeout_message
+from .cache import folder_key
+from .cache import job_info_key
+from .cache import metadata_cache
+from .cache import parameters_key
+from .crawler import DEFAULT_MAX_WORKERS
+from .crawler import DEFAULT_PAGE_SIZE
+from .crawler import JobTreeCrawler
 from .exceptions import JenkinsBuildNotFoundError
 from .exceptions import JenkinsError
 from .exceptions import JenkinsJobNotFoundError
-from .exceptions import JenkinsPermissionError
-from .exceptions import JenkinsServerNotFoundError
+from .registry import server_registry
+from .search_index import TrigramIndex
+from .session import session_pool
+from .singleflight import request_flights
+from .singleflight import request_key
 from .types import BuildInfo
 from .types import JenkinsClient
 from .types import JenkinsServerConfig
@@ -44,8 +75,11 @@ class JenkinsAPIClient:
         """
         self.server_name = server_name
         self.timeout = timeout
-        self._server_config = self._get_server_config(server_name)
-        self._client = JenkinsClient(self._server_config, timeout)
+        self._client: JenkinsClient = server_registry.get(server_name)
+        self._server_config: JenkinsServerConfig = self._client.server_config
+        self._session = session_pool.get_session(
+            server_name, self._server_config.get("max_connections")
+        )
 
     @staticmethod
     def _get_server_config(server_name: str) -> JenkinsServerConfig:
@@ -60,11 +94,7 @@ class JenkinsAPIClient:
         Raises:
             JenkinsServerNotFoundError: Server not found
         """
-        servers = get_jenkins_servers()
-        for server in servers:
-            if server["name"] == server_name:
-                return server
-        raise JenkinsServerNotFoundError(server_name)
+        return server_registry.get(server_name).server_config
 
     def _make_request(
         self,
@@ -75,6 +105,35 @@ class JenkinsAPIClient:
     ) -> requests.Response:
         """Send HTTP request.
 
+        Concurrent identical GETs (same server, URL and parameters) share one
+        upstream request and its response.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            **kwargs: Other request parameters
+
+        Returns:
+            HTTP response object
+
+        Raises:
+            JenkinsError: Request failed
+        """
+        if method == "GET" and not kwargs:
+            key = request_key(self.server_name, method, url, params)
+            return request_flights.do(key, lambda: self._send(method, url, params))
+        return self._send(method, url, params, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send HTTP request upstream.
+
         Args:
             method: HTTP method
             url: Request URL
@@ -87,11 +146,15 @@ class JenkinsAPIClient:
         Raises:
             JenkinsError: Request failed
         """
+        headers = kwargs.pop("headers", None) or {}
+        if self._client.authorization:
+            headers = {"Authorization": self._client.authorization, **headers}
+
         try:
-            response = requests.request(
+            response = self._session.request(
                 method=method,
                 url=url,
-                auth=self._client.auth,
+                headers=headers,
                 params=params,
                 timeout=self.timeout,
                 **kwargs,
@@ -117,11 +180,17 @@ class JenkinsAPIClient:
         job_path = "".join(f"/job/{part}" for part in parts)
         return f"{self._client.base_url}{job_path}"
 
-    def get_job_info(self, job_full_name: str) -> JobInfo:
+    def get_job_info(
+        self, job_full_name: str, include_parameters: bool = False
+    ) -> JobInfo:
         """Get job info.
 
+        Name, status, last build and parameter definitions are fetched in a
+        single request and cached for ``metadata_cache.job_info_ttl`` seconds.
+
         Args:
             job_full_name: Full job name
+            include_parameters: Whether to include parsed parameter definitions
 
         Returns:
             Job info
@@ -130,66 +199,41 @@ class JenkinsAPIClient:
             JenkinsJobNotFoundError: Job not found
             JenkinsError: API request failed
         """
-        job_url = self._build_job_url(job_full_name)
-        api_url = f"{job_url}/api/json?tree=name,fullName,url,description,buildable,color,lastBuild[number,url]"
-
-        response = self._make_request("GET", api_url)
-
-        if response.status_code == 404:
-            raise JenkinsJobNotFoundError(job_full_name, self.server_name)
-
-        response.raise_for_status()
-        data = response.json()
-
-        # Get last build info
-        last_build = data.get("lastBuild")
-        last_build_number = None
-        last_build_url = None
-
-        if last_build:
-            last_build_number = last_build.get("number")
-            last_build_url = last_build.get("url")
-
-        return {
-            "name": data.get("name", ""),
-            "fullName": data.get("fullName", job_full_name),
-            "url": data.get("url", ""),
-            "description": data.get("description"),
-            "buildable": data.get("buildable", False),
-            "color": data.get("color", "grey"),
-            "is_parameterized": self._is_job_parameterized(job_full_name),
-            "last_build_number": last_build_number,
-            "last_build_url": last_build_url,
-        }
+        cache_key = job_info_key(self.server_name, job_full_name)
+        job_info = metadata_cache.get(cache_key)
+        if job_info is None:
+            job_url = self._build_job_url(job_full_name)
+            api_url = f"{job_url}/api/json"
 
-    def _is_job_parameterized(self, job_full_name: str) -> bool:
-        """Check if job is parameterized.
+            response = self._make_request(
+                "GET", api_url, params={"tree": JOB_INFO_TREE}
+            )
 
-        Args:
-            job_full_name: Full job name
+            if response.status_code == 404:
+                raise JenkinsJobNotFoundError(job_full_name, self.server_name)
 
-        Returns:
-            Whether parameterized
-        """
-        try:
-            job_url = self._build_job_url(job_full_name)
-            api_url = f"{job_url}/api/json?tree=property[parameterDefinitions[name]]"
-
-            response = self._make_request("GET", api_url)
             response.raise_for_status()
-
             data = response.json()
-            for prop in data.get("property", []):
-                if "parameterDefinitions" in prop and prop["parameterDefinitions"]:
-                    return True
-            return False
-        except Exception:
-            logger.warning(f"Failed to check if job {job_full_name} is parameterized")
-            return False
+
+            job_info = parse_job_info(data, job_full_name)
+            job_info["parameters"] = parse_parameter_definitions(data)
+            metadata_cache.set(cache_key, job_info, metadata_cache.job_info_ttl)
+            metadata_cache.set(
+                parameters_key(self.server_name, job_full_name),
+                job_info["parameters"],
+                metadata_cache.parameters_ttl,
+            )
+
+        if not include_parameters:
+            del job_info["parameters"]
+        return job_info
 
     def get_job_parameters(self, job_full_name: str) -> List[JobParameter]:
         """Get job parameter definitions.
 
+        Definitions are served from ``metadata_cache`` for
+        ``metadata_cache.parameters_ttl`` seconds after a fetch.
+
         Args:
             job_full_name: Full job name
 
@@ -199,59 +243,37 @@ class JenkinsAPIClient:
         Raises:
             JenkinsError: API request failed
         """
+        cache_key = parameters_key(self.server_name, job_full_name)
+        cached = metadata_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         job_url = self._build_job_url(job_full_name)
-        api_url = (
-            f"{job_url}/api/json?tree=actions[parameterDefinitions[name,type,"
-            "defaultParameterValue[value],choices]],property[parameterDefinitions"
-            "[name,type,defaultParameterValue[value],choices]]"
-        )
+        api_url = f"{job_url}/api/json"
 
-        response = self._make_request("GET", api_url)
+        response = self._make_request(
+            "GET", api_url, params={"tree": JOB_PARAMETERS_TREE}
+        )
         response.raise_for_status()
 
-        data = response.json()
-        params = []
-
-        def process_parameter(param_def: Dict[str, Any]) -> JobParameter:
-            """Process parameter definition."""
-            param_info: JobParameter = {
-                "name": param_def.get("name", ""),
-                "type": param_def.get("type", ""),
-                "default": param_def.get("defaultParameterValue", {}).get("value"),
-                "choices": None,
-            }
-
-            # If Choice Parameter, add choices list
-            if (
-                param_def.get("type") == "ChoiceParameterDefinition"
-                and "choices" in param_def
-            ):
-                param_info["choices"] = param_def.get("choices", [])
-
-            return param_info
-
-        # Process property field
-        for prop in data.get("property", []):
-            if "parameterDefinitions" in prop:
-                for param_def in prop["parameterDefinitions"]:
-                    params.append(process_parameter(param_def))
-
-        # Process actions field (compatibility)
-        for action in data.get("actions", []):
-            if "parameterDefinitions" in action:
-                for param_def in action["parameterDefinitions"]:
-                    params.append(process_parameter(param_def))
-
+        params = parse_parameter_definitions(response.json())
+        metadata_cache.set(cache_key, params, metadata_cache.parameters_ttl)
         return params
 
     def trigger_build(
-        self, job_full_name: str, params: Optional[ParameterDict] = None
+        self,
+        job_full_name: str,
+        params: Optional[ParameterDict] = None,
+        job_params: Optional[List[JobParameter]] = None,
+        max_wait: Optional[float] = None,
     ) -> TriggerResult:
         """Trigger build.
 
         Args:
             job_full_name: Full job name
             params: Build parameters
+            job_params: Already fetched parameter definitions (skips the lookup)
+            max_wait: Seconds to wait for the build to start (defaults to config)
 
         Returns:
             Trigger result
@@ -259,10 +281,37 @@ class JenkinsAPIClient:
         Raises:
             JenkinsError: Trigger failed
         """
-        job_url = self._build_job_url(job_full_name)
-
         # Check job parameters
-        job_params = self.get_job_parameters(job_full_name)
+        if job_params is None:
+            job_params = self.get_job_parameters(job_full_name)
+
+        queue_id, queue_location = self._submit_build(
+            job_full_name, params, job_params
+        )
+
+        # Wait for build to start
+        return self._wait_for_build_start(queue_id, queue_location, max_wait)
+
+    def _submit_build(
+        self,
+        job_full_name: str,
+        params: Optional[ParameterDict],
+        job_params: List[JobParameter],
+    ) -> Tuple[Optional[int], str]:
+        """Ask Jenkins to queue a build.
+
+        Args:
+            job_full_name: Full job name
+            params: Build parameters
+            job_params: Parameter definitions of the job
+
+        Returns:
+            (queue ID, queue location URL)
+
+        Raises:
+            JenkinsError: Trigger failed
+        """
+        job_url = self._build_job_url(job_full_name)
 
         if job_params:
             # Parameterized build
@@ -278,55 +327,51 @@ class JenkinsAPIClient:
 
         # Get queue location
         queue_location = response.headers.get("Location", "")
-        queue_id = None
-
-        if queue_location:
-            match = re.search(r"/queue/item/(\d+)/", queue_location)
-            if match:
-                queue_id = int(match.group(1))
-
-        # Wait for build to start
-        return self._wait_for_build_start(queue_id, queue_location)
+        return parse_queue_id(queue_location), queue_location
 
     def _wait_for_build_start(
-        self, queue_id: Optional[int], queue_location: str
+        self,
+        queue_id: Optional[int],
+        queue_location: str,
+        max_wait: Optional[float] = None,
     ) -> TriggerResult:
         """Wait for build to start.
 
+        The queue is polled with a backoff that starts at ``QUEUE_POLL_INITIAL``
+        so short queues resolve quickly.
+
         Args:
             queue_id: Queue ID
             queue_location: Queue location URL
+            max_wait: Seconds to wait (defaults to config)
 
         Returns:
             Trigger result
         """
-        max_attempts = 10
-
-        for attempt in range(max_attempts):
-            if queue_id:
-                queue_info = self.get_queue_info(queue_id)
-                if queue_info.get("build_number"):
-                    return {
-                        "status": "BUILD_STARTED",
-                        "build_number": queue_info["build_number"],
-                        "build_url": queue_info.get("build_url"),
-                        "queue_id": queue_id,
-                        "queue_url": queue_location,
-                        "message": None,
-                    }
-
-            if attempt < max_attempts - 1:
-                time.sleep(1)
+        if max_wait is None:
+            max_wait = get_queue_max_wait()
+        if not queue_id:
+            return build_queued_result(
+                queue_id, queue_location, "Jenkins did not return a queue item"
+            )
+
+        deadline = time.monotonic() + max_wait
+        delay = QUEUE_POLL_INITIAL
+        while True:
+            queue_info = self.get_queue_info(queue_id)
+            if queue_info.get("build_number"):
+                return build_started_result(queue_info, queue_location)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = next_queue_poll_delay(delay)
 
         # Timeout, return queue info
-        return {
-            "status": "QUEUED",
-            "build_number": None,
-            "build_url": None,
-            "queue_id": queue_id,
-            "queue_url": queue_location,
-            "message": "Build is queued but did not start within 10 seconds",
-        }
+        return build_queued_result(
+            queue_id, queue_location, queue_wait_timeout_message(max_wait)
+        )
 
     def get_queue_info(self, queue_id: int) -> QueueInfo:
         """Get queue info.
@@ -345,39 +390,10 @@ class JenkinsAPIClient:
         response = self._make_request("GET", api_url)
 
         if response.status_code == 404:
-            return {
-                "queue_id": queue_id,
-                "blocked": False,
-                "buildable": False,
-                "stuck": False,
-                "why": "Item not found",
-                "build_number": None,
-                "build_url": None,
-                "status": "NOT_FOUND",
-            }
+            return queue_item_not_found(queue_id)
 
         response.raise_for_status()
-        data = response.json()
-
-        result: QueueInfo = {
-            "queue_id": queue_id,
-            "blocked": data.get("blocked", False),
-            "buildable": data.get("buildable", False),
-            "stuck": data.get("stuck", False),
-            "why": data.get("why"),
-            "build_number": None,
-            "build_url": None,
-            "status": "QUEUED",
-        }
-
-        # Check if build has started
-        executable = data.get("executable")
-        if executable:
-            result["build_number"] = executable.get("number")
-            result["build_url"] = executable.get("url")
-            result["status"] = "BUILD_STARTED"
-
-        return result
+        return parse_queue_info(response.json(), queue_id)
 
     def get_build_status(self, job_full_name: str, build_number: int) -> BuildInfo:
         """Get build status.
@@ -396,7 +412,9 @@ class JenkinsAPIClient:
         job_url = self._build_job_url(job_full_name)
         api_url = f"{job_url}/{build_number}/api/json"
 
-        response = self._make_request("GET", api_url)
+        response = self._make_request(
+            "GET", api_url, params={"tree": BUILD_INFO_TREE}
+        )
 
         if response.status_code == 404:
             raise JenkinsBuildNotFoundError(
@@ -404,16 +422,7 @@ class JenkinsAPIClient:
             )
 
         response.raise_for_status()
-        data = response.json()
-
-        return {
-            "number": data.get("number", build_number),
-            "result": data.get("result"),
-            "building": data.get("building", False),
-            "url": data.get("url", ""),
-            "timestamp": data.get("timestamp", 0),
-            "duration": data.get("duration", 0),
-        }
+        return parse_build_info(response.json(), build_number)
 
     def stop_build(self, job_full_name: str, build_number: int) -> StopResult:
         """Stop build.
@@ -448,6 +457,10 @@ class JenkinsAPIClient:
     ) -> StopResult:
         """Handle permission error when stopping build.
 
+        Jenkins may refuse the request while the build stops anyway, so the
+        build is checked once; a build still running is reported as pending
+        rather than polled here, leaving confirmation to the caller.
+
         Args:
             job_full_name: Full job name
             build_number: Build number
@@ -455,21 +468,15 @@ class JenkinsAPIClient:
         Returns:
             Stop result
         """
-        # Loop to check build status, confirm if already terminated
-        for attempt in range(10):
-            try:
-                build_info = self.get_build_status(job_full_name, build_number)
-                if not build_info.get("building", True):
-                    return {"status": "ALREADY_TERMINATED", "url": None}
-            except (JenkinsBuildNotFoundError, JenkinsError):
-                # Build not found or query failed, consider as terminated
+        try:
+            build_info = self.get_build_status(job_full_name, build_number)
+            if not build_info.get("building", True):
                 return {"status": "ALREADY_TERMINATED", "url": None}
+        except (JenkinsBuildNotFoundError, JenkinsError):
+            # Build not found or query failed, consider as terminated
+            return {"status": "ALREADY_TERMINATED", "url": None}
 
-            if attempt < 9:
-                time.sleep(1)
-
-        # Still building after 10 checks, raise permission error
-        raise JenkinsPermissionError("stop build", f"{job_full_name}#{build_number}")
+        return {"status": "STOP_PENDING_CONFIRMATION", "url": None}
 
     def get_build_log(self, job_full_name: str, build_number: int) -> str:
         """Get build log.
@@ -498,70 +505,88 @@ class JenkinsAPIClient:
         response.raise_for_status()
         return response.text
 
-    def search_jobs(self, keyword: str) -> List[JobInfo]:
+    def search_jobs(
+        self, keyword: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[JobInfo]:
         """Search jobs.
 
+        Matches are built directly from the job tree response, so a search
+        costs a single request regardless of how many jobs match.
+
         Args:
             keyword: Search keyword
+            limit: Max number of jobs to return (None for all)
+            offset: Number of ranked matches to skip
 
         Returns:
-            List of matching jobs
+            List of matching jobs, best matches first
 
         Raises:
             JenkinsError: API request failed
         """
-        api_url = (
-            f"{self._client.base_url}/api/json?tree=jobs[name,url,fullName,"
-            "jobs[name,url,fullName,jobs[name,url,fullName,jobs[name,url,fullName]]]]"
-        )
+        return TrigramIndex(self.list_jobs()).search(keyword, limit, offset)
 
-        response = self._make_request("GET", api_url)
-        response.raise_for_status()
+    def list_jobs(self) -> List[JobInfo]:
+        """List every job and folder on the server.
 
-        data = response.json()
-        all_jobs = self._collect_all_jobs(data.get("jobs", []))
+        Returns:
+            List of job info
 
-        # Filter matching jobs
-        matching_jobs = []
-        for job in all_jobs:
-            if (
-                keyword.lower() in job["name"].lower()
-                or keyword.lower() in job.get("fullName", "").lower()
-            ):
-                job_info = self.get_job_info(job["fullName"])
-                matching_jobs.append(job_info)
+        Raises:
+            JenkinsError: API request failed
+        """
+        return list(self.iter_jobs())
+
+    def iter_jobs(self) -> Iterator[JobInfo]:
+        """Crawl every job and folder on the server, at any depth.
+
+        Page size and concurrency come from the ``job_index`` config section
+        (``crawl_page_size``, ``crawl_workers``).
 
-        return matching_jobs
+        Yields:
+            Job info, as folder pages arrive
 
-    def _collect_all_jobs(
-        self, jobs: List[Dict[str, Any]], parent: str = ""
-    ) -> List[Dict[str, Any]]:
-        """Recursively collect all jobs.
+        Raises:
+            JenkinsError: API request failed
+        """
+        index_config = get_config().get("job_index") or {}
+        crawler = JobTreeCrawler(
+            self,
+            page_size=int(index_config.get("crawl_page_size", DEFAULT_PAGE_SIZE)),
+            max_workers=int(index_config.get("crawl_workers", DEFAULT_MAX_WORKERS)),
+        )
+        return crawler.crawl()
+
+    def get_folder_jobs(
+        self, folder_full_name: str, start: int, end: int
+    ) -> List[Tuple[JobInfo, bool]]:
+        """Get one page of a folder's direct children.
 
         Args:
-            jobs: List of jobs
-            parent: Parent job path
+            folder_full_name: Full folder name ("" for the root)
+            start: Index of the first child (inclusive)
+            end: Index of the last child (exclusive)
 
         Returns:
-            Flattened job list
+            List of (job info, whether it is a non-empty folder) tuples
+
+        Raises:
+            JenkinsJobNotFoundError: Folder not found
+            JenkinsError: API request failed
         """
-        result = []
-        for job in jobs:
-            name = job.get("fullName") or (
-                f"{parent}/{job['name']}" if parent else job["name"]
-            )
-            result.append(
-                {
-                    "name": job["name"],
-                    "fullName": name,
-                    "url": job["url"],
-                }
-            )
+        if folder_full_name:
+            api_url = f"{self._build_job_url(folder_full_name)}/api/json"
+        else:
+            api_url = f"{self._client.base_url}/api/json"
+        tree = FOLDER_JOBS_TREE.format(fields=SEARCH_JOB_FIELDS, start=start, end=end)
+
+        response = self._make_request("GET", api_url, params={"tree": tree})
 
-            if "jobs" in job and job["jobs"]:
-                result.extend(self._collect_all_jobs(job["jobs"], name))
+        if response.status_code == 404 and folder_full_name:
+            raise JenkinsJobNotFoundError(folder_full_name, self.server_name)
 
-        return result
+        response.raise_for_status()
+        return parse_folder_jobs(response.json(), folder_full_name)
 
     def create_job(self, job_name: str, job_config: str, folder_path: str = "") -> dict:
         """Create a new Jenkins job.
@@ -603,6 +628,10 @@ class JenkinsAPIClient:
 
         response.raise_for_status()
 
+        # Drop anything cached while the job did not exist yet
+        job_full_name = f"{folder_path}/{job_name}" if folder_path else job_name
+        metadata_cache.invalidate_job(self.server_name, job_full_name)
+
         return {
             "status": "CREATED",
             "job_name": job_name,
@@ -632,22 +661,32 @@ class JenkinsAPIClient:
     def _folder_exists(self, folder_path: str) -> bool:
         """Check if a folder exists.
 
+        Existing folders are remembered for ``metadata_cache.folder_ttl`` seconds.
+
         Args:
             folder_path: Folder path to check
 
         Returns:
             True if folder exists, False otherwise
         """
+        cache_key = folder_key(self.server_name, folder_path)
+        if metadata_cache.get(cache_key):
+            return True
+
         try:
             folder_parts = folder_path.split("/")
             folder_url = "".join(f"/job/{part}" for part in folder_parts)
             api_url = f"{self._client.base_url}{folder_url}/api/json"
 
             response = self._make_request("GET", api_url)
-            return response.status_code == 200
         except Exception:
             return False
 
+        exists = response.status_code == 200
+        if exists:
+            metadata_cache.set(cache_key, True, metadata_cache.folder_ttl)
+        return exists
+
     def _create_folder(self, folder_path: str, folder_name: str) -> None:
         """Create a folder.
 
@@ -667,36 +706,14 @@ class JenkinsAPIClient:
         else:
             create_url = f"{self._client.base_url}/createItem"
 
-        # Folder configuration XML
-        folder_config = """<?xml version='1.1' encoding='UTF-8'?>
-<com.cloudbees.hudson.plugins.folder.Folder plugin="cloudbees-folder">
-  <actions/>
-  <description></description>
-  <properties/>
-  <folderViews class="com.cloudbees.hudson.plugins.folder.views.DefaultFolderViewHolder">
-    <views>
-      <hudson.model.AllView>
-        <owner class="com.cloudbees.hudson.plugins.folder.Folder" reference="../../../.."/>
-        <name>all</name>
-        <filterExecutors>false</filterExecutors>
-        <filterQueue>false</filterQueue>
-        <properties class="hudson.model.View$PropertyList"/>
-      </hudson.model.AllView>
-    </views>
-    <tabBar class="hudson.views.DefaultViewsTabBar"/>
-  </folderViews>
-  <healthMetrics/>
-  <icon class="com.cloudbees.hudson.plugins.folder.icons.StockFolderIcon"/>
-</com.cloudbees.hudson.plugins.folder.Folder>"""
-
         headers = {"Content-Type": "application/xml"}
         params = {
             "name": folder_name,
-            "mode": "com.cloudbees.hudson.plugins.folder.Folder",
+            "mode": FOLDER_MODE,
         }
 
         response = self._make_request(
-            "POST", create_url, params=params, data=folder_config, headers=headers
+            "POST", create_url, params=params, data=FOLDER_CONFIG_XML, headers=headers
         )
 
         if response.status_code == 400:
@@ -705,6 +722,11 @@ class JenkinsAPIClient:
                 raise JenkinsError(f"Failed to create folder '{folder_name}'")
         else:
             response.raise_for_status()
+            metadata_cache.set(
+                folder_key(self.server_name, folder_path),
+                True,
+                metadata_cache.folder_ttl,
+            )
 
     def update_job(self, job_name: str, job_config: str, folder_path: str = "") -> dict:
         """Update an existing Jenkins job.
@@ -753,6 +775,10 @@ class JenkinsAPIClient:
         else:
             response.raise_for_status()
 
+        # Job info and parameter definitions may have changed with the config
+        job_full_name = f"{folder_path}/{job_name}" if folder_path else job_name
+        metadata_cache.invalidate_job(self.server_name, job_full_name)
+
         return {
             "status": "UPDATED",
             "job_name": job_name,
@@ -0,0 +1,197 @@
+"""Breadth-first, paginated Jenkins job tree crawler."""
+
+import asyncio
+import logging
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import TYPE_CHECKING
+from typing import AsyncIterator
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Tuple
+
+from .exceptions import JenkinsJobNotFoundError
+from .types import JobInfo
+
+if TYPE_CHECKING:
+    from .async_client import AsyncJenkinsAPIClient
+    from .client import JenkinsAPIClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_MAX_WORKERS = 4
+
+
+class JobTreeCrawler:
+    """Walk every folder of a Jenkins controller, whatever its depth.
+
+    Folders are listed one page at a time with the ``{start,end}`` tree range
+    syntax, so no single response holds the whole controller. Independent
+    folders are fetched concurrently by a bounded thread pool and jobs are
+    yielded as soon as their page arrives; the next page of a folder is
+    requested once the previous one came back full.
+    """
+
+    def __init__(
+        self,
+        client: "JenkinsAPIClient",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize crawler.
+
+        Args:
+            client: Jenkins API client of the server to crawl
+            page_size: Number of jobs requested per folder page
+            max_workers: Max folders fetched concurrently
+        """
+        self.client = client
+        self.page_size = page_size
+        self.max_workers = max_workers
+
+    def crawl(self) -> Iterator[JobInfo]:
+        """Crawl the job tree breadth-first.
+
+        Yields:
+            Job info for every job and folder on the server
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="jenkins-crawl"
+        ) as executor:
+            pending: Dict[Future, Tuple[str, int]] = {}
+
+            def submit(folder_full_name: str, start: int) -> None:
+                future = executor.submit(self._list_page, folder_full_name, start)
+                pending[future] = (folder_full_name, start)
+
+            submit("", 0)
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        folder_full_name, start = pending.pop(future)
+                        page = future.result()
+                        if len(page) >= self.page_size:
+                            submit(folder_full_name, start + self.page_size)
+                        for job, is_folder in page:
+                            yield job
+                            if is_folder:
+                                submit(job["fullName"], 0)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _list_page(
+        self, folder_full_name: str, start: int
+    ) -> List[Tuple[JobInfo, bool]]:
+        """List one page of a folder's children.
+
+        Args:
+            folder_full_name: Full folder name ("" for the root)
+            start: Index of the first child
+
+        Returns:
+            List of (job info, whether it is a non-empty folder) tuples,
+            empty if the folder disappeared
+        """
+        try:
+            return self.client.get_folder_jobs(
+                folder_full_name, start, start + self.page_size
+            )
+        except JenkinsJobNotFoundError:
+            # Folder removed while crawling
+            logger.warning(f"Folder '{folder_full_name}' disappeared during crawl")
+            return []
+
+
+class AsyncJobTreeCrawler:
+    """Asyncio counterpart of ``JobTreeCrawler``.
+
+    Folder pages are listed by concurrent tasks on the running event loop; a
+    semaphore bounds how many are fetched at once.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncJenkinsAPIClient",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        """Initialize crawler.
+
+        Args:
+            client: Async Jenkins API client of the server to crawl
+            page_size: Number of jobs requested per folder page
+            max_workers: Max folders fetched concurrently
+        """
+        self.client = client
+        self.page_size = page_size
+        self.max_workers = max_workers
+
+    async def crawl(self) -> AsyncIterator[JobInfo]:
+        """Crawl the job tree breadth-first.
+
+        Yields:
+            Job info for every job and folder on the server
+
+        Raises:
+            JenkinsError: API request failed
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        pending: Dict[asyncio.Future, Tuple[str, int]] = {}
+
+        def submit(folder_full_name: str, start: int) -> None:
+            task = asyncio.ensure_future(
+                self._list_page(folder_full_name, start, semaphore)
+            )
+            pending[task] = (folder_full_name, start)
+
+        submit("", 0)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    folder_full_name, start = pending.pop(task)
+                    page = task.result()
+                    if len(page) >= self.page_size:
+                        submit(folder_full_name, start + self.page_size)
+                    for job, is_folder in page:
+                        yield job
+                        if is_folder:
+                            submit(job["fullName"], 0)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _list_page(
+        self, folder_full_name: str, start: int, semaphore: asyncio.Semaphore
+    ) -> List[Tuple[JobInfo, bool]]:
+        """List one page of a folder's children.
+
+        Args:
+            folder_full_name: Full folder name ("" for the root)
+            start: Index of the first child
+            semaphore: Bounds concurrently fetched pages
+
+        Returns:
+            List of (job info, whether it is a non-empty folder) tuples,
+            empty if the folder disappeared
+        """
+        async with semaphore:
+            try:
+                return await self.client.get_folder_jobs(
+                    folder_full_name, start, start + self.page_size
+                )
+            except JenkinsJobNotFoundError:
+                # Folder removed while crawling
+                logger.warning(f"Folder '{folder_full_name}' disappeared during crawl")
+                return []
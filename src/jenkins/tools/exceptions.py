@@ -82,6 +82,25 @@ class JenkinsPermissionError(JenkinsError):
         self.resource = resource
 
 
+class JenkinsServerBusyError(JenkinsError):
+    """Exception for a Jenkins server with too much blocking work queued."""
+
+    def __init__(self, server_name: str, pending: int) -> None:
+        """Initialize server busy exception.
+
+        Args:
+            server_name: Server name
+            pending: Calls already running or queued for the server
+        """
+        super().__init__(
+            f"Jenkins server '{server_name}' is busy ({pending} calls pending), "
+            "retry later",
+            status_code=503,
+        )
+        self.server_name = server_name
+        self.pending = pending
+
+
 class JenkinsConfigurationError(JenkinsError):
     """Exception for Jenkins configuration error."""
 
@@ -0,0 +1,159 @@
+"""Bounded per-server thread pools for blocking work of async tools."""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import TypeVar
+
+from ..config import get_config
+from .exceptions import JenkinsServerBusyError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_QUEUE = 32
+
+
+class _ServerExecutor:
+    """A server's thread pool and its counters."""
+
+    def __init__(self, server_name: str, workers: int) -> None:
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"jenkins-{server_name}"
+        )
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+
+class ServerExecutorPool:
+    """Thread pools, one per Jenkins server, for blocking work of async tools.
+
+    Tools run on FastMCP's event loop, so blocking work (inflating cached
+    logs, scanning them, crawling the job index) is handed to the server's
+    pool instead of freezing every other session. Each pool has ``workers``
+    threads and accepts at most ``max_queue`` further calls; beyond that,
+    calls fail at once with ``JenkinsServerBusyError`` rather than piling up
+    behind a slow server.
+    """
+
+    def __init__(
+        self, workers: Optional[int] = None, max_queue: Optional[int] = None
+    ) -> None:
+        """Initialize executor pool.
+
+        Args:
+            workers: Threads per server (defaults to config)
+            max_queue: Calls waiting for a thread per server (defaults to config)
+        """
+        self._workers = workers
+        self._max_queue = max_queue
+        self._executors: Dict[str, _ServerExecutor] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _config() -> Dict[str, Any]:
+        """Get the ``executor_pool`` config section."""
+        return get_config().get("executor_pool") or {}
+
+    @property
+    def workers(self) -> int:
+        """Threads per server."""
+        if self._workers is not None:
+            return self._workers
+        return max(int(self._config().get("workers", DEFAULT_WORKERS)), 1)
+
+    @property
+    def max_queue(self) -> int:
+        """Calls allowed to wait for a thread, per server."""
+        if self._max_queue is not None:
+            return self._max_queue
+        return max(int(self._config().get("max_queue", DEFAULT_MAX_QUEUE)), 0)
+
+    async def run(
+        self, server_name: str, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking call on the server's thread pool.
+
+        Cancelling the caller does not interrupt the call; its slot is freed
+        when it returns.
+
+        Args:
+            server_name: Jenkins server name
+            fn: Blocking function
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            JenkinsServerBusyError: The server's pool and queue are full
+        """
+        with self._lock:
+            server = self._get(server_name)
+            if server.pending >= server.workers + self.max_queue:
+                server.rejected += 1
+                raise JenkinsServerBusyError(server_name, server.pending)
+            server.pending += 1
+            future = server.executor.submit(functools.partial(fn, *args, **kwargs))
+        future.add_done_callback(lambda _: self._release(server))
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get executor pool statistics.
+
+        Returns:
+            Dict with per-server threads, pending calls and counters
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "servers": {
+                    server_name: {
+                        "workers": server.workers,
+                        "pending": server.pending,
+                        "completed": server.completed,
+                        "rejected": server.rejected,
+                    }
+                    for server_name, server in self._executors.items()
+                },
+            }
+
+    def shutdown(self) -> None:
+        """Stop all pools, dropping calls that have not started."""
+        with self._lock:
+            executors = list(self._executors.values())
+            self._executors.clear()
+        for server in executors:
+            server.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get(self, server_name: str) -> _ServerExecutor:
+        """Get (or create) a server's pool; the caller holds the lock."""
+        server = self._executors.get(server_name)
+        if server is None:
+            server = self._executors[server_name] = _ServerExecutor(
+                server_name, self.workers
+            )
+        return server
+
+    def _release(self, server: _ServerExecutor) -> None:
+        """Free the slot of a finished call."""
+        with self._lock:
+            server.pending -= 1
+            server.completed += 1
+
+
+# Global executor pool shared by all tools
+executor_pool = ServerExecutorPool()
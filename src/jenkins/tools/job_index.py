@@ -0,0 +1,422 @@
+"""Persistent per-server job index backed by SQLite."""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from ..config import get_cache_dir
+from ..config import get_config
+from .search_index import TrigramIndex
+from .types import JobInfo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 300
+# Rows written per transaction while a crawl streams in
+WRITE_BATCH_SIZE = 500
+# Bump when the table layout changes; the cache is rebuilt from scratch
+SCHEMA_VERSION = 2
+
+JobCrawler = Callable[[], Iterable[JobInfo]]
+
+_SCHEMA = """
+DROP TABLE IF EXISTS jobs;
+DROP TABLE IF EXISTS servers;
+CREATE TABLE jobs (
+    server TEXT NOT NULL,
+    full_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    description TEXT,
+    buildable INTEGER NOT NULL,
+    color TEXT NOT NULL,
+    is_parameterized INTEGER NOT NULL,
+    last_build_number INTEGER,
+    last_build_url TEXT,
+    PRIMARY KEY (server, full_name)
+);
+CREATE TABLE servers (
+    server TEXT PRIMARY KEY,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+_JOB_COLUMNS = (
+    "full_name",
+    "name",
+    "url",
+    "description",
+    "buildable",
+    "color",
+    "is_parameterized",
+    "last_build_number",
+    "last_build_url",
+)
+
+
+def _job_to_row(job: JobInfo) -> tuple:
+    """Convert job info to a jobs table row (without the server column)."""
+    return (
+        job["fullName"],
+        job["name"],
+        job["url"],
+        job["description"],
+        int(job["buildable"]),
+        job["color"],
+        int(job["is_parameterized"]),
+        job["last_build_number"],
+        job["last_build_url"],
+    )
+
+
+def _row_to_job(row: tuple) -> JobInfo:
+    """Convert a jobs table row (without the server column) to job info."""
+    return {
+        "name": row[1],
+        "fullName": row[0],
+        "url": row[2],
+        "description": row[3],
+        "buildable": bool(row[4]),
+        "color": row[5],
+        "is_parameterized": bool(row[6]),
+        "last_build_number": row[7],
+        "last_build_url": row[8],
+    }
+
+
+@dataclass
+class _ServerJobs:
+    """In-memory view of one server's indexed jobs."""
+
+    jobs: Dict[str, JobInfo] = field(default_factory=dict)
+    search_index: TrigramIndex = field(default_factory=lambda: TrigramIndex(()))
+    refreshed_at: float = 0.0
+    # Set while a crawl of the server runs; signalled when it ends
+    refreshing: Optional[threading.Event] = None
+    stale: bool = False
+
+
+class JobIndex:
+    """Per-server job catalog, crawled once and refreshed in the background.
+
+    Jobs are kept in memory for lookups and persisted to SQLite under the
+    cache directory, so the catalog survives restarts. A server that was never
+    indexed is crawled synchronously on first search (single-job lookups may
+    instead start the crawl in the background); afterwards, lookups older
+    than ``refresh_interval`` seconds are answered from the index while a
+    background thread re-crawls and applies only the changed rows.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        refresh_interval: Optional[float] = None,
+    ) -> None:
+        """Initialize job index.
+
+        Args:
+            path: SQLite file path (defaults to ``<cache_dir>/jobs.sqlite3``)
+            refresh_interval: Seconds before an index is refreshed (defaults to config)
+        """
+        self._path = path
+        self._refresh_interval = refresh_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._servers: Dict[str, _ServerJobs] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether tools should answer job lookups from the index."""
+        index_config = get_config().get("job_index") or {}
+        return bool(index_config.get("enabled", True))
+
+    @property
+    def refresh_interval(self) -> float:
+        """Seconds after which a server's index is considered stale."""
+        if self._refresh_interval is not None:
+            return self._refresh_interval
+        index_config = get_config().get("job_index") or {}
+        return float(index_config.get("refresh_interval", DEFAULT_REFRESH_INTERVAL))
+
+    def search(
+        self,
+        server_name: str,
+        keyword: str,
+        crawl: JobCrawler,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[JobInfo]:
+        """Search indexed jobs by name or full name.
+
+        Args:
+            server_name: Jenkins server name
+            keyword: Search keyword (case-insensitive substring)
+            crawl: Callable returning every job of the server
+            limit: Max number of jobs to return (None for all)
+            offset: Number of ranked matches to skip
+
+        Returns:
+            List of matching jobs, best matches first (exact name, name
+            prefix, path segment, substring)
+        """
+        search_index = self._ensure_fresh(server_name, crawl).search_index
+        return [dict(job) for job in search_index.search(keyword, limit, offset)]
+
+    def get_job(
+        self,
+        server_name: str,
+        job_full_name: str,
+        crawl: JobCrawler,
+        wait: bool = True,
+    ) -> Optional[JobInfo]:
+        """Look up one job by full name.
+
+        Args:
+            server_name: Jenkins server name
+            job_full_name: Full job name
+            crawl: Callable returning every job of the server
+            wait: Crawl a never-indexed server before answering; if False, the
+                crawl starts in the background and the lookup returns None
+
+        Returns:
+            Job info copy, or None if the job is not indexed
+        """
+        entry = self._ensure_fresh(server_name, crawl, wait)
+        job = entry.jobs.get(job_full_name)
+        return dict(job) if job is not None else None
+
+    def refresh(self, server_name: str, crawl: JobCrawler) -> int:
+        """Re-crawl a server and apply the differences to the index.
+
+        Crawled jobs are streamed to SQLite in batches as they arrive; the
+        in-memory view is swapped in once the crawl completes.
+
+        Args:
+            server_name: Jenkins server name
+            crawl: Callable returning every job of the server
+
+        Returns:
+            Number of inserted, updated or deleted jobs
+        """
+        with self._lock:
+            old_rows = {
+                full_name: _job_to_row(job)
+                for full_name, job in self._load(server_name).jobs.items()
+            }
+
+        crawled: Dict[str, JobInfo] = {}
+        batch: List[tuple] = []
+        changed = 0
+        for job in crawl():
+            crawled[job["fullName"]] = job
+            row = _job_to_row(job)
+            if old_rows.get(job["fullName"]) != row:
+                batch.append(row)
+            if len(batch) >= WRITE_BATCH_SIZE:
+                self._write_rows(server_name, batch)
+                changed += len(batch)
+                batch = []
+        self._write_rows(server_name, batch)
+        changed += len(batch)
+
+        jobs = {name: crawled[name] for name in sorted(crawled)}
+        search_index = TrigramIndex(jobs.values())
+        removed = [name for name in old_rows if name not in crawled]
+        refreshed_at = time.time()
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "DELETE FROM jobs WHERE server = ? AND full_name = ?",
+                    [(server_name, name) for name in removed],
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO servers (server, refreshed_at) VALUES (?, ?)",
+                    (server_name, refreshed_at),
+                )
+
+            entry = self._load(server_name)
+            entry.jobs = jobs
+            entry.search_index = search_index
+            entry.refreshed_at = refreshed_at
+            entry.stale = False
+
+        logger.info(
+            f"Refreshed job index for '{server_name}': {len(jobs)} jobs, "
+            f"{changed} changed, {len(removed)} removed"
+        )
+        return changed + len(removed)
+
+    def _write_rows(self, server_name: str, rows: List[tuple]) -> None:
+        """Insert or update job rows in one transaction.
+
+        Args:
+            server_name: Jenkins server name
+            rows: Rows without the server column
+        """
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO jobs (server, {', '.join(_JOB_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * (len(_JOB_COLUMNS) + 1))})",
+                    [(server_name, *row) for row in rows],
+                )
+
+    def mark_stale(self, server_name: str) -> None:
+        """Force a background refresh on the next lookup for a server.
+
+        Args:
+            server_name: Jenkins server name
+        """
+        with self._lock:
+            entry = self._servers.get(server_name)
+            if entry is not None:
+                entry.stale = True
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._servers.clear()
+
+    def _ensure_fresh(
+        self, server_name: str, crawl: JobCrawler, wait: bool = True
+    ) -> _ServerJobs:
+        """Get a server's jobs, crawling or scheduling a refresh when needed.
+
+        Args:
+            server_name: Jenkins server name
+            crawl: Callable returning every job of the server
+            wait: Crawl a never-indexed server synchronously, or wait for the
+                crawl already running (otherwise the crawl runs in the
+                background and the entry is still empty)
+
+        Returns:
+            In-memory server entry
+        """
+        while True:
+            with self._lock:
+                entry = self._load(server_name)
+                indexed = bool(entry.refreshed_at)
+                stale = (
+                    not indexed
+                    or entry.stale
+                    or time.time() - entry.refreshed_at >= self.refresh_interval
+                )
+                crawling = entry.refreshing
+                if stale and crawling is None:
+                    done = entry.refreshing = threading.Event()
+
+            if crawling is not None:
+                if indexed or not wait:
+                    return entry
+                # Never indexed and already being crawled: wait for that
+                # crawl instead of starting another one, then check again in
+                # case it failed
+                crawling.wait()
+                continue
+
+            if not stale:
+                return entry
+            if not indexed and wait:
+                # Never indexed: crawl synchronously so the first answer is
+                # complete
+                self._tracked_refresh(server_name, crawl, done)
+                return entry
+            threading.Thread(
+                target=self._background_refresh,
+                args=(server_name, crawl, done),
+                name=f"job-index-refresh-{server_name}",
+                daemon=True,
+            ).start()
+            return entry
+
+    def _tracked_refresh(
+        self, server_name: str, crawl: JobCrawler, done: threading.Event
+    ) -> None:
+        """Refresh a server's index, then wake the callers waiting on it.
+
+        Args:
+            server_name: Jenkins server name
+            crawl: Callable returning every job of the server
+            done: The entry's ``refreshing`` event, set once the crawl ends
+        """
+        try:
+            self.refresh(server_name, crawl)
+        finally:
+            with self._lock:
+                entry = self._servers.get(server_name)
+                if entry is not None and entry.refreshing is done:
+                    entry.refreshing = None
+            done.set()
+
+    def _background_refresh(
+        self, server_name: str, crawl: JobCrawler, done: threading.Event
+    ) -> None:
+        """Refresh a server's index from a background thread."""
+        try:
+            self._tracked_refresh(server_name, crawl, done)
+        except Exception as e:
+            logger.warning(
+                f"Background job index refresh for '{server_name}' failed: {e}"
+            )
+
+    def _load(self, server_name: str) -> _ServerJobs:
+        """Get a server's in-memory entry, loading it from SQLite on first use.
+
+        Must be called with the lock held.
+        """
+        entry = self._servers.get(server_name)
+        if entry is not None:
+            return entry
+
+        entry = _ServerJobs()
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT refreshed_at FROM servers WHERE server = ?", (server_name,)
+        ).fetchone()
+        if row is not None:
+            entry.refreshed_at = row[0]
+            cursor = conn.execute(
+                f"SELECT {', '.join(_JOB_COLUMNS)} FROM jobs "
+                "WHERE server = ? ORDER BY full_name",
+                (server_name,),
+            )
+            entry.jobs = {job["fullName"]: job for job in map(_row_to_job, cursor)}
+            entry.search_index = TrigramIndex(entry.jobs.values())
+        self._servers[server_name] = entry
+        return entry
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite database on first use.
+
+        Must be called with the lock held.
+        """
+        if self._conn is None:
+            path = Path(self._path) if self._path else get_cache_dir() / "jobs.sqlite3"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self._conn.executescript(_SCHEMA)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return self._conn
+
+
+# Global job index shared by all tools
+job_index = JobIndex()
@@ -0,0 +1,406 @@
+"""On-disk cache of completed build logs."""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+import zlib
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from ..config import get_cache_dir
+from ..config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Logs are compressed in independent blocks, so a range read only inflates
+# the blocks it overlaps
+BLOCK_SIZE = 256 * 1024
+COMPRESSION_LEVEL = 6
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_LOG_BYTES = 64 * 1024 * 1024
+
+_DATA_SUFFIX = ".log.z"
+_INDEX_SUFFIX = ".json"
+
+
+def log_key(server_name: str, job_full_name: str, build_number: int) -> str:
+    """Build the file name stem of a cached log.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+
+    Returns:
+        Hex digest identifying the log
+    """
+    identity = f"{server_name}\0{job_full_name}\0{build_number}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class CachedLog:
+    """Read-only view of a cached log.
+
+    The compressed file is memory-mapped; reads inflate only the blocks that
+    overlap the requested range. Close the log (or use it as a context
+    manager) to release the mapping.
+    """
+
+    def __init__(self, data_path: Path, size: int, offsets: List[int]) -> None:
+        """Open a cached log.
+
+        Args:
+            data_path: Compressed log file
+            size: Uncompressed log size
+            offsets: Start of each compressed block, plus the end of the last
+        """
+        self.size = size
+        self._offsets = offsets
+        self._file = open(data_path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        if offsets[-1] > 0:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def read(self, start: int, length: int) -> bytes:
+        """Read a byte range of the uncompressed log.
+
+        Args:
+            start: Byte offset
+            length: Max bytes to read
+
+        Returns:
+            Bytes from ``start`` (fewer at the end of the log)
+        """
+        end = min(start + length, self.size)
+        if start >= end:
+            return b""
+        first = start // BLOCK_SIZE
+        last = (end - 1) // BLOCK_SIZE
+        data = b"".join(self._block(index) for index in range(first, last + 1))
+        skip = start - first * BLOCK_SIZE
+        return data[skip : skip + end - start]
+
+    def iter_blocks(self, start: int = 0) -> Iterator[bytes]:
+        """Iterate over the uncompressed log.
+
+        Args:
+            start: Byte offset to start from
+
+        Yields:
+            Consecutive log bytes, up to ``BLOCK_SIZE`` at a time
+        """
+        for index in range(start // BLOCK_SIZE, len(self._offsets) - 1):
+            block = self._block(index)
+            if index == start // BLOCK_SIZE:
+                block = block[start - index * BLOCK_SIZE :]
+            yield block
+
+    def close(self) -> None:
+        """Release the memory mapping."""
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "CachedLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _block(self, index: int) -> bytes:
+        """Inflate one block."""
+        assert self._map is not None
+        begin, end = self._offsets[index], self._offsets[index + 1]
+        return zlib.decompress(self._map[begin:end])
+
+
+class LogCacheWriter:
+    """Compress a log into the cache as it is read.
+
+    ``write`` only buffers; ``flush`` and ``commit`` do the blocking work
+    (compression, file I/O, eviction), so async callers run those two on a
+    worker thread once ``pending`` reaches ``BLOCK_SIZE``. Nothing is visible
+    to readers until ``commit``; ``abort`` (or a failed download) leaves no
+    trace.
+    """
+
+    def __init__(self, cache: "LogCache", key: str) -> None:
+        """Initialize writer.
+
+        Args:
+            cache: Owning cache
+            key: Cached log key
+        """
+        self._cache = cache
+        self._key = key
+        self._buffer = bytearray()
+        self._offsets = [0]
+        self._size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=cache.directory, suffix=".tmp")
+        self._tmp_path = Path(tmp_path)
+        self._file: Optional[Any] = os.fdopen(fd, "wb")
+        # Guards the file against an abort racing a flush on a worker thread
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Log bytes written so far."""
+        return self._size
+
+    @property
+    def pending(self) -> int:
+        """Bytes buffered but not compressed yet."""
+        return len(self._buffer)
+
+    def write(self, data: bytes) -> None:
+        """Append log bytes to the buffer.
+
+        Args:
+            data: Next log bytes
+        """
+        self._size += len(data)
+        self._buffer += data
+
+    def flush(self) -> None:
+        """Compress and write every full block buffered so far."""
+        with self._lock:
+            if self._file is None:
+                return
+            full = len(self._buffer) - len(self._buffer) % BLOCK_SIZE
+            for begin in range(0, full, BLOCK_SIZE):
+                self._flush_block(bytes(self._buffer[begin : begin + BLOCK_SIZE]))
+            del self._buffer[:full]
+
+    def commit(self) -> None:
+        """Publish the log, then evict old logs beyond the size limit."""
+        self.flush()
+        with self._lock:
+            assert self._file is not None
+            if self._buffer:
+                self._flush_block(bytes(self._buffer))
+                self._buffer.clear()
+            self._file.close()
+            self._file = None
+
+        data_path, index_path = self._cache._paths(self._key)
+        os.replace(self._tmp_path, data_path)
+        # The index is written last: a log without one is ignored
+        index = {"size": self._size, "offsets": self._offsets}
+        fd, tmp_index = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as index_file:
+            json.dump(index, index_file)
+        os.replace(tmp_index, index_path)
+        self._cache._evict()
+
+    def abort(self) -> None:
+        """Discard the partially written log (no-op after ``commit``)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._tmp_path.unlink(missing_ok=True)
+
+    def _flush_block(self, block: bytes) -> None:
+        """Compress and write one block."""
+        assert self._file is not None
+        compressed = zlib.compress(block, COMPRESSION_LEVEL)
+        self._file.write(compressed)
+        self._offsets.append(self._offsets[-1] + len(compressed))
+
+
+class LogCache:
+    """Size-bounded on-disk cache of completed build logs.
+
+    Logs of finished builds never change, so the first read that streams a
+    whole log compresses it under ``<cache_dir>/logs`` on the way, and later
+    reads are served from there.
+    When the cache exceeds ``max_bytes`` on disk, least recently read logs
+    are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_log_bytes: Optional[int] = None,
+        enabled: Optional[bool] = None,
+    ) -> None:
+        """Initialize log cache.
+
+        Args:
+            directory: Cache directory (defaults to ``<cache_dir>/logs``)
+            max_bytes: Max compressed size on disk (defaults to config)
+            max_log_bytes: Largest log worth caching (defaults to config)
+            enabled: Whether caching is on (defaults to config)
+        """
+        self._enabled = enabled
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._max_log_bytes = max_log_bytes
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _config() -> Dict[str, Any]:
+        """Get the ``log_cache`` config section."""
+        return get_config().get("log_cache") or {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether clients should cache completed logs."""
+        if self._enabled is not None:
+            return self._enabled
+        return bool(self._config().get("enabled", True))
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding cached logs (created on demand)."""
+        directory = (
+            Path(self._directory) if self._directory else get_cache_dir() / "logs"
+        )
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory
+
+    @property
+    def max_bytes(self) -> int:
+        """Max compressed size of the cache on disk."""
+        if self._max_bytes is not None:
+            return self._max_bytes
+        return int(self._config().get("max_bytes", DEFAULT_MAX_BYTES))
+
+    @property
+    def max_log_bytes(self) -> int:
+        """Uncompressed size above which a log is not cached."""
+        if self._max_log_bytes is not None:
+            return self._max_log_bytes
+        return int(self._config().get("max_log_bytes", DEFAULT_MAX_LOG_BYTES))
+
+    def open(
+        self, server_name: str, job_full_name: str, build_number: int
+    ) -> Optional[CachedLog]:
+        """Open a cached log.
+
+        Args:
+            server_name: Jenkins server name
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Cached log, or None if the log is not cached
+        """
+        data_path, index_path = self._paths(
+            log_key(server_name, job_full_name, build_number)
+        )
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            cached = CachedLog(data_path, index["size"], index["offsets"])
+            # The index file's mtime records the last read, for LRU eviction
+            os.utime(index_path)
+        except (OSError, ValueError, KeyError) as e:
+            if index_path.exists():
+                logger.warning(f"Dropping unreadable cached log {index_path}: {e}")
+                self._remove(index_path)
+            with self._lock:
+                self._misses += 1
+            return None
+
+        with self._lock:
+            self._hits += 1
+        return cached
+
+    def writer(
+        self, server_name: str, job_full_name: str, build_number: int
+    ) -> LogCacheWriter:
+        """Start caching a log.
+
+        Args:
+            server_name: Jenkins server name
+            job_full_name: Full job name
+            build_number: Build number
+
+        Returns:
+            Writer to feed the log to, then commit or abort
+        """
+        return LogCacheWriter(self, log_key(server_name, job_full_name, build_number))
+
+    def clear(self) -> None:
+        """Delete every cached log."""
+        for index_path in self.directory.glob(f"*{_INDEX_SUFFIX}"):
+            self._remove(index_path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with size, limits and hit/miss/eviction counters
+        """
+        entries = self._entries()
+        with self._lock:
+            return {
+                "logs": len(entries),
+                "bytes": sum(size for _, _, size in entries),
+                "max_bytes": self.max_bytes,
+                "max_log_bytes": self.max_log_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def _paths(self, key: str) -> Tuple[Path, Path]:
+        """Get the (data, index) paths of a cached log."""
+        directory = self.directory
+        return directory / f"{key}{_DATA_SUFFIX}", directory / f"{key}{_INDEX_SUFFIX}"
+
+    def _entries(self) -> List[Tuple[float, Path, int]]:
+        """List cached logs as (last read time, index path, size on disk)."""
+        entries = []
+        for index_path in self.directory.glob(f"*{_INDEX_SUFFIX}"):
+            data_path = index_path.with_name(
+                index_path.name[: -len(_INDEX_SUFFIX)] + _DATA_SUFFIX
+            )
+            try:
+                stat = index_path.stat()
+                size = stat.st_size + data_path.stat().st_size
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, index_path, size))
+        return entries
+
+    def _evict(self) -> None:
+        """Delete least recently read logs until the cache fits ``max_bytes``."""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        max_bytes = self.max_bytes
+        for _, index_path, size in entries:
+            if total <= max_bytes:
+                break
+            self._remove(index_path)
+            total -= size
+            with self._lock:
+                self._evictions += 1
+
+    def _remove(self, index_path: Path) -> None:
+        """Delete a cached log, index first so readers never see half of it."""
+        data_path = index_path.with_name(
+            index_path.name[: -len(_INDEX_SUFFIX)] + _DATA_SUFFIX
+        )
+        for path in (index_path, data_path):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning(f"Failed to delete cached log {path}: {e}")
+
+
+# Global log cache shared by all Jenkins API clients
+log_cache = LogCache()
@@ -0,0 +1,195 @@
+"""Incremental line scanning and regex search over streamed build logs."""
+
+import codecs
+import re
+from abc import ABC
+from abc import abstractmethod
+from collections import deque
+from typing import Deque
+from typing import Iterable
+from typing import List
+
+from .exceptions import JenkinsParameterError
+from .types import LogMatch
+from .types import LogSearchResult
+
+DEFAULT_CONTEXT_LINES = 2
+DEFAULT_MAX_MATCHES = 50
+# Longer lines are truncated, so one huge line cannot exhaust memory
+MAX_LINE_CHARS = 4096
+
+
+class LineScanner(ABC):
+    """Split a build log fed chunk by chunk into lines.
+
+    Lines split across chunks (including multi-byte characters) are
+    reassembled before ``_scan`` sees them; only the current partial line is
+    buffered, and lines longer than ``MAX_LINE_CHARS`` are truncated.
+    """
+
+    def __init__(self) -> None:
+        """Initialize line scanner."""
+        self.lines_scanned = 0
+        self.bytes_scanned = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self._partial = ""
+        self._skipping = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the rest of the log is not needed."""
+        return False
+
+    def feed(self, data: bytes) -> None:
+        """Scan the next chunk of the log.
+
+        Args:
+            data: Raw log bytes following the previous chunk
+        """
+        self.bytes_scanned += len(data)
+        text = self._decoder.decode(data)
+
+        if self._skipping:
+            # Drop the rest of an over-long line up to its line break
+            line_end = text.find("\n")
+            if line_end < 0:
+                return
+            text = text[line_end:]
+            self._skipping = False
+
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._next_line(line)
+
+        if len(self._partial) > MAX_LINE_CHARS:
+            self._partial = self._partial[:MAX_LINE_CHARS]
+            self._skipping = True
+
+    def finish(self) -> None:
+        """Scan the last line, once the whole log was fed."""
+        last_line = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        if last_line:
+            self._next_line(last_line)
+
+    def consume(self, blocks: Iterable[bytes]) -> bool:
+        """Scan a whole log, stopping early once ``done``.
+
+        Args:
+            blocks: Consecutive log bytes
+
+        Returns:
+            Whether the whole log was scanned
+        """
+        for block in blocks:
+            self.feed(block)
+            if self.done:
+                return False
+        self.finish()
+        return True
+
+    def _next_line(self, line: str) -> None:
+        """Count and scan one complete line."""
+        if self.done:
+            return
+        self.lines_scanned += 1
+        self._scan(line.rstrip("\r")[:MAX_LINE_CHARS])
+
+    @abstractmethod
+    def _scan(self, line: str) -> None:
+        """Process one complete line (``lines_scanned`` is its number)."""
+
+
+class LogSearcher(LineScanner):
+    """Grep a build log fed chunk by chunk.
+
+    Only the current partial line, ``context_lines`` previous lines and the
+    matches found so far are held, whatever the size of the log.
+    """
+
+    def __init__(
+        self,
+        pattern: str,
+        context_lines: int = DEFAULT_CONTEXT_LINES,
+        max_matches: int = DEFAULT_MAX_MATCHES,
+    ) -> None:
+        """Initialize log searcher.
+
+        Args:
+            pattern: Regular expression matched against each line
+            context_lines: Lines of context kept before and after each match
+            max_matches: Stop collecting after this many matches
+
+        Raises:
+            JenkinsParameterError: Invalid pattern
+        """
+        super().__init__()
+        try:
+            self._regex = re.compile(pattern)
+        except re.error as e:
+            raise JenkinsParameterError(f"Invalid pattern '{pattern}': {e}") from e
+
+        self.context_lines = max(context_lines, 0)
+        self.max_matches = max_matches
+        self.matches: List[LogMatch] = []
+        self._before: Deque[str] = deque(maxlen=self.context_lines)
+        self._open: List[LogMatch] = []
+
+    @property
+    def done(self) -> bool:
+        """Whether all matches and their trailing context were collected."""
+        return len(self.matches) >= self.max_matches and not self._open
+
+    def search(self, blocks: Iterable[bytes]) -> LogSearchResult:
+        """Search a whole log, stopping early once all matches are collected.
+
+        Args:
+            blocks: Consecutive log bytes
+
+        Returns:
+            Matches with line numbers and context
+        """
+        return self.result(self.consume(blocks))
+
+    def result(self, complete: bool) -> LogSearchResult:
+        """Finish the search.
+
+        Args:
+            complete: Whether the whole log was fed
+
+        Returns:
+            Matches with line numbers and context
+        """
+        if complete:
+            self.finish()
+
+        return {
+            "matches": self.matches,
+            "truncated": not complete,
+            "lines_scanned": self.lines_scanned,
+            "bytes_scanned": self.bytes_scanned,
+        }
+
+    def _scan(self, line: str) -> None:
+        """Match one line and update context."""
+        for match in self._open:
+            match["context_after"].append(line)
+        self._open = [
+            match
+            for match in self._open
+            if len(match["context_after"]) < self.context_lines
+        ]
+
+        if len(self.matches) < self.max_matches and self._regex.search(line):
+            match: LogMatch = {
+                "line_number": self.lines_scanned,
+                "line": line,
+                "context_before": list(self._before),
+                "context_after": [],
+            }
+            self.matches.append(match)
+            if self.context_lines:
+                self._open.append(match)
+
+        self._before.append(line)
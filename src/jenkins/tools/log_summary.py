@@ -0,0 +1,238 @@
+"""Failure excerpt extraction from streamed build logs."""
+
+import re
+from collections import deque
+from typing import Deque
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from .log_search import LineScanner
+from .types import FailureSummary
+from .types import LogExcerpt
+
+DEFAULT_SUMMARY_CONTEXT_LINES = 3
+DEFAULT_MAX_EXCERPTS = 5
+DEFAULT_SUMMARY_MAX_BYTES = 8 * 1024
+# An excerpt is closed after this many lines, so one huge stack trace cannot
+# take the whole budget
+MAX_EXCERPT_LINES = 60
+MAX_STAGES = 100
+
+# A Maven/Gradle build or a shell step failed
+_BUILD_FAILURE = r"\bBUILD (?:FAILURE|FAILED)\b|script returned exit code [1-9]"
+
+# All markers are alternatives of one regex, so each line is matched once;
+# the name of the group that matched tells what the line is
+_MARKERS = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern})"
+        for name, pattern in (
+            ("stage", r"^\[Pipeline\] \{ \((?P<stage_name>.+)\)$"),
+            ("finished", r"^Finished: (?P<result>[A-Z_]+)$"),
+            ("build_failure", _BUILD_FAILURE),
+            ("traceback", r"^Traceback \(most recent call last\):"),
+            (
+                "exception",
+                r"^\s*(?:Caused by: )?(?:[A-Za-z_$][\w$]*\.)*"
+                r"(?:[A-Z][\w$]*)?(?:Exception|Error)\b(?::|$)",
+            ),
+            ("error", r"(?:^|[\s\[\]])(?:ERROR|FATAL)\b|\berror:|\bnpm ERR!"),
+            (
+                "frame",
+                r"^\s+(?:at [\w$.<>/]+\(|File \".*\", line \d+|\.\.\. \d+ more)",
+            ),
+        )
+    )
+)
+_FAILURE_KINDS = {"build_failure", "traceback", "exception", "error"}
+# Matched on its own too: "ERROR: script returned exit code 1" is an error
+# line for the excerpt, but also tells which stage failed
+_BUILD_FAILURE_MARKER = re.compile(_BUILD_FAILURE)
+
+
+class FailureSummarizer(LineScanner):
+    """Extract the failure-relevant regions of a build log fed chunk by chunk.
+
+    Lines hitting a failure marker (error lines, exceptions, tracebacks,
+    ``BUILD FAILURE``, failed shell steps) open an excerpt with
+    ``context_lines`` lines before and after; stack frames extend it. The
+    first excerpt and the last ``max_excerpts - 1`` ones are kept, which
+    covers both the first error and the final failure whatever the log size.
+    The failed stage is the stage of the last ``BUILD FAILURE`` or failed
+    shell step marker (else of the last error), not of the first error, which
+    may have been tolerated.
+    """
+
+    def __init__(
+        self,
+        context_lines: int = DEFAULT_SUMMARY_CONTEXT_LINES,
+        max_excerpts: int = DEFAULT_MAX_EXCERPTS,
+        max_bytes: int = DEFAULT_SUMMARY_MAX_BYTES,
+    ) -> None:
+        """Initialize failure summarizer.
+
+        Args:
+            context_lines: Lines kept before and after failure markers
+            max_excerpts: Max excerpts returned
+            max_bytes: Max total size of excerpt text
+        """
+        super().__init__()
+        self.context_lines = max(context_lines, 0)
+        self.max_excerpts = max(max_excerpts, 1)
+        self.max_bytes = max_bytes
+        self.stages: List[str] = []
+        self.result_status: Optional[str] = None
+        self.omitted_excerpts = 0
+        self.failed_stage: Optional[str] = None
+        self._stage: Optional[str] = None
+        self._build_failed = False
+        self._first: Optional[LogExcerpt] = None
+        self._latest: Deque[LogExcerpt] = deque(maxlen=self.max_excerpts - 1)
+        self._before: Deque[str] = deque(maxlen=self.context_lines)
+        self._current: Optional[LogExcerpt] = None
+        self._current_lines: List[str] = []
+        self._after = 0
+
+    def summarize(self, blocks: Iterable[bytes]) -> FailureSummary:
+        """Summarize a whole log.
+
+        Args:
+            blocks: Consecutive log bytes
+
+        Returns:
+            Failure summary
+        """
+        self.consume(blocks)
+        return self.result()
+
+    def result(self) -> FailureSummary:
+        """Finish the summary, once the whole log was fed.
+
+        Returns:
+            Failure summary, with excerpts trimmed to ``max_bytes``
+        """
+        self.finish()
+        self._close()
+
+        excerpts = [self._first] if self._first is not None else []
+        excerpts.extend(self._latest)
+        omitted = self.omitted_excerpts
+        # Drop the oldest excerpts after the first one until the budget fits
+        while len(excerpts) > 2 and _text_size(excerpts) > self.max_bytes:
+            del excerpts[1]
+            omitted += 1
+        if _text_size(excerpts) > self.max_bytes:
+            share = self.max_bytes // len(excerpts)
+            for excerpt in excerpts:
+                encoded = excerpt["text"].encode("utf-8")
+                if len(encoded) > share:
+                    text = encoded[:share].decode("utf-8", "ignore")
+                    excerpt["text"] = text + "\n..."
+
+        return {
+            "result": self.result_status,
+            "failed_stage": self.failed_stage,
+            "stages": self.stages,
+            "excerpts": excerpts,
+            "omitted_excerpts": omitted,
+            "lines_scanned": self.lines_scanned,
+            "bytes_scanned": self.bytes_scanned,
+        }
+
+    def _scan(self, line: str) -> None:
+        """Classify one line and grow or start excerpts."""
+        match = _MARKERS.search(line)
+        kind = match.lastgroup if match else None
+
+        if kind == "stage":
+            self._stage = match.group("stage_name")
+            if len(self.stages) < MAX_STAGES:
+                self.stages.append(self._stage)
+        elif kind == "finished":
+            self.result_status = match.group("result")
+            if self.result_status != "SUCCESS":
+                kind = "build_failure"
+
+        failure = kind in _FAILURE_KINDS
+        # "Finished: FAILURE" comes after every stage; it tells nothing of where
+        if failure and match.lastgroup != "finished":
+            if kind == "build_failure" or _BUILD_FAILURE_MARKER.search(line):
+                self.failed_stage = self._stage
+                self._build_failed = True
+            elif not self._build_failed:
+                self.failed_stage = self._stage
+        if self._current is not None:
+            if len(self._current_lines) >= MAX_EXCERPT_LINES:
+                self._close()
+            elif failure or kind == "frame":
+                self._extend(line)
+                self._after = 0
+            elif self._after < self.context_lines:
+                self._extend(line)
+                self._after += 1
+            else:
+                self._close()
+
+        if self._current is None and failure:
+            self._current = {
+                "kind": kind,
+                "stage": self._stage,
+                "start_line": self.lines_scanned - len(self._before),
+                "end_line": self.lines_scanned,
+                "text": "",
+            }
+            self._current_lines = [*self._before, line]
+            self._after = 0
+            self._before.clear()
+        elif self._current is None:
+            self._before.append(line)
+
+    def _extend(self, line: str) -> None:
+        """Add a line to the open excerpt."""
+        assert self._current is not None
+        self._current_lines.append(line)
+        self._current["end_line"] = self.lines_scanned
+
+    def _close(self) -> None:
+        """Store the open excerpt, if any."""
+        if self._current is None:
+            return
+        self._current["text"] = "\n".join(self._current_lines)
+        if self._first is None:
+            self._first = self._current
+        else:
+            if len(self._latest) == self._latest.maxlen:
+                self.omitted_excerpts += 1
+            self._latest.append(self._current)
+        self._current = None
+        self._current_lines = []
+
+
+def _text_size(excerpts: List[LogExcerpt]) -> int:
+    """Total UTF-8 size of excerpt text."""
+    return sum(len(excerpt["text"].encode("utf-8")) for excerpt in excerpts)
+
+
+def format_failure_summary(summary: FailureSummary) -> str:
+    """Render a failure summary as plain text.
+
+    Args:
+        summary: Failure summary
+
+    Returns:
+        Excerpts with their line ranges and stages
+    """
+    if not summary["excerpts"]:
+        return f"No failure markers found (result: {summary['result']})."
+
+    sections = []
+    for excerpt in summary["excerpts"]:
+        stage = f", stage '{excerpt['stage']}'" if excerpt["stage"] else ""
+        sections.append(
+            f"--- lines {excerpt['start_line']}-{excerpt['end_line']}"
+            f" ({excerpt['kind']}{stage}) ---\n{excerpt['text']}"
+        )
+    if summary["omitted_excerpts"]:
+        sections.insert(1, f"... {summary['omitted_excerpts']} excerpts omitted ...")
+    return "\n".join(sections)
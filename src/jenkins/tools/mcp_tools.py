@@ -3,23 +3,54 @@
 import logging
 from typing import Any
 from typing import List
+from typing import Optional
+from typing import Tuple
 
 from mcp.server.fastmcp import Context
 
-from ..config import get_jenkins_servers
 from ..server import mcp
+from .api import DEFAULT_LOG_MAX_BYTES
+from .api import STOP_CONFIRM_TIMEOUT
+from .api import build_status_result
+from .api import check_required_parameters
+from .api import filter_queue_items
+from .async_client import AsyncJenkinsAPIClient
 from .client import JenkinsAPIClient
 from .exceptions import JenkinsParameterError
+from .exceptions import JenkinsPermissionError
+from .executor import executor_pool
+from .job_index import job_index
+from .log_search import DEFAULT_CONTEXT_LINES
+from .log_search import DEFAULT_MAX_MATCHES
+from .log_summary import DEFAULT_MAX_EXCERPTS
+from .log_summary import DEFAULT_SUMMARY_CONTEXT_LINES
+from .log_summary import DEFAULT_SUMMARY_MAX_BYTES
+from .registry import server_registry
 from .scenarios import ScenarioManager
+from .types import BatchTriggerResult
+from .types import BuildLogChunk
+from .types import BuildStatusResult
+from .types import BuildWatchInfo
+from .types import BulkStopResult
+from .types import FailureSummary
 from .types import JobInfo
 from .types import JobParameter
+from .types import LogSearchResult
 from .types import ParameterDict
+from .types import PipelineRun
+from .types import QueueCancelResult
+from .types import QueueItem
 from .types import ScenarioInfo
+from .types import StageLog
 from .types import StopResult
 from .types import TriggerResult
+from .watcher import build_watcher
 
 logger = logging.getLogger(__name__)
 
+# Largest batch accepted by batch tools
+MAX_BATCH_ITEMS = 200
+
 
 @mcp.tool()
 def get_server_names() -> List[str]:
@@ -28,8 +59,7 @@ def get_server_names() -> List[str]:
     Returns:
         List of server names
     """
-    servers = get_jenkins_servers()
-    return [server["name"] for server in servers]
+    return server_registry.names()
 
 
 @mcp.tool()
@@ -57,7 +87,7 @@ def get_scenario_list() -> List[ScenarioInfo]:
 
 
 @mcp.tool()
-def search_jobs_by_scenario(scenario: str) -> List[JobInfo]:
+async def search_jobs_by_scenario(scenario: str) -> List[JobInfo]:
     """Get the specified Jenkins job directly by scenario.
 
     Args:
@@ -66,28 +96,50 @@ def search_jobs_by_scenario(scenario: str) -> List[JobInfo]:
     Returns:
         List of job info matching the scenario
     """
-    return ScenarioManager.search_jobs_by_scenario(scenario)
+    server_name = ScenarioManager.get_scenario_server(scenario)
+    return await executor_pool.run(
+        server_name, ScenarioManager.search_jobs_by_scenario, scenario
+    )
 
 
 @mcp.tool()
-def search_jobs(server_name: str, keyword: str) -> List[JobInfo]:
+async def search_jobs(
+    server_name: str, keyword: str, limit: int = 50, offset: int = 0
+) -> List[JobInfo]:
     """Search Jenkins jobs on the specified server.
 
     Note: For deployment tasks, it is recommended to use get_scenario_list() and search_jobs_by_scenario().
+    Results are served from the local job index, which is refreshed in the background.
 
     Args:
         server_name: Jenkins server name
         keyword: Search keyword
+        limit: Max number of jobs to return (default 50)
+        offset: Number of matching jobs to skip, for paging through results
 
     Returns:
-        List of matching jobs
+        List of matching jobs, best matches first (exact name > name prefix > path segment > substring)
     """
-    client = JenkinsAPIClient(server_name)
-    return client.search_jobs(keyword)
+    if job_index.enabled:
+        # The index crawls and persists on the server's worker threads
+        client = JenkinsAPIClient(server_name)
+        return await executor_pool.run(
+            server_name,
+            job_index.search,
+            server_name,
+            keyword,
+            client.iter_jobs,
+            limit=limit,
+            offset=offset,
+        )
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.search_jobs(keyword, limit=limit, offset=offset)
 
 
 @mcp.tool()
-def get_job_parameters(server_name: str, job_full_name: str) -> List[JobParameter]:
+async def get_job_parameters(
+    server_name: str, job_full_name: str
+) -> List[JobParameter]:
     """Get the parameter definitions of a Jenkins job.
 
     Args:
@@ -97,23 +149,29 @@ def get_job_parameters(server_name: str, job_full_name: str) -> List[JobParamete
     Returns:
         List of parameter definitions, including parameter name, type, default value, and options (if choice parameter)
     """
-    client = JenkinsAPIClient(server_name)
-    return client.get_job_parameters(job_full_name)
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.get_job_parameters(job_full_name)
 
 
 @mcp.tool()
-def trigger_build(
-    server_name: str, job_full_name: str, params: Any = None, ctx: Context = None
+async def trigger_build(
+    server_name: str,
+    job_full_name: str,
+    params: Any = None,
+    max_wait: Optional[float] = None,
+    ctx: Context = None,
 ) -> TriggerResult:
     """Trigger Jenkins job build.
 
     Automatically determines parameter requirements and waits to obtain build_number.
+    While the build is queued, progress notifications report the queue reason.
 
     Args:
         server_name: Jenkins server name
         job_full_name: Full job name
         params: Optional parameter dict
-        ctx: MCP context (for logging)
+        max_wait: Seconds to wait for the build to leave the queue (default from config, 10)
+        ctx: MCP context (for logging and progress)
 
     Returns:
         Dict containing build_number or queue_id
@@ -122,7 +180,7 @@ def trigger_build(
         JenkinsParameterError: Missing required parameters
         JenkinsError: Trigger failed
     """
-    client = JenkinsAPIClient(server_name)
+    client = AsyncJenkinsAPIClient(server_name)
 
     # Parameter type conversion
     build_params: ParameterDict = {}
@@ -135,45 +193,35 @@ def trigger_build(
                 build_params = dict(params)
             except (TypeError, ValueError):
                 if ctx:
-                    ctx.log(
+                    await ctx.log(
                         "warning",
                         f"Invalid params type: {type(params)}, ignoring parameters",
                     )
                 build_params = {}
 
-    # Check required parameters
-    job_params = client.get_job_parameters(job_full_name)
-    if job_params:
-        required_params = [p for p in job_params if p["default"] is None]
-        missing_params = []
-
-        for param in required_params:
-            if not build_params or param["name"] not in build_params:
-                missing_params.append(param)
-
-        if missing_params:
-            # Build detailed error message
-            param_details = []
-            for param in missing_params:
-                detail = f"{param['name']} (type: {param['type']}, default: {param['default']}"
-                if param.get("choices"):
-                    detail += f", choices: {param['choices']}"
-                detail += ")"
-                param_details.append(detail)
-
-            error_msg = f"This job requires required parameters, please provide them before execution. Missing parameters: {', '.join(param_details)}"
-            raise JenkinsParameterError(error_msg, [p["name"] for p in missing_params])
+    # Check required parameters (the definitions are reused for the trigger)
+    job_params = await client.get_job_parameters(job_full_name)
+    check_required_parameters(job_params, build_params)
 
     if ctx:
-        ctx.log("info", f"Triggering build for {job_full_name} on {server_name}")
+        await ctx.log("info", f"Triggering build for {job_full_name} on {server_name}")
         if build_params:
-            ctx.log("debug", f"Build parameters: {build_params}")
+            await ctx.log("debug", f"Build parameters: {build_params}")
 
-    return client.trigger_build(job_full_name, build_params)
+    on_progress = ctx.report_progress if ctx else None
+    return await client.trigger_build(
+        job_full_name,
+        build_params,
+        job_params=job_params,
+        max_wait=max_wait,
+        on_progress=on_progress,
+    )
 
 
 @mcp.tool()
-def get_build_status(server_name: str, job_full_name: str, build_number: int) -> dict:
+async def get_build_status(
+    server_name: str, job_full_name: str, build_number: int
+) -> dict:
     """Get the Jenkins build status for the specified build_number.
 
     Args:
@@ -184,17 +232,292 @@ def get_build_status(server_name: str, job_full_name: str, build_number: int) ->
     Returns:
         Build status info
     """
-    client = JenkinsAPIClient(server_name)
-    return client.get_build_status(job_full_name, build_number)
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.get_build_status(job_full_name, build_number)
+
+
+def _check_batch_size(items: List[Any]) -> None:
+    """Reject batches larger than ``MAX_BATCH_ITEMS``.
+
+    Raises:
+        JenkinsParameterError: Too many items
+    """
+    if len(items) > MAX_BATCH_ITEMS:
+        raise JenkinsParameterError(
+            f"Too many items: {len(items)} (at most {MAX_BATCH_ITEMS} per call)"
+        )
+
+
+def _parse_build_item(item: dict) -> Tuple[str, int]:
+    """Read a ``{"job", "build_number"}`` batch item.
+
+    Returns:
+        (job full name, build number)
+
+    Raises:
+        JenkinsParameterError: Malformed item
+    """
+    job_full_name = item.get("job") or item.get("job_full_name")
+    try:
+        build_number = int(item.get("build_number"))
+    except (TypeError, ValueError):
+        build_number = None
+    if not job_full_name or build_number is None:
+        raise JenkinsParameterError(f"Item needs 'job' and 'build_number': {item}")
+    return job_full_name, build_number
+
+
+def _parse_trigger_item(item: dict) -> Tuple[str, ParameterDict]:
+    """Read a ``{"job", "params"}`` batch item.
+
+    Returns:
+        (job full name, build parameters)
+
+    Raises:
+        JenkinsParameterError: Malformed item
+    """
+    job_full_name = item.get("job") or item.get("job_full_name")
+    params = item.get("params") or {}
+    if not job_full_name or not isinstance(params, dict):
+        raise JenkinsParameterError(
+            f"Item needs 'job' and optional dict 'params': {item}"
+        )
+    return job_full_name, params
+
+
+@mcp.tool()
+async def trigger_builds(
+    server_name: str,
+    items: List[dict],
+    max_wait: Optional[float] = None,
+    ctx: Context = None,
+) -> List[BatchTriggerResult]:
+    """Trigger many Jenkins job builds in one call, e.g. every job of a multi-job release.
+
+    Prefer this over repeated trigger_build calls. All items are validated first: if any job is missing required
+    parameters (or cannot be found), nothing is triggered and the error lists every problem. The builds are then
+    triggered concurrently (at most max_connections of the server at once) and waited for together, with one queue
+    request per poll however many builds wait.
+
+    Args:
+        server_name: Jenkins server name
+        items: Builds to trigger, e.g. [{"job": "deploy/app", "params": {"VERSION": "1.2"}}, ...] (at most 200)
+        max_wait: Seconds to wait for the builds to leave the queue (default from config, 10)
+        ctx: MCP context (for logging and progress)
+
+    Returns:
+        One result per item, in input order: job_full_name, result (same fields as trigger_build, or None) and
+        error (None on success)
+
+    Raises:
+        JenkinsParameterError: Malformed items or missing required parameters; nothing was triggered
+    """
+    _check_batch_size(items)
+    builds = [_parse_trigger_item(item) for item in items]
+
+    if ctx:
+        await ctx.log("info", f"Triggering {len(builds)} builds on {server_name}")
+
+    client = AsyncJenkinsAPIClient(server_name)
+    on_progress = ctx.report_progress if ctx else None
+    return await client.trigger_builds(
+        builds, max_wait=max_wait, on_progress=on_progress
+    )
+
+
+@mcp.tool()
+async def get_builds_status(
+    server_name: str, items: List[dict]
+) -> List[BuildStatusResult]:
+    """Get the status of many Jenkins builds in one call.
+
+    Prefer this over repeated get_build_status calls, e.g. to check all downstream builds after a release.
+    Builds are looked up concurrently; an item that fails gets an error message instead of failing the batch.
+
+    Args:
+        server_name: Jenkins server name
+        items: Builds to look up, e.g. [{"job": "deploy/app", "build_number": 12}, ...] (at most 200)
+
+    Returns:
+        One result per item, in input order: job_full_name, build_number, status (same fields as
+        get_build_status, or None) and error (None on success)
+    """
+    _check_batch_size(items)
+
+    results: List[Optional[BuildStatusResult]] = [None] * len(items)
+    builds: List[Tuple[str, int]] = []
+    positions: List[int] = []
+    for position, item in enumerate(items):
+        try:
+            builds.append(_parse_build_item(item))
+        except JenkinsParameterError as e:
+            results[position] = build_status_result(
+                str(item.get("job") or ""), 0, None, e
+            )
+            continue
+        positions.append(position)
+
+    client = AsyncJenkinsAPIClient(server_name)
+    for position, result in zip(positions, await client.get_builds_status(builds)):
+        results[position] = result
+    return results
+
+
+@mcp.tool()
+async def watch_builds(
+    server_name: str, items: List[dict], ctx: Context = None
+) -> List[BuildWatchInfo]:
+    """Watch in-flight Jenkins builds and get notified when they finish.
+
+    Use this instead of polling get_build_status in a loop. All watched builds of a job are polled together with one
+    request, and when a build finishes this session receives a log notification and a jenkins://watches resource
+    update. Check progress any time with get_watched_builds.
+
+    Args:
+        server_name: Jenkins server name
+        items: Builds to watch, e.g. [{"job": "deploy/app", "build_number": 12}, ...] (at most 200)
+        ctx: MCP context (for notifications)
+
+    Returns:
+        Watch states (state is WATCHING, COMPLETED or ERROR; status has the same fields as get_build_status)
+    """
+    _check_batch_size(items)
+    builds = [_parse_build_item(item) for item in items]
+    # Fail fast on unknown servers
+    server_registry.get(server_name)
+    session = ctx.session if ctx else None
+    return [
+        build_watcher.watch(server_name, job_full_name, build_number, session)
+        for job_full_name, build_number in builds
+    ]
+
+
+@mcp.tool()
+def get_watched_builds(server_name: Optional[str] = None) -> List[BuildWatchInfo]:
+    """Get the state of watched Jenkins builds.
+
+    Args:
+        server_name: Only this server's builds (optional)
+
+    Returns:
+        Watch states; finished builds are kept for a while after they complete
+    """
+    return build_watcher.list(server_name)
+
+
+@mcp.tool()
+async def unwatch_builds(
+    server_name: str, items: List[dict], ctx: Context = None
+) -> int:
+    """Stop watching Jenkins builds.
+
+    Args:
+        server_name: Jenkins server name
+        items: Builds to stop watching, e.g. [{"job": "deploy/app", "build_number": 12}, ...]
+        ctx: MCP context
+
+    Returns:
+        Number of builds that were watched
+    """
+    builds = [_parse_build_item(item) for item in items]
+    session = ctx.session if ctx else None
+    return sum(
+        build_watcher.unwatch(server_name, job_full_name, build_number, session)
+        for job_full_name, build_number in builds
+    )
+
+
+@mcp.tool()
+async def get_pipeline_stages(
+    server_name: str, job_full_name: str, build_number: int
+) -> PipelineRun:
+    """Get the stages of a Jenkins Pipeline build with their status and timings.
+
+    Use this to find which stage failed before reading logs, then call get_stage_log for that stage only.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+
+    Returns:
+        Dict with number, status, start_time_millis, duration_millis and stages
+        (id, name, status, exec_node, start_time_millis, duration_millis, pause_duration_millis)
+    """
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.get_pipeline_stages(job_full_name, build_number)
 
 
 @mcp.tool()
-def stop_build(
+async def get_stage_log(
+    server_name: str,
+    job_full_name: str,
+    build_number: int,
+    stage: str,
+    node_id: Optional[str] = None,
+    failed_only: bool = False,
+) -> StageLog:
+    """Get the logs of one Jenkins Pipeline stage, step by step.
+
+    Only the selected stage is downloaded instead of the whole console log. Each step log holds at most the last
+    part of the step's output (has_more is true when earlier output was cut).
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+        stage: Stage ID or name (from get_pipeline_stages)
+        node_id: Only the step with this flow node ID (optional)
+        failed_only: Only steps whose status is FAILED, UNSTABLE or ABORTED (default False)
+
+    Returns:
+        Dict with the stage info and steps (id, name, status, parameter_description, text, length, has_more)
+    """
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.get_stage_log(
+        job_full_name,
+        build_number,
+        stage,
+        node_id=node_id,
+        failed_only=failed_only,
+    )
+
+
+def _confirm_stop(
+    server_name: str, job_full_name: str, build_number: int, ctx: Optional[Context]
+) -> BuildWatchInfo:
+    """Confirm a refused stop request in the background.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+        ctx: MCP context, whose session is notified
+
+    Returns:
+        Watch that completes once the build has stopped
+    """
+    error = JenkinsPermissionError("stop build", f"{job_full_name}#{build_number}")
+    return build_watcher.watch(
+        server_name,
+        job_full_name,
+        build_number,
+        ctx.session if ctx else None,
+        timeout=STOP_CONFIRM_TIMEOUT,
+        timeout_error=str(error),
+    )
+
+
+@mcp.tool()
+async def stop_build(
     server_name: str, job_full_name: str, build_number: int, ctx: Context = None
 ) -> StopResult:
     """Stop Jenkins build.
 
-    Intelligently handles permission errors and will automatically check build status to confirm if it has already been terminated.
+    Intelligently handles permission errors: if Jenkins refuses the stop request while the build is still running, this
+    returns STOP_PENDING_CONFIRMATION at once and confirms in the background. The result's confirmation is a build
+    watch (see get_watched_builds): COMPLETED once the build has stopped; if it is still running after the
+    confirmation timeout, the calling session is notified with ERROR and other watches of the build carry on.
 
     Args:
         server_name: Jenkins server name
@@ -205,47 +528,273 @@ def stop_build(
     Returns:
         Stop result
     """
-    client = JenkinsAPIClient(server_name)
+    client = AsyncJenkinsAPIClient(server_name)
 
     if ctx:
-        ctx.log(
+        await ctx.log(
             "info",
             f"Stopping build #{build_number} for {job_full_name} on {server_name}",
         )
 
     try:
-        result = client.stop_build(job_full_name, build_number)
+        result = await client.stop_build(job_full_name, build_number)
 
         if ctx:
             if result["status"] == "ALREADY_TERMINATED":
-                ctx.log("info", "Build was already terminated")
+                await ctx.log("info", "Build was already terminated")
             elif result["status"] == "STOP_REQUESTED":
-                ctx.log("info", "Stop request sent successfully")
+                await ctx.log("info", "Stop request sent successfully")
             elif result["status"] == "NOT_FOUND":
-                ctx.log("warning", "Build not found")
+                await ctx.log("warning", "Build not found")
+
+        if result["status"] == "STOP_PENDING_CONFIRMATION":
+            result["confirmation"] = _confirm_stop(
+                server_name, job_full_name, build_number, ctx
+            )
+            if ctx:
+                await ctx.log(
+                    "info", "Stop request refused, confirming in the background"
+                )
 
         return result
 
     except Exception as e:
         if ctx:
-            ctx.log("error", f"Failed to stop build: {e}")
+            await ctx.log("error", f"Failed to stop build: {e}")
         raise
 
 
 @mcp.tool()
-def get_build_log(server_name: str, job_full_name: str, build_number: int) -> str:
-    """Get Jenkins build log.
+async def stop_builds(
+    server_name: str = "",
+    job_full_name: str = "",
+    scenario: str = "",
+    running: bool = True,
+    queued: bool = True,
+    older_than_minutes: Optional[float] = None,
+    parameters: Optional[dict] = None,
+    dry_run: bool = False,
+    ctx: Context = None,
+) -> BulkStopResult:
+    """Stop many Jenkins builds at once: the running builds and queued items of a job, folder or scenario.
+
+    Use this instead of calling stop_build once per build. Matching builds are found with one request per job and
+    stopped concurrently; queued items are cancelled first so they cannot start in place of the stopped builds.
+    Run with dry_run=True first to see what would be stopped.
+
+    Args:
+        server_name: Jenkins server name (not needed with scenario)
+        job_full_name: Full job or folder name; all jobs in a folder are included (not needed with scenario)
+        scenario: Scenario name or index, instead of server_name and job_full_name
+        running: Stop running builds (default true)
+        queued: Cancel queued builds (default true)
+        older_than_minutes: Only builds started / queued at least this many minutes ago (optional)
+        parameters: Only builds with these parameter values, e.g. {"VERSION": "1.2.0"} (optional)
+        dry_run: Only list the matching builds without stopping them
+        ctx: MCP context (for logging)
+
+    Returns:
+        Matched builds (build_number) and queue items (queue_id) with their status: MATCHED on a dry run, otherwise
+        STOP_REQUESTED, STOP_PENDING_CONFIRMATION (see get_watched_builds), ALREADY_TERMINATED, CANCELLED, NOT_FOUND
+        or FAILED (with error)
+    """
+    if scenario:
+        server_name, job_full_name = ScenarioManager.get_scenario_job(scenario)
+    elif not server_name or not job_full_name:
+        raise JenkinsParameterError(
+            "Either scenario or both server_name and job_full_name are required"
+        )
+
+    client = AsyncJenkinsAPIClient(server_name)
+    older_than = older_than_minutes * 60 if older_than_minutes is not None else None
+    result = await client.stop_builds(
+        job_full_name,
+        running=running,
+        queued=queued,
+        older_than=older_than,
+        parameters=parameters,
+        dry_run=dry_run,
+    )
+
+    for item in result["items"]:
+        if item["status"] == "STOP_PENDING_CONFIRMATION":
+            _confirm_stop(server_name, item["job_full_name"], item["build_number"], ctx)
+    if ctx:
+        action = "Matched" if dry_run else "Processed"
+        await ctx.log(
+            "info",
+            f"{action} {result['matched']} builds in {result['jobs_scanned']} jobs "
+            f"under {job_full_name} on {server_name}",
+        )
+    return result
+
+
+@mcp.tool()
+async def get_queue(server_name: str, job_prefix: str = "") -> List[QueueItem]:
+    """Get the Jenkins build queue: every waiting build and why it is waiting.
+
+    Use this to find out why a deployment has not started (e.g. waiting for an executor, blocked by another build).
+
+    Args:
+        server_name: Jenkins server name
+        job_prefix: Only items of jobs whose full name starts with this, e.g. a folder path (optional)
+
+    Returns:
+        Queue items with queue_id, job_full_name, why, in_queue_since (ms since epoch), blocked/buildable/stuck and
+        parameters
+    """
+    client = AsyncJenkinsAPIClient(server_name)
+    return filter_queue_items(await client.get_queue(), job_prefix)
+
+
+@mcp.tool()
+async def cancel_queue_items(
+    server_name: str,
+    queue_ids: Optional[List[int]] = None,
+    job_prefix: str = "",
+    ctx: Context = None,
+) -> List[QueueCancelResult]:
+    """Cancel queued Jenkins builds.
+
+    Give queue_ids (from get_queue) to cancel those items, or job_prefix to cancel every queued build of the jobs
+    under it; with both, only the given items under the prefix are cancelled.
+
+    Args:
+        server_name: Jenkins server name
+        queue_ids: Queue item IDs (at most 200)
+        job_prefix: Job full name prefix, e.g. a folder path
+        ctx: MCP context (for logging)
+
+    Returns:
+        One result per item: queue_id and status (CANCELLED, NOT_FOUND if it already left the queue, or FAILED with
+        error)
+    """
+    if not queue_ids and not job_prefix:
+        raise JenkinsParameterError("Either queue_ids or job_prefix is required")
+    _check_batch_size(queue_ids or [])
+
+    client = AsyncJenkinsAPIClient(server_name)
+    ids = list(queue_ids or [])
+    if job_prefix:
+        # One queue read resolves the prefix for all items
+        matching = [
+            item["queue_id"]
+            for item in filter_queue_items(await client.get_queue(), job_prefix)
+        ]
+        ids = [queue_id for queue_id in ids if queue_id in matching] if ids else matching
+
+    results = await client.cancel_queue_items(ids)
+    if ctx:
+        cancelled = sum(result["status"] == "CANCELLED" for result in results)
+        await ctx.log("info", f"Cancelled {cancelled} queued builds on {server_name}")
+    return results
+
+
+@mcp.tool()
+async def get_build_log(
+    server_name: str,
+    job_full_name: str,
+    build_number: int,
+    start: int = 0,
+    max_bytes: int = DEFAULT_LOG_MAX_BYTES,
+    tail_lines: Optional[int] = None,
+) -> BuildLogChunk:
+    """Get a range of a Jenkins build log.
+
+    Large logs are returned in pages: call again with start set to the returned offset while more_data is true.
+    Use tail_lines to read only the end of the log (usually where failures are).
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+        start: Byte offset to read from (default 0)
+        max_bytes: Max bytes to return (default 256 KiB)
+        tail_lines: Return only the last N lines of the log (ignores start)
+
+    Returns:
+        Dict with text, start (byte offset of text), offset (where the next page starts) and more_data
+    """
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.get_build_log(
+        job_full_name,
+        build_number,
+        start=start,
+        max_bytes=max_bytes,
+        tail_lines=tail_lines,
+    )
+
+
+@mcp.tool()
+async def search_build_log(
+    server_name: str,
+    job_full_name: str,
+    build_number: int,
+    pattern: str,
+    context_lines: int = DEFAULT_CONTEXT_LINES,
+    max_matches: int = DEFAULT_MAX_MATCHES,
+) -> LogSearchResult:
+    """Search a Jenkins build log with a regular expression, server-side.
+
+    Prefer this over get_build_log to find errors or stack traces in large logs: only matching lines are returned.
 
     Args:
         server_name: Jenkins server name
         job_full_name: Full job name
         build_number: Build number
+        pattern: Python regular expression matched against each line (use (?i) for case-insensitive)
+        context_lines: Lines of context before and after each match (default 2)
+        max_matches: Max matches to return (default 50)
 
     Returns:
-        Build log text
+        Dict with matches (line_number, line, context_before, context_after), truncated
+        (stopped at max_matches before the end of the log), lines_scanned and bytes_scanned
     """
-    client = JenkinsAPIClient(server_name)
-    return client.get_build_log(job_full_name, build_number)
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.search_build_log(
+        job_full_name,
+        build_number,
+        pattern,
+        context_lines=context_lines,
+        max_matches=max_matches,
+    )
+
+
+@mcp.tool()
+async def get_build_failure_summary(
+    server_name: str,
+    job_full_name: str,
+    build_number: int,
+    context_lines: int = DEFAULT_SUMMARY_CONTEXT_LINES,
+    max_excerpts: int = DEFAULT_MAX_EXCERPTS,
+    max_bytes: int = DEFAULT_SUMMARY_MAX_BYTES,
+) -> FailureSummary:
+    """Extract the failure-relevant parts of a Jenkins build log.
+
+    Use this first when a build failed: the log is scanned server-side for error lines, exceptions and stack traces,
+    "BUILD FAILURE" markers and failed shell steps, and only a few KB of excerpts are returned.
+
+    Args:
+        server_name: Jenkins server name
+        job_full_name: Full job name
+        build_number: Build number
+        context_lines: Lines of context around each failure marker (default 3)
+        max_excerpts: Max excerpts; the first one and the latest ones are kept (default 5)
+        max_bytes: Max total size of excerpt text (default 8 KiB)
+
+    Returns:
+        Dict with result (from "Finished: ..."), failed_stage (pipeline stage of the last failed step, else of the
+        last error), stages, excerpts (kind, stage, start_line, end_line, text), omitted_excerpts, lines_scanned and
+        bytes_scanned
+    """
+    client = AsyncJenkinsAPIClient(server_name)
+    return await client.get_build_failure_summary(
+        job_full_name,
+        build_number,
+        context_lines=context_lines,
+        max_excerpts=max_excerpts,
+        max_bytes=max_bytes,
+    )
 
 
 @mcp.tool()
@@ -259,7 +808,7 @@ def validate_jenkins_config() -> dict:
 
     # Validate server config
     try:
-        servers = get_jenkins_servers()
+        servers = server_registry.configs()
         if not servers:
             errors.append("No Jenkins servers configured")
         else:
@@ -281,7 +830,7 @@ def validate_jenkins_config() -> dict:
 
 
 @mcp.tool()
-def create_or_update_job_from_jenkinsfile(
+async def create_or_update_job_from_jenkinsfile(
     server_name: str,
     job_name: str,
     jenkinsfile_content: str,
@@ -303,7 +852,7 @@ def create_or_update_job_from_jenkinsfile(
     Raises:
         JenkinsError: Job creation/update failed
     """
-    client = JenkinsAPIClient(server_name)
+    client = AsyncJenkinsAPIClient(server_name)
 
     # Organize all jobs under MCPS/username directory
     # Get username from Jenkins server config, extract part before @ if it's an email
@@ -333,19 +882,23 @@ def create_or_update_job_from_jenkinsfile(
     # Check if job already exists
     try:
         print(f"===job_full_name: {job_full_name}", flush=True)
-        existing_job = client.get_job_info(job_full_name)
+        existing_job = await client.get_job_info(job_full_name)
         print(f"=====existing_job: {existing_job}", flush=True)
         # Job exists, update it
         if ctx:
-            ctx.log("info", f"Updating existing job '{job_name}' on {server_name}")
-            ctx.log("debug", f"Target folder: {final_folder_path}")
+            await ctx.log(
+                "info", f"Updating existing job '{job_name}' on {server_name}"
+            )
+            await ctx.log("debug", f"Target folder: {final_folder_path}")
 
-        return client.update_job(job_name, job_config, final_folder_path)
+        return await client.update_job(job_name, job_config, final_folder_path)
     except Exception as e:
         # Job doesn't exist, create it
         print(e, flush=True)
         if ctx:
-            ctx.log("info", f"Creating new job '{job_name}' on {server_name}")
-            ctx.log("debug", f"Target folder: {final_folder_path}")
+            await ctx.log("info", f"Creating new job '{job_name}' on {server_name}")
+            await ctx.log("debug", f"Target folder: {final_folder_path}")
 
-        return client.create_job(job_name, job_config, final_folder_path)
+        result = await client.create_job(job_name, job_config, final_folder_path)
+        job_index.mark_stale(server_name)
+        return result
@@ -0,0 +1,140 @@
+"""Name-indexed registry of configured Jenkins servers."""
+
+import logging
+import threading
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from ..config import ConfigStore
+from ..config import config_store
+from ..config import get_jenkins_servers
+from .exceptions import JenkinsConfigurationError
+from .exceptions import JenkinsServerNotFoundError
+from .types import JenkinsClient
+from .types import JenkinsServerConfig
+
+logger = logging.getLogger(__name__)
+
+
+class ServerRegistry:
+    """Jenkins servers keyed by name, built once per configuration snapshot.
+
+    Each entry is a shared ``JenkinsClient`` holding the resolved token
+    (including ``tokenEnv``), the normalized base URL and a prebuilt
+    ``Authorization`` header, so per-request work is a dict lookup. Clients
+    are built when a server is first requested, so a malformed entry only
+    fails its own lookups.
+    """
+
+    def __init__(self, store: ConfigStore = config_store) -> None:
+        """Initialize server registry.
+
+        Args:
+            store: Configuration store the registry is built from
+        """
+        self._store = store
+        self._servers: Dict[str, JenkinsServerConfig] = {}
+        self._clients: Dict[str, JenkinsClient] = {}
+        self._configs: List[JenkinsServerConfig] = []
+        self._generation: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self, server_name: str) -> JenkinsClient:
+        """Get the shared client config for a server.
+
+        Args:
+            server_name: Jenkins server name
+
+        Returns:
+            Jenkins client config
+
+        Raises:
+            JenkinsServerNotFoundError: Server not found
+            JenkinsConfigurationError: The server's entry is malformed
+        """
+        client = self._client(server_name)
+        if client is None:
+            # Unknown name: rebuild once in case tokens/servers changed underneath
+            client = self._client(server_name, force=True)
+            if client is None:
+                raise JenkinsServerNotFoundError(server_name)
+        return client
+
+    def names(self) -> List[str]:
+        """Get all configured server names.
+
+        Returns:
+            List of server names
+        """
+        return list(self._entries()[0])
+
+    def configs(self) -> List[JenkinsServerConfig]:
+        """Get all resolved server configs.
+
+        Returns:
+            List of server configs
+        """
+        self._entries()
+        return list(self._configs)
+
+    def invalidate(self) -> None:
+        """Force the registry to be rebuilt on next access."""
+        with self._lock:
+            self._generation = None
+
+    def _client(
+        self, server_name: str, force: bool = False
+    ) -> Optional[JenkinsClient]:
+        """Get a server's client config, building it on first use.
+
+        Args:
+            server_name: Jenkins server name
+            force: Rebuild the name index even if the configuration is unchanged
+
+        Returns:
+            Jenkins client config, or None for an unknown server
+
+        Raises:
+            JenkinsConfigurationError: The server's entry is malformed
+        """
+        servers, clients = self._entries(force)
+        client = clients.get(server_name)
+        if client is None and server_name in servers:
+            server = servers[server_name]
+            uri = server.get("uri")
+            if not uri or not isinstance(uri, str):
+                raise JenkinsConfigurationError(
+                    f"Server '{server_name}' missing field: uri"
+                )
+            client = clients.setdefault(server_name, JenkinsClient(server))
+        return client
+
+    def _entries(
+        self, force: bool = False
+    ) -> Tuple[Dict[str, JenkinsServerConfig], Dict[str, JenkinsClient]]:
+        """Get the name index, rebuilding it when the configuration changed.
+
+        Args:
+            force: Rebuild even if the configuration snapshot is unchanged
+
+        Returns:
+            Server configs by name, and the clients built so far for them
+        """
+        snapshot = self._store.snapshot()
+        with self._lock:
+            if force or self._generation != snapshot.generation:
+                configs = get_jenkins_servers(snapshot.config)
+                self._configs = configs
+                self._servers = {server["name"]: server for server in configs}
+                # A fresh dict, so clients built from the previous snapshot
+                # are never added to this one
+                self._clients = {}
+                self._generation = snapshot.generation
+                logger.debug(f"Built server registry with {len(configs)} servers")
+            return self._servers, self._clients
+
+
+# Global server registry shared by all tools
+server_registry = ServerRegistry()
@@ -2,11 +2,14 @@
 
 import logging
 from typing import List
+from typing import Tuple
 
 from ..config import get_scenario_mapping
 from .client import JenkinsAPIClient
 from .exceptions import JenkinsConfigurationError
 from .exceptions import JenkinsError
+from .job_index import job_index
+from .registry import server_registry
 from .types import JobInfo
 from .types import ScenarioInfo
 
@@ -76,20 +79,7 @@ class ScenarioManager:
             JenkinsConfigurationError: Scenario configuration error
             JenkinsError: API request failed
         """
-        scenario_mapping = get_scenario_mapping()
-
-        # Parse scenario name
-        resolved_scenario = ScenarioManager._resolve_scenario_name(
-            scenario, scenario_mapping
-        )
-
-        if resolved_scenario not in scenario_mapping:
-            available_scenarios = ", ".join(scenario_mapping.keys())
-            raise JenkinsConfigurationError(
-                f"Unknown scenario '{scenario}'. Available scenarios: {available_scenarios}"
-            )
-
-        config = scenario_mapping[resolved_scenario]
+        resolved_scenario, config = ScenarioManager._resolve_scenario(scenario)
         server_name = config["server"]
         job_path = config["job_path"].strip("/")
 
@@ -98,9 +88,16 @@ class ScenarioManager:
         )
 
         try:
-            # Use Jenkins API client to get job info
+            # Answer from the job index, fall back to the Jenkins API (a server
+            # that was never indexed is crawled in the background meanwhile)
             client = JenkinsAPIClient(server_name)
-            job_info = client.get_job_info(job_path)
+            job_info = None
+            if job_index.enabled:
+                job_info = job_index.get_job(
+                    server_name, job_path, client.iter_jobs, wait=False
+                )
+            if job_info is None:
+                job_info = client.get_job_info(job_path)
 
             # Add scenario-related info
             job_info["scenario"] = resolved_scenario
@@ -119,6 +116,66 @@ class ScenarioManager:
                     f"Failed to get job for scenario '{resolved_scenario}': {e}"
                 ) from e
 
+    @staticmethod
+    def get_scenario_server(scenario: str) -> str:
+        """Get the Jenkins server of a scenario.
+
+        Args:
+            scenario: Scenario name or index
+
+        Returns:
+            Server name
+
+        Raises:
+            JenkinsConfigurationError: Scenario configuration error
+        """
+        _, config = ScenarioManager._resolve_scenario(scenario)
+        return config["server"]
+
+    @staticmethod
+    def get_scenario_job(scenario: str) -> Tuple[str, str]:
+        """Get the Jenkins server and job path of a scenario.
+
+        Args:
+            scenario: Scenario name or index
+
+        Returns:
+            (server name, job path)
+
+        Raises:
+            JenkinsConfigurationError: Scenario configuration error
+        """
+        _, config = ScenarioManager._resolve_scenario(scenario)
+        return config["server"], config["job_path"].strip("/")
+
+    @staticmethod
+    def _resolve_scenario(scenario: str) -> Tuple[str, dict]:
+        """Look up a scenario's configuration.
+
+        Args:
+            scenario: Scenario name or index
+
+        Returns:
+            Resolved scenario name and its configuration
+
+        Raises:
+            JenkinsConfigurationError: Unknown scenario
+        """
+        scenario_mapping = get_scenario_mapping()
+
+        # Parse scenario name
+        resolved_scenario = ScenarioManager._resolve_scenario_name(
+            scenario, scenario_mapping
+        )
+
+        if resolved_scenario not in scenario_mapping:
+            available_scenarios = ", ".join(scenario_mapping.keys())
+            raise JenkinsConfigurationError(
+                f"Unknown scenario '{scenario}'. Available scenarios: {available_scenarios}"
+            )
+
+        return resolved_scenario, scenario_mapping[resolved_scenario]
+
     @staticmethod
     def _resolve_scenario_name(scenario: str, scenario_mapping: dict) -> str:
         """Parse scenario name (supports index).
@@ -190,7 +247,7 @@ class ScenarioManager:
                 # Check if server exists
                 if "server" in config:
                     try:
-                        JenkinsAPIClient._get_server_config(config["server"])
+                        server_registry.get(config["server"])
                     except Exception as e:
                         errors.append(
                             f"Scenario '{scenario_name}' references invalid server '{config['server']}': {e}"
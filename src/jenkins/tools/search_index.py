@@ -0,0 +1,119 @@
+"""In-memory trigram index for ranked job name search."""
+
+from array import array
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from .types import JobInfo
+
+# Match quality ranks, lower is better
+RANK_EXACT_NAME = 0
+RANK_NAME_PREFIX = 1
+RANK_PATH_SEGMENT = 2
+RANK_NAME_SUBSTRING = 3
+RANK_PATH_SUBSTRING = 4
+
+
+def _trigrams(text: str) -> Iterable[str]:
+    """Get the distinct trigrams of a lowercased string."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def match_rank(query: str, name: str, full_name: str) -> Optional[int]:
+    """Rank how well a job matches a query.
+
+    Args:
+        query: Lowercased search keyword
+        name: Lowercased job name
+        full_name: Lowercased full job path
+
+    Returns:
+        Rank (exact name > name prefix > path segment > substring), or None
+        if the job does not match
+    """
+    if name == query:
+        return RANK_EXACT_NAME
+    if name.startswith(query):
+        return RANK_NAME_PREFIX
+    if query not in full_name:
+        return None
+    if any(segment.startswith(query) for segment in full_name.split("/")[:-1]):
+        return RANK_PATH_SEGMENT
+    if query in name:
+        return RANK_NAME_SUBSTRING
+    return RANK_PATH_SUBSTRING
+
+
+class TrigramIndex:
+    """Trigram inverted index over job full paths.
+
+    Queries of three or more characters probe the posting list of their
+    rarest trigram and verify the few candidates by substring match; shorter
+    queries fall back to a scan of the precomputed lowercase names.
+    """
+
+    def __init__(self, jobs: Iterable[JobInfo]) -> None:
+        """Build the index.
+
+        Args:
+            jobs: Jobs in display order (the order breaks ranking ties)
+        """
+        self._jobs: List[JobInfo] = []
+        self._keys: List[Tuple[str, str]] = []
+        self._postings: Dict[str, array] = {}
+
+        for doc_id, job in enumerate(jobs):
+            full_name = job["fullName"].lower()
+            self._jobs.append(job)
+            self._keys.append((job["name"].lower(), full_name))
+            for trigram in _trigrams(full_name):
+                posting = self._postings.get(trigram)
+                if posting is None:
+                    posting = self._postings[trigram] = array("I")
+                posting.append(doc_id)
+
+    def __len__(self) -> int:
+        """Get the number of indexed jobs."""
+        return len(self._jobs)
+
+    def search(
+        self, keyword: str, limit: Optional[int] = None, offset: int = 0
+    ) -> List[JobInfo]:
+        """Search jobs, best matches first.
+
+        Args:
+            keyword: Search keyword (case-insensitive)
+            limit: Max number of jobs to return (None for all)
+            offset: Number of ranked matches to skip
+
+        Returns:
+            Matching jobs ordered by rank, then input order
+        """
+        query = keyword.lower()
+        ranked = []
+        for doc_id in self._candidates(query):
+            name, full_name = self._keys[doc_id]
+            rank = match_rank(query, name, full_name)
+            if rank is not None:
+                ranked.append((rank, doc_id))
+
+        ranked.sort()
+        end = None if limit is None else offset + limit
+        return [self._jobs[doc_id] for _, doc_id in ranked[offset:end]]
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        """Get document ids that may contain the query."""
+        if len(query) < 3:
+            return range(len(self._jobs))
+
+        rarest: Optional[array] = None
+        for trigram in _trigrams(query):
+            posting = self._postings.get(trigram)
+            if posting is None:
+                return ()
+            if rarest is None or len(posting) < len(rarest):
+                rarest = posting
+        return rarest if rarest is not None else ()
@@ -0,0 +1,280 @@
+"""Process-wide HTTP session registry for Jenkins servers."""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Set
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 10
+
+
+class SessionPool:
+    """Keep-alive ``requests`` sessions, one per Jenkins server.
+
+    Each session mounts an ``HTTPAdapter`` whose connection pool is bounded by
+    ``max_connections``; when all connections are busy, callers block until one
+    is returned instead of opening throwaway connections.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        pool_block: bool = True,
+    ) -> None:
+        """Initialize session pool.
+
+        Args:
+            max_connections: Default max connections per Jenkins host
+            pool_block: Whether to block when the pool is exhausted
+        """
+        self.max_connections = max_connections
+        self.pool_block = pool_block
+        self._sessions: Dict[str, requests.Session] = {}
+        self._limits: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get_session(
+        self, server_name: str, max_connections: Optional[int] = None
+    ) -> requests.Session:
+        """Get (or create) the shared session for a server.
+
+        Args:
+            server_name: Jenkins server name
+            max_connections: Max connections for this server (defaults to pool default)
+
+        Returns:
+            Shared keep-alive session
+        """
+        limit = max_connections or self.max_connections
+        with self._lock:
+            session = self._sessions.get(server_name)
+            if session is not None and self._limits.get(server_name) == limit:
+                return session
+
+            if session is not None:
+                # Pool size changed (config reload), replace the session
+                session.close()
+
+            session = self._create_session(limit)
+            self._sessions[server_name] = session
+            self._limits[server_name] = limit
+            logger.debug(
+                f"Created HTTP session for Jenkins server '{server_name}' "
+                f"(max_connections={limit})"
+            )
+            return session
+
+    def _create_session(self, max_connections: int) -> requests.Session:
+        """Create a session with a bounded connection pool.
+
+        Args:
+            max_connections: Max connections per host
+
+        Returns:
+            New session
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_connections,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def stats(self) -> Dict[str, Any]:
+        """Get connection pool statistics.
+
+        Returns:
+            Dict with per-server pool stats
+        """
+        servers = {}
+        with self._lock:
+            items = list(self._sessions.items())
+            limits = dict(self._limits)
+
+        for server_name, session in items:
+            hosts = []
+            adapter = session.get_adapter("https://")
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                idle = sum(1 for conn in list(pool.pool.queue) if conn is not None)
+                hosts.append(
+                    {
+                        "host": f"{pool.scheme}://{pool.host}:{pool.port}",
+                        "connections_opened": pool.num_connections,
+                        "requests": pool.num_requests,
+                        "idle_connections": idle,
+                    }
+                )
+            servers[server_name] = {
+                "max_connections": limits.get(server_name),
+                "hosts": hosts,
+            }
+
+        return {
+            "default_max_connections": self.max_connections,
+            "pool_block": self.pool_block,
+            "servers": servers,
+        }
+
+    def close_all(self) -> None:
+        """Close all sessions and their pooled connections."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._limits.clear()
+
+
+@dataclass
+class _AsyncClientEntry:
+    """A server's async client and its counters."""
+
+    client: httpx.AsyncClient
+    max_connections: int
+    loop_id: int
+    requests: int = 0
+
+
+class AsyncSessionPool:
+    """Keep-alive ``httpx.AsyncClient`` instances, one per Jenkins server.
+
+    Connections belong to the event loop that opened them, so clients are
+    keyed by server and loop; in the MCP server that is a single loop.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS) -> None:
+        """Initialize async session pool.
+
+        Args:
+            max_connections: Default max connections per Jenkins host
+        """
+        self.max_connections = max_connections
+        self._clients: Dict[str, _AsyncClientEntry] = {}
+        self._closing: Set["asyncio.Task[None]"] = set()
+        self._lock = threading.Lock()
+
+    def get_client(
+        self, server_name: str, max_connections: Optional[int] = None
+    ) -> httpx.AsyncClient:
+        """Get (or create) the shared async client for a server.
+
+        Must be called from a running event loop.
+
+        Args:
+            server_name: Jenkins server name
+            max_connections: Max connections for this server (defaults to pool default)
+
+        Returns:
+            Shared keep-alive async client
+        """
+        limit = max_connections or self.max_connections
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._clients.get(server_name)
+            if entry is not None and not entry.client.is_closed:
+                if (entry.max_connections, entry.loop_id) == (limit, id(loop)):
+                    return entry.client
+                if entry.loop_id == id(loop):
+                    # Pool size changed (config reload): release the old
+                    # client's connections once the current tasks yield. A
+                    # client of another loop cannot be closed from here; it is
+                    # released with its loop.
+                    self._close_later(loop, entry.client)
+
+            entry = _AsyncClientEntry(
+                httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=limit, max_keepalive_connections=limit
+                    ),
+                ),
+                limit,
+                id(loop),
+            )
+            entry.client.event_hooks["request"].append(self._counter(entry))
+            self._clients[server_name] = entry
+            logger.debug(
+                f"Created async HTTP client for Jenkins server '{server_name}' "
+                f"(max_connections={limit})"
+            )
+            return entry.client
+
+    def stats(self) -> Dict[str, Any]:
+        """Get async connection pool statistics.
+
+        Returns:
+            Dict with per-server client stats
+        """
+        with self._lock:
+            entries = list(self._clients.items())
+
+        servers = {}
+        for server_name, entry in entries:
+            # httpx does not expose its pool; read httpcore's connection list
+            pool = getattr(entry.client._transport, "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            servers[server_name] = {
+                "max_connections": entry.max_connections,
+                "connections_open": len(connections),
+                "idle_connections": sum(1 for conn in connections if conn.is_idle()),
+                "requests": entry.requests,
+                "closed": entry.client.is_closed,
+            }
+
+        return {
+            "default_max_connections": self.max_connections,
+            "servers": servers,
+        }
+
+    async def aclose_all(self) -> None:
+        """Close all clients and their pooled connections."""
+        with self._lock:
+            clients = [entry.client for entry in self._clients.values()]
+            self._clients.clear()
+        for client in clients:
+            await client.aclose()
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def _close_later(
+        self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient
+    ) -> None:
+        """Schedule closing a replaced client on its loop."""
+        task = loop.create_task(client.aclose())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    def _counter(
+        entry: _AsyncClientEntry,
+    ) -> Callable[[httpx.Request], Awaitable[None]]:
+        """Build a request hook counting a client's requests."""
+
+        async def count(request: httpx.Request) -> None:
+            entry.requests += 1
+
+        return count
+
+
+# Global session pool shared by all Jenkins API clients
+session_pool = SessionPool()
+
+# Global async session pool shared by all async Jenkins API clients
+async_session_pool = AsyncSessionPool()
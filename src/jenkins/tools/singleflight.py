@@ -0,0 +1,138 @@
+"""Single-flight coalescing of identical concurrent Jenkins reads."""
+
+import asyncio
+import json
+import logging
+import threading
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def request_key(
+    server_name: str, method: str, url: str, params: Optional[Dict[str, Any]]
+) -> Tuple[str, str, str, str]:
+    """Build the key identifying an upstream request.
+
+    Args:
+        server_name: Jenkins server name
+        method: HTTP method
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        Hashable key, independent of parameter order
+    """
+    return (server_name, method, url, json.dumps(params or {}, sort_keys=True))
+
+
+class _Call:
+    """An in-flight call and its outcome."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Share one execution among threads making the same call concurrently.
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait and receive the same result (or exception). The key is
+    forgotten as soon as the call completes, so nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Call identity
+            fn: Function to run
+
+        Returns:
+            Result of the shared call
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            logger.debug(f"Coalesced in-flight request: {key}")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Share one execution among coroutines making the same call concurrently.
+
+    The first caller's coroutine runs as a task that later callers await; a
+    waiter being cancelled does not cancel the shared task.
+    """
+
+    def __init__(self) -> None:
+        """Initialize single-flight group."""
+        self._calls: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` once for all concurrent callers with the same key.
+
+        Args:
+            key: Call identity
+            fn: Coroutine function to run
+
+        Returns:
+            Result of the shared call
+        """
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            logger.debug(f"Coalesced in-flight request: {key}")
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Drop a completed call, unless a newer one replaced it."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+
+# Global single-flight groups shared by all Jenkins API clients
+request_flights = SingleFlight()
+async_request_flights = AsyncSingleFlight()
@@ -1,6 +1,8 @@
 """Jenkins MCP server type definitions."""
 
+import base64
 from dataclasses import dataclass
+from dataclasses import field
 from enum import Enum
 from typing import Any
 from typing import Dict
@@ -9,6 +11,7 @@ from typing import Literal
 from typing import Optional
 from typing import Union
 
+from typing_extensions import NotRequired
 from typing_extensions import TypedDict
 
 
@@ -60,6 +63,7 @@ class JenkinsServerConfig(TypedDict):
     uri: str
     user: str
     token: str
+    max_connections: NotRequired[int]
 
 
 class JobInfo(TypedDict):
@@ -74,6 +78,7 @@ class JobInfo(TypedDict):
     is_parameterized: bool
     last_build_number: Optional[int]
     last_build_url: Optional[str]
+    parameters: NotRequired[List["JobParameter"]]
 
 
 class JobParameter(TypedDict):
@@ -96,6 +101,117 @@ class BuildInfo(TypedDict):
     duration: int
 
 
+class BuildStatusResult(TypedDict):
+    """Status lookup result of one build in a batch."""
+
+    job_full_name: str
+    build_number: int
+    status: Optional[BuildInfo]
+    error: Optional[str]
+
+
+class BuildWatchInfo(TypedDict):
+    """State of a watched build."""
+
+    server_name: str
+    job_full_name: str
+    build_number: int
+    state: str
+    status: Optional[BuildInfo]
+    error: Optional[str]
+    watchers: int
+
+
+class BuildLogChunk(TypedDict):
+    """A byte range of a build log."""
+
+    text: str
+    start: int
+    offset: int
+    more_data: bool
+
+
+class LogMatch(TypedDict):
+    """A build log line matching a search pattern."""
+
+    line_number: int
+    line: str
+    context_before: List[str]
+    context_after: List[str]
+
+
+class LogSearchResult(TypedDict):
+    """Build log search result."""
+
+    matches: List[LogMatch]
+    truncated: bool
+    lines_scanned: int
+    bytes_scanned: int
+
+
+class LogExcerpt(TypedDict):
+    """A region of a build log around failure markers."""
+
+    kind: str
+    stage: Optional[str]
+    start_line: int
+    end_line: int
+    text: str
+
+
+class FailureSummary(TypedDict):
+    """Failure-relevant excerpts of a build log."""
+
+    result: Optional[str]
+    failed_stage: Optional[str]
+    stages: List[str]
+    excerpts: List[LogExcerpt]
+    omitted_excerpts: int
+    lines_scanned: int
+    bytes_scanned: int
+
+
+class PipelineStage(TypedDict):
+    """A stage of a Pipeline build."""
+
+    id: str
+    name: str
+    status: str
+    exec_node: str
+    start_time_millis: int
+    duration_millis: int
+    pause_duration_millis: int
+
+
+class PipelineRun(TypedDict):
+    """Stage structure and timings of a Pipeline build."""
+
+    number: int
+    status: str
+    start_time_millis: int
+    duration_millis: int
+    stages: List[PipelineStage]
+
+
+class PipelineNodeLog(TypedDict):
+    """Log of one Pipeline step (flow node)."""
+
+    id: str
+    name: str
+    status: str
+    parameter_description: str
+    text: str
+    length: int
+    has_more: bool
+
+
+class StageLog(TypedDict):
+    """Logs of the steps of one Pipeline stage."""
+
+    stage: PipelineStage
+    steps: List[PipelineNodeLog]
+
+
 class QueueInfo(TypedDict):
     """Queue info."""
 
@@ -109,6 +225,30 @@ class QueueInfo(TypedDict):
     status: str
 
 
+class QueueItem(TypedDict):
+    """Item of the build queue."""
+
+    queue_id: int
+    # None when the queued task is not a job (e.g. a Pipeline node block)
+    job_full_name: Optional[str]
+    task_name: str
+    why: Optional[str]
+    in_queue_since: int
+    blocked: bool
+    buildable: bool
+    stuck: bool
+    parameters: Dict[str, Any]
+
+
+class QueueCancelResult(TypedDict):
+    """Outcome of cancelling one queue item."""
+
+    queue_id: int
+    # CANCELLED, NOT_FOUND (no longer queued) or FAILED
+    status: str
+    error: Optional[str]
+
+
 class TriggerResult(TypedDict):
     """Trigger build result."""
 
@@ -120,11 +260,45 @@ class TriggerResult(TypedDict):
     message: Optional[str]
 
 
+class BatchTriggerResult(TypedDict):
+    """Result of one trigger of a batch."""
+
+    job_full_name: str
+    result: Optional[TriggerResult]
+    error: Optional[str]
+
+
 class StopResult(TypedDict):
     """Stop build result."""
 
-    status: Literal["STOP_REQUESTED", "ALREADY_TERMINATED", "NOT_FOUND"]
+    status: Literal[
+        "STOP_REQUESTED",
+        "STOP_PENDING_CONFIRMATION",
+        "ALREADY_TERMINATED",
+        "NOT_FOUND",
+    ]
     url: Optional[str]
+    # Watch confirming the stop in the background (STOP_PENDING_CONFIRMATION)
+    confirmation: NotRequired[BuildWatchInfo]
+
+
+class BulkStopItem(TypedDict):
+    """Outcome of stopping one build or cancelling one queue item."""
+
+    job_full_name: str
+    build_number: Optional[int]
+    queue_id: Optional[int]
+    # MATCHED (dry run), a StopResult status, CANCELLED or FAILED
+    status: str
+    error: Optional[str]
+
+
+class BulkStopResult(TypedDict):
+    """Bulk stop result."""
+
+    jobs_scanned: int
+    matched: int
+    items: List[BulkStopItem]
 
 
 class ScenarioConfig(TypedDict):
@@ -148,20 +322,27 @@ class ScenarioInfo(TypedDict):
 
 @dataclass
 class JenkinsClient:
-    """Jenkins client config."""
+    """Jenkins client config.
+
+    Derived values are computed once so a shared instance can serve every request.
+    """
 
     server_config: JenkinsServerConfig
     timeout: int = 30
-
-    @property
-    def base_url(self) -> str:
-        """Get base URL."""
-        return self.server_config["uri"].rstrip("/")
-
-    @property
-    def auth(self) -> tuple[str, str]:
-        """Get authentication info."""
-        return (self.server_config["user"], self.server_config["token"])
+    base_url: str = field(init=False)
+    auth: tuple[str, str] = field(init=False)
+    authorization: Optional[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Precompute base URL and authentication info."""
+        user = self.server_config["user"]
+        token = self.server_config["token"]
+        self.base_url = self.server_config["uri"].rstrip("/")
+        self.auth = (user, token)
+        self.authorization = None
+        if user and token:
+            credentials = f"{user}:{token}".encode("latin1")
+            self.authorization = f"Basic {base64.b64encode(credentials).decode()}"
 
 
 # Union types
@@ -0,0 +1,426 @@
+"""Background watcher polling in-flight builds in batches."""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+import httpx
+from pydantic import AnyUrl
+
+from ..config import get_config
+from .async_client import AsyncJenkinsAPIClient
+from .exceptions import JenkinsBuildNotFoundError
+from .exceptions import JenkinsError
+from .exceptions import JenkinsJobNotFoundError
+from .exceptions import JenkinsServerNotFoundError
+from .types import BuildInfo
+from .types import BuildWatchInfo
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 5.0
+# Polls back off from this interval to ``poll_interval``
+MIN_POLL_INTERVAL = 0.5
+# Seconds a finished watch stays readable before it is dropped
+DEFAULT_RETENTION = 600.0
+# Recent builds fetched per job and poll; older watched builds are looked up
+# one by one
+BUILDS_WINDOW = 20
+WATCHES_URI = "jenkins://watches"
+
+WatchKey = Tuple[str, str, int]
+
+
+@dataclass
+class _Watch:
+    """A watched build and the sessions to notify."""
+
+    server_name: str
+    job_full_name: str
+    build_number: int
+    status: Optional[BuildInfo] = None
+    error: Optional[str] = None
+    finished_at: Optional[float] = None
+    sessions: Set[Any] = field(default_factory=set)
+    watchers: int = 0
+
+    @property
+    def state(self) -> str:
+        """WATCHING, COMPLETED or ERROR."""
+        if self.finished_at is None:
+            return "WATCHING"
+        return "ERROR" if self.error else "COMPLETED"
+
+    def info(self) -> BuildWatchInfo:
+        """Snapshot of the watch."""
+        return {
+            "server_name": self.server_name,
+            "job_full_name": self.job_full_name,
+            "build_number": self.build_number,
+            "state": self.state,
+            "status": dict(self.status) if self.status else None,
+            "error": self.error,
+            "watchers": self.watchers,
+        }
+
+
+@dataclass
+class _Deadline:
+    """One registration's time limit on a watched build."""
+
+    key: WatchKey
+    # Monotonic time after which a still-running build ends this registration
+    deadline: float
+    error: str
+    session: Any = None
+
+
+class BuildWatcher:
+    """Poll many in-flight builds with one request per job.
+
+    Watches are grouped by (server, job); each poll fetches the job's recent
+    builds with a single ``builds[...]{0,N}`` tree query, however many of its
+    builds are watched. When a build completes, the MCP sessions that watch
+    it get a log notification and a ``jenkins://watches`` resource update.
+    The polling task runs on the event loop while any build is watched;
+    polls start ``MIN_POLL_INTERVAL`` apart and back off exponentially to
+    ``poll_interval``, and each new watch restarts the backoff so it is
+    checked soon.
+    """
+
+    def __init__(
+        self,
+        poll_interval: Optional[float] = None,
+        retention: Optional[float] = None,
+    ) -> None:
+        """Initialize build watcher.
+
+        Args:
+            poll_interval: Seconds between polls (defaults to config)
+            retention: Seconds finished watches are kept (defaults to config)
+        """
+        self._poll_interval = poll_interval
+        self._retention = retention
+        self._watches: Dict[WatchKey, _Watch] = {}
+        self._deadlines: List[_Deadline] = []
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._delay = MIN_POLL_INTERVAL
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @staticmethod
+    def _config() -> Dict[str, Any]:
+        """Get the ``build_watcher`` config section."""
+        return get_config().get("build_watcher") or {}
+
+    @property
+    def poll_interval(self) -> float:
+        """Seconds between polls."""
+        if self._poll_interval is not None:
+            return self._poll_interval
+        return float(self._config().get("poll_interval", DEFAULT_POLL_INTERVAL))
+
+    @property
+    def retention(self) -> float:
+        """Seconds finished watches stay readable."""
+        if self._retention is not None:
+            return self._retention
+        return float(self._config().get("retention", DEFAULT_RETENTION))
+
+    def watch(
+        self,
+        server_name: str,
+        job_full_name: str,
+        build_number: int,
+        session: Any = None,
+        timeout: Optional[float] = None,
+        timeout_error: Optional[str] = None,
+    ) -> BuildWatchInfo:
+        """Watch a build until it completes.
+
+        Must be called from the running event loop, which hosts the polling
+        task.
+
+        Args:
+            server_name: Jenkins server name
+            job_full_name: Full job name
+            build_number: Build number
+            session: MCP session to notify on completion
+            timeout: Seconds after which a still-running build ends this
+                registration with an error; other registrations of the build
+                keep watching it
+            timeout_error: Error reported when ``timeout`` expires
+
+        Returns:
+            Current state of the watch
+        """
+        key = (server_name, job_full_name, build_number)
+        watch = self._watches.get(key)
+        # A finished watch only stays around to be read; a new registration
+        # starts a fresh one
+        if watch is None or watch.finished_at is not None:
+            watch = self._watches[key] = _Watch(
+                server_name, job_full_name, build_number
+            )
+        watch.watchers += 1
+        if timeout is not None:
+            self._deadlines.append(
+                _Deadline(
+                    key,
+                    time.monotonic() + timeout,
+                    timeout_error or f"Timed out after {timeout}s",
+                    session,
+                )
+            )
+        elif session is not None:
+            watch.sessions.add(session)
+
+        self._delay = MIN_POLL_INTERVAL
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        elif self._wakeup is not None:
+            self._wakeup.set()
+        return watch.info()
+
+    def unwatch(
+        self,
+        server_name: str,
+        job_full_name: str,
+        build_number: int,
+        session: Any = None,
+    ) -> bool:
+        """Withdraw one registration of a build.
+
+        The build stays watched while other registrations remain.
+
+        Args:
+            server_name: Jenkins server name
+            job_full_name: Full job name
+            build_number: Build number
+            session: MCP session to stop notifying
+
+        Returns:
+            Whether the build was watched
+        """
+        key = (server_name, job_full_name, build_number)
+        watch = self._watches.get(key)
+        if watch is None:
+            return False
+        watch.watchers -= 1
+        watch.sessions.discard(session)
+        if watch.watchers <= 0:
+            del self._watches[key]
+        return True
+
+    def list(self, server_name: Optional[str] = None) -> List[BuildWatchInfo]:
+        """List watched builds.
+
+        Args:
+            server_name: Only this server's builds
+
+        Returns:
+            Watch states, in registration order
+        """
+        self._prune()
+        return [
+            watch.info()
+            for watch in self._watches.values()
+            if server_name is None or watch.server_name == server_name
+        ]
+
+    async def poll(self) -> List[BuildWatchInfo]:
+        """Poll every watched job once.
+
+        Returns:
+            Watches that finished and registrations that timed out during
+            this poll
+        """
+        jobs: Dict[Tuple[str, str], List[_Watch]] = defaultdict(list)
+        for watch in self._watches.values():
+            if watch.finished_at is None:
+                jobs[(watch.server_name, watch.job_full_name)].append(watch)
+
+        finished = await asyncio.gather(
+            *(self._poll_job(*job, watches) for job, watches in jobs.items())
+        )
+        results = []
+        for watch in (watch for watches in finished for watch in watches):
+            key = (watch.server_name, watch.job_full_name, watch.build_number)
+            sessions = set(watch.sessions)
+            for record in self._deadlines:
+                if record.key == key and record.session is not None:
+                    sessions.add(record.session)
+            info = watch.info()
+            await self._notify(sessions, info)
+            results.append(info)
+        results.extend(await self._expire())
+        self._prune()
+        return results
+
+    async def aclose(self) -> None:
+        """Stop polling and forget every watch."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._task = None
+        self._wakeup = None
+        self._watches.clear()
+        self._deadlines.clear()
+
+    async def _run(self) -> None:
+        """Poll until no build is left to watch."""
+        self._wakeup = asyncio.Event()
+        while any(watch.finished_at is None for watch in self._watches.values()):
+            try:
+                await self.poll()
+            except Exception as e:
+                logger.warning(f"Build watcher poll failed: {e}")
+            await self._sleep()
+
+    async def _sleep(self) -> None:
+        """Wait for the next poll, backing off up to ``poll_interval``.
+
+        A new watch cuts the wait short, but polls stay at least
+        ``MIN_POLL_INTERVAL`` apart however many watches arrive.
+        """
+        assert self._wakeup is not None
+        delay = min(self._delay, self.poll_interval)
+        self._delay = delay * 2
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            return
+        await asyncio.sleep(min(MIN_POLL_INTERVAL, self.poll_interval))
+
+    async def _poll_job(
+        self, server_name: str, job_full_name: str, watches: List[_Watch]
+    ) -> List[_Watch]:
+        """Poll one job's watched builds.
+
+        Returns:
+            Watches that finished
+        """
+        try:
+            client = AsyncJenkinsAPIClient(server_name)
+            builds = await client.get_recent_builds(job_full_name, BUILDS_WINDOW)
+        except (JenkinsServerNotFoundError, JenkinsJobNotFoundError) as e:
+            return [self._finish(watch, None, str(e)) for watch in watches]
+        except (JenkinsError, httpx.HTTPError) as e:
+            logger.warning(f"Failed to poll builds of {job_full_name}: {e}")
+            for watch in watches:
+                watch.error = str(e)
+            return []
+
+        by_number = {build["number"]: build for build in builds}
+        newest = max(by_number, default=0)
+        finished = []
+        for watch in watches:
+            status = by_number.get(watch.build_number)
+            if status is None and watch.build_number < newest:
+                # Older than the window (or deleted): look it up directly
+                try:
+                    status = await client.get_build_status(
+                        job_full_name, watch.build_number
+                    )
+                except JenkinsBuildNotFoundError as e:
+                    finished.append(self._finish(watch, None, str(e)))
+                    continue
+                except (JenkinsError, httpx.HTTPError) as e:
+                    watch.error = str(e)
+                    continue
+
+            # Builds not listed yet have not started
+            if status is None:
+                continue
+            watch.status = status
+            watch.error = None
+            if not status["building"]:
+                finished.append(self._finish(watch, status, None))
+        return finished
+
+    @staticmethod
+    def _finish(
+        watch: _Watch, status: Optional[BuildInfo], error: Optional[str]
+    ) -> _Watch:
+        """Mark a watch as finished."""
+        watch.status = status
+        watch.error = error
+        watch.finished_at = time.monotonic()
+        return watch
+
+    async def _expire(self) -> List[BuildWatchInfo]:
+        """End registrations whose deadline passed while the build runs.
+
+        Only the timed-out registration ends: its session is told the build
+        is still running, and the watch stays up while other registrations
+        remain.
+
+        Returns:
+            What each timed-out registration was told
+        """
+        now = time.monotonic()
+        expired = []
+        pending = []
+        for record in self._deadlines:
+            watch = self._watches.get(record.key)
+            # Registrations of finished or dropped watches are settled
+            if watch is None or watch.finished_at is not None:
+                continue
+            if now >= record.deadline:
+                expired.append((record, watch))
+            else:
+                pending.append(record)
+        self._deadlines = pending
+
+        results = []
+        for record, watch in expired:
+            watch.watchers -= 1
+            if watch.watchers <= 0:
+                self._finish(watch, watch.status, record.error)
+                info = watch.info()
+            else:
+                info = {**watch.info(), "state": "ERROR", "error": record.error}
+            if record.session is not None:
+                await self._notify({record.session}, info)
+            results.append(info)
+        return results
+
+    async def _notify(self, sessions: Set[Any], info: BuildWatchInfo) -> None:
+        """Tell sessions that a build finished.
+
+        Sessions that cannot be notified are dropped from ``sessions``.
+        """
+        for session in list(sessions):
+            try:
+                await session.send_log_message(
+                    level="warning" if info["error"] else "info",
+                    data={"event": "build_finished", **info},
+                    logger="jenkins.watcher",
+                )
+                await session.send_resource_updated(AnyUrl(WATCHES_URI))
+            except Exception as e:
+                logger.debug(f"Dropping session that cannot be notified: {e}")
+                sessions.discard(session)
+
+    def _prune(self) -> None:
+        """Drop watches that finished more than ``retention`` seconds ago."""
+        deadline = time.monotonic() - self.retention
+        for key, watch in list(self._watches.items()):
+            if watch.finished_at is not None and watch.finished_at < deadline:
+                del self._watches[key]
+
+
+# Global build watcher shared by all MCP sessions
+build_watcher = BuildWatcher()
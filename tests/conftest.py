@@ -17,3 +17,34 @@ mock_mcp = MagicMock()
 mock_mcp.tool = lambda: lambda func: func  # 返回原函数，不进行装饰
 sys.modules["jenkins.server"] = MagicMock()
 sys.modules["jenkins.server"].mcp = mock_mcp
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def reset_server_registry():
+    """每个测试前重置服务器注册表，避免缓存的服务器配置相互影响."""
+    from jenkins.tools.registry import server_registry
+
+    server_registry.invalidate()
+    yield
+    server_registry.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def reset_metadata_cache():
+    """每个测试前清空任务元数据缓存."""
+    from jenkins.tools.cache import metadata_cache
+
+    metadata_cache.clear()
+    yield
+    metadata_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def disable_log_cache(monkeypatch, tmp_path):
+    """默认关闭构建日志缓存，并将缓存目录指向临时目录."""
+    from jenkins.tools.log_cache import log_cache
+
+    monkeypatch.setattr(log_cache, "_enabled", False)
+    monkeypatch.setattr(log_cache, "_directory", str(tmp_path / "logs"))
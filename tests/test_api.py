@@ -0,0 +1,84 @@
+"""Jenkins API 共享辅助函数测试."""
+
+from jenkins.tools.api import batch_trigger_results
+from jenkins.tools.api import build_started_result
+from jenkins.tools.api import filter_queue_items
+from jenkins.tools.api import job_name_from_url
+from jenkins.tools.api import parameters_match
+from jenkins.tools.api import parse_queue_info
+from jenkins.tools.api import parse_queue_item
+
+
+class TestQueueHelpers:
+    """队列与参数辅助函数测试类."""
+
+    def test_job_name_from_url(self):
+        """测试从作业 URL 解析完整作业名."""
+        assert (
+            job_name_from_url("http://jenkins/ci/job/folder/job/my%20app/")
+            == "folder/my app"
+        )
+        assert job_name_from_url("http://jenkins/computer/agent/") is None
+
+    def test_parameters_match(self):
+        """测试按文本比较参数值."""
+        values = {"VERSION": "1.2.0", "DRY_RUN": True, "COUNT": 3}
+
+        assert parameters_match(values, {"VERSION": "1.2.0", "DRY_RUN": "true"})
+        assert parameters_match(values, {"COUNT": "3"})
+        assert not parameters_match(values, {"VERSION": "1.3.0"})
+        assert not parameters_match(values, {"MISSING": ""})
+
+    def test_parse_queue_item(self):
+        """测试解析队列项."""
+        item = parse_queue_item(
+            {
+                "id": 42,
+                "task": {"name": "app", "url": "http://jenkins/job/deploy/job/app/"},
+                "why": "Waiting for next available executor",
+                "inQueueSince": 1000,
+                "stuck": True,
+                "actions": [
+                    {},
+                    {"parameters": [{"name": "ENV", "value": "prod"}]},
+                ],
+            }
+        )
+
+        assert item["queue_id"] == 42
+        assert item["job_full_name"] == "deploy/app"
+        assert item["parameters"] == {"ENV": "prod"}
+        assert item["stuck"] is True
+        assert item["blocked"] is False
+
+    def test_filter_queue_items(self):
+        """测试按作业名前缀过滤队列项."""
+        items = [
+            parse_queue_item({"id": 1, "task": {"url": "http://j/job/deploy/job/a/"}}),
+            parse_queue_item({"id": 2, "task": {"url": "http://j/job/test/"}}),
+            parse_queue_item({"id": 3, "task": {"name": "part of pipeline"}}),
+        ]
+
+        assert [i["queue_id"] for i in filter_queue_items(items, "deploy/")] == [1]
+        assert filter_queue_items(items, "") == items
+
+    def test_batch_trigger_results(self):
+        """测试批量触发结果按输入顺序组装，重复排队项共享结果."""
+        builds = [("a", {}), ("b", {}), ("a", {}), ("c", {})]
+        submitted = [
+            (7, "q/7", None),
+            (None, "", "HTTP 500"),
+            (7, "q/7", None),
+            (None, "", None),
+        ]
+        queue_info = parse_queue_info({"executable": {"number": 3}}, 7)
+        started = {7: build_started_result(queue_info, "q/7")}
+
+        results = batch_trigger_results(builds, submitted, started)
+
+        assert [r["job_full_name"] for r in results] == ["a", "b", "a", "c"]
+        assert results[0]["result"]["build_number"] == 3
+        assert results[2]["result"] == results[0]["result"]
+        assert results[1] == {"job_full_name": "b", "result": None, "error": "HTTP 500"}
+        assert results[3]["result"]["status"] == "QUEUED"
+        assert results[3]["error"] is None
@@ -0,0 +1,956 @@
+"""异步 Jenkins API 客户端测试."""
+
+import asyncio
+import itertools
+import threading
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+from jenkins.tools.async_client import AsyncJenkinsAPIClient
+from jenkins.tools.exceptions import JenkinsBuildNotFoundError
+from jenkins.tools.exceptions import JenkinsError
+from jenkins.tools.exceptions import JenkinsParameterError
+from jenkins.tools.session import AsyncSessionPool
+
+MOCK_CONFIG = {
+    "name": "test-server",
+    "uri": "http://test.jenkins.com",
+    "user": "test-user",
+    "token": "test-token",
+}
+
+
+def run_with_client(handler, action):
+    """Run ``action(client)`` against a client served by ``handler``."""
+
+    async def main():
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[MOCK_CONFIG]
+        ):
+            client = AsyncJenkinsAPIClient("test-server")
+        client._http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client._http:
+            return await action(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncJenkinsAPIClient:
+    """异步 Jenkins API 客户端测试类."""
+
+    def test_get_job_info_with_parameters(self):
+        """测试获取任务信息及参数定义."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={
+                    "name": "test-job",
+                    "fullName": "folder/test-job",
+                    "url": "http://test.jenkins.com/job/folder/job/test-job/",
+                    "buildable": True,
+                    "color": "blue",
+                    "property": [
+                        {"parameterDefinitions": [{"name": "ENV", "type": "X"}]}
+                    ],
+                },
+            )
+
+        job_info = run_with_client(
+            handler,
+            lambda client: client.get_job_info("folder/test-job", True),
+        )
+
+        assert len(requests) == 1
+        assert requests[0].url.path == "/job/folder/job/test-job/api/json"
+        assert requests[0].headers["Authorization"].startswith("Basic ")
+        assert job_info["is_parameterized"] is True
+        assert job_info["parameters"][0]["name"] == "ENV"
+
+    def test_trigger_build_fetches_parameters_once(self):
+        """测试重复触发时参数定义只请求一次."""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == "/job/deploy/api/json":
+                return httpx.Response(
+                    200,
+                    json={"property": [{"parameterDefinitions": [{"name": "ENV"}]}]},
+                )
+            return httpx.Response(201)
+
+        async def trigger_twice(client):
+            for _ in range(2):
+                job_params = await client.get_job_parameters("deploy")
+                await client.trigger_build(
+                    "deploy", {"ENV": "prod"}, job_params=job_params
+                )
+
+        run_with_client(handler, trigger_twice)
+
+        assert paths.count("/job/deploy/api/json") == 1
+        assert paths.count("/job/deploy/buildWithParameters") == 2
+
+    def test_concurrent_identical_reads_coalesced(self):
+        """测试并发的相同读取共享一次上游请求."""
+        paths = []
+
+        async def handler(request):
+            paths.append(request.url.path)
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"number": 3, "building": True})
+
+        async def poll(client):
+            return await asyncio.gather(
+                *(client.get_build_status("failing-job", 3) for _ in range(10))
+            )
+
+        results = run_with_client(handler, poll)
+
+        assert len(paths) == 1
+        assert all(result["building"] for result in results)
+
+    def test_get_build_status_not_found(self):
+        """测试获取不存在的构建."""
+        with pytest.raises(JenkinsBuildNotFoundError):
+            run_with_client(
+                lambda request: httpx.Response(404),
+                lambda client: client.get_build_status("test-job", 999),
+            )
+
+    def test_trigger_build_waits_for_queue(self):
+        """测试触发构建并等待离开队列."""
+
+        def handler(request):
+            if request.url.path == "/job/test-job/build":
+                return httpx.Response(
+                    201,
+                    headers={"Location": "http://test.jenkins.com/queue/item/42/"},
+                )
+            if request.url.path == "/queue/item/42/api/json":
+                return httpx.Response(
+                    200, json={"executable": {"number": 5, "url": "http://x/5/"}}
+                )
+            return httpx.Response(404)
+
+        result = run_with_client(
+            handler,
+            lambda client: client.trigger_build("test-job", job_params=[]),
+        )
+
+        assert result["status"] == "BUILD_STARTED"
+        assert result["build_number"] == 5
+        assert result["queue_id"] == 42
+
+    def test_trigger_build_reports_queue_progress(self):
+        """测试排队期间快速轮询并报告进度."""
+        polls = []
+        progress = []
+
+        def handler(request):
+            if request.url.path == "/job/test-job/build":
+                return httpx.Response(
+                    201,
+                    headers={"Location": "http://test.jenkins.com/queue/item/42/"},
+                )
+            polls.append(request)
+            if len(polls) < 3:
+                return httpx.Response(200, json={"why": "Waiting for executor"})
+            return httpx.Response(200, json={"executable": {"number": 5}})
+
+        async def on_progress(elapsed, total, message):
+            progress.append((total, message))
+
+        result = run_with_client(
+            handler,
+            lambda client: client.trigger_build(
+                "test-job", job_params=[], max_wait=5, on_progress=on_progress
+            ),
+        )
+
+        assert result["status"] == "BUILD_STARTED"
+        assert len(polls) == 3
+        assert progress == [(5, "Waiting for executor")] * 2
+
+    def test_trigger_build_queue_timeout(self):
+        """测试超过最长等待时间后返回排队状态."""
+
+        def handler(request):
+            if request.url.path == "/job/test-job/build":
+                return httpx.Response(
+                    201,
+                    headers={"Location": "http://test.jenkins.com/queue/item/42/"},
+                )
+            return httpx.Response(200, json={"why": "Waiting for executor"})
+
+        result = run_with_client(
+            handler,
+            lambda client: client.trigger_build(
+                "test-job", job_params=[], max_wait=0.2
+            ),
+        )
+
+        assert result["status"] == "QUEUED"
+        assert result["queue_id"] == 42
+        assert "0.2 seconds" in result["message"]
+
+    def test_search_jobs_crawls_folders(self):
+        """测试异步搜索逐个文件夹抓取."""
+        pages = {
+            "/api/json": [
+                {"name": "release", "url": "u", "jobs": [{"name": "deploy"}]},
+                {"name": "build", "url": "u"},
+            ],
+            "/job/release/api/json": [{"name": "deploy", "url": "u"}],
+        }
+
+        def handler(request):
+            return httpx.Response(200, json={"jobs": pages[request.url.path]})
+
+        jobs = run_with_client(handler, lambda client: client.search_jobs("deploy"))
+
+        assert [job["fullName"] for job in jobs] == ["release/deploy"]
+
+    def test_network_error(self):
+        """测试网络错误转换为 JenkinsError."""
+
+        def handler(request):
+            raise httpx.ConnectError("Network error")
+
+        with pytest.raises(JenkinsError):
+            run_with_client(handler, lambda client: client.get_build_log("job", 1))
+
+
+class TestAsyncSessionPool:
+    """异步会话池测试类."""
+
+    def test_client_reused_per_server(self):
+        """测试同一事件循环内同一服务器复用客户端."""
+        pool = AsyncSessionPool(max_connections=4)
+
+        async def main():
+            first = pool.get_client("server-a")
+            second = pool.get_client("server-a")
+            other = pool.get_client("server-b")
+            await pool.aclose_all()
+            return first, second, other
+
+        first, second, other = asyncio.run(main())
+
+        assert first is second
+        assert first is not other
+        assert first.is_closed
+
+
+def progressive_text(log, building=False, requests=None):
+    """Emulate Jenkins' logText/progressiveText endpoint over ``log`` bytes."""
+
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        if request.url.path.endswith("/api/json"):
+            return httpx.Response(200, json={"number": 1, "building": building})
+        start = int(request.url.params.get("start", 0))
+        if start > len(log):
+            # Jenkins restarts from 0 when start is past the end
+            start = 0
+        headers = {"X-Text-Size": str(len(log))}
+        if building:
+            headers["X-More-Data"] = "true"
+        return httpx.Response(200, content=bytes(log[start:]), headers=headers)
+
+    return handler
+
+
+class TestAsyncBuildLog:
+    """异步构建日志读取测试类."""
+
+    LOG = b"".join(f"line {i}\n".encode() for i in range(1000))
+
+    def test_paged_reads(self):
+        """测试按页读取日志并返回下一页偏移量."""
+
+        async def read_all(client):
+            chunks = []
+            start = 0
+            while True:
+                chunk = await client.get_build_log("job", 1, start, max_bytes=1000)
+                chunks.append(chunk)
+                if not chunk["more_data"]:
+                    return chunks
+                start = chunk["offset"]
+
+        chunks = run_with_client(progressive_text(self.LOG), read_all)
+
+        assert "".join(chunk["text"] for chunk in chunks) == self.LOG.decode()
+        assert all(chunk["text"].endswith("\n") for chunk in chunks)
+        assert all(len(chunk["text"]) <= 1000 for chunk in chunks)
+        assert chunks[-1]["offset"] == len(self.LOG)
+
+    def test_running_build_reports_more_data(self):
+        """测试构建仍在运行时 more_data 为真."""
+        chunk = run_with_client(
+            progressive_text(b"building...\n", building=True),
+            lambda client: client.get_build_log("job", 1),
+        )
+
+        assert chunk["text"] == "building...\n"
+        assert chunk["offset"] == 12
+        assert chunk["more_data"] is True
+
+    def test_start_past_end_restarts(self):
+        """测试起始偏移超出日志大小时从头读取."""
+        chunk = run_with_client(
+            progressive_text(b"first\nsecond\n"),
+            lambda client: client.get_build_log("job", 1, start=100, max_bytes=20),
+        )
+
+        assert chunk == {
+            "text": "first\nsecond\n",
+            "start": 0,
+            "offset": 13,
+            "more_data": False,
+        }
+
+    def test_tail_lines_reads_only_the_end(self):
+        """测试读取日志末尾若干行，已知日志大小后只读取新增部分."""
+        requests = []
+        log = bytearray(b"".join(f"line {i}\n".encode() for i in range(20000)))
+
+        async def tail_twice(client):
+            first = await client.get_build_log("job", 1, tail_lines=3)
+            log.extend(b"line 20000\nline 20001\n")
+            second = await client.get_build_log("job", 1, tail_lines=3)
+            return first, second
+
+        first, second = run_with_client(
+            progressive_text(log, requests=requests), tail_twice
+        )
+
+        assert first["text"] == "line 19997\nline 19998\nline 19999\n"
+        assert log[first["start"] : first["offset"]] == first["text"].encode()
+        # No size probe: the first read streams the log once from the start
+        assert [int(r.url.params["start"]) for r in requests[:1]] == [0]
+        assert second["text"] == "line 19999\nline 20000\nline 20001\n"
+        assert second["offset"] == len(log)
+        # Then the last seen size is the start, and one window before it
+        starts = [int(r.url.params["start"]) for r in requests[1:]]
+        assert starts[0] == first["offset"]
+        assert len(starts) == 2
+        assert 0 < starts[1] < first["offset"]
+
+    def test_multibyte_characters_not_split(self):
+        """测试截断时不拆分多字节字符."""
+        chunk = run_with_client(
+            progressive_text("构建失败".encode()),
+            lambda client: client.get_build_log("job", 1, max_bytes=7),
+        )
+
+        assert chunk["text"] == "构建"
+        assert chunk["offset"] == 6
+        assert chunk["more_data"] is True
+
+    def test_search_build_log(self):
+        """测试流式搜索构建日志."""
+        result = run_with_client(
+            progressive_text(self.LOG),
+            lambda client: client.search_build_log(
+                "job", 1, r"^line 99\d$", context_lines=1, max_matches=2
+            ),
+        )
+
+        assert [m["line"] for m in result["matches"]] == ["line 990", "line 991"]
+        assert result["matches"][0]["context_before"] == ["line 989"]
+        assert result["matches"][1]["context_after"] == ["line 992"]
+        assert result["truncated"] is True
+
+
+    def test_build_failure_summary(self):
+        """测试流式提取构建失败片段."""
+        log = self.LOG + b"ERROR: script returned exit code 2\nFinished: FAILURE\n"
+
+        summary = run_with_client(
+            progressive_text(log),
+            lambda client: client.get_build_failure_summary("job", 1, context_lines=1),
+        )
+
+        assert summary["result"] == "FAILURE"
+        assert summary["excerpts"][0]["start_line"] == 1000
+        assert summary["excerpts"][0]["text"].splitlines() == [
+            "line 999",
+            "ERROR: script returned exit code 2",
+            "Finished: FAILURE",
+        ]
+
+
+class TestAsyncBuildLogCache:
+    """异步构建日志缓存测试类."""
+
+    LOG = b"".join(f"line {i}\n".encode() for i in range(1000))
+
+    @pytest.fixture(autouse=True)
+    def enable_log_cache(self, monkeypatch):
+        """开启构建日志缓存."""
+        from jenkins.tools.log_cache import log_cache
+
+        monkeypatch.setattr(log_cache, "_enabled", True)
+
+    def test_completed_log_cached_by_full_read(self):
+        """测试首次读取只按范围请求，完整读取后日志从磁盘读取."""
+        requests = []
+
+        async def read_four_times(client):
+            first = await client.get_build_log("job", 1, start=7, max_bytes=20)
+            found = await client.search_build_log("job", 1, "^line 500$")
+            tail = await client.get_build_log("job", 1, tail_lines=2)
+            page = await client.get_build_log("job", 1, start=7, max_bytes=20)
+            return first, found, tail, page
+
+        first, found, tail, page = run_with_client(
+            progressive_text(self.LOG, requests=requests), read_four_times
+        )
+
+        assert first == page
+        assert page["text"] == "line 1\nline 2\n"
+        assert page["offset"] == 21
+        assert found["matches"][0]["line_number"] == 501
+        assert tail["text"] == "line 998\nline 999\n"
+        assert tail["more_data"] is False
+        # A ranged read, then the search's full read fills the cache
+        assert [r.url.params["start"] for r in requests] == ["7", "0"]
+
+    def test_first_tail_read_fills_cache(self):
+        """测试首次读取末尾时完整流式读取的日志写入缓存."""
+        requests = []
+
+        async def tail_then_search(client):
+            tail = await client.get_build_log("job", 1, tail_lines=1)
+            found = await client.search_build_log("job", 1, "^line 3$")
+            return tail, found
+
+        tail, found = run_with_client(
+            progressive_text(self.LOG, requests=requests), tail_then_search
+        )
+
+        assert tail["text"] == "line 999\n"
+        assert found["matches"][0]["line_number"] == 4
+        assert len(requests) == 1
+
+    def test_partial_read_not_cached(self):
+        """测试提前结束的读取不写入缓存."""
+        requests = []
+
+        async def search_twice(client):
+            await client.search_build_log("job", 1, "^line", max_matches=1)
+            return await client.search_build_log("job", 1, "^line", max_matches=1)
+
+        found = run_with_client(
+            progressive_text(self.LOG, requests=requests), search_twice
+        )
+
+        assert found["matches"][0]["line_number"] == 1
+        assert len(requests) == 2
+
+    def test_compression_off_event_loop(self):
+        """测试写入缓存时的压缩和提交不在事件循环线程中执行."""
+        from jenkins.tools.log_cache import BLOCK_SIZE
+        from jenkins.tools.log_cache import LogCacheWriter
+
+        log = b"".join(f"line {i}\n".encode() for i in range(BLOCK_SIZE // 4))
+        threads = []
+        flush_block = LogCacheWriter._flush_block
+        commit = LogCacheWriter.commit
+
+        def record_flush(writer, block):
+            threads.append(threading.get_ident())
+            flush_block(writer, block)
+
+        def record_commit(writer):
+            threads.append(threading.get_ident())
+            commit(writer)
+
+        async def search_twice(client):
+            await client.search_build_log("job", 1, "^nothing$")
+            return await client.search_build_log("job", 1, "^line 3$")
+
+        with patch.object(LogCacheWriter, "_flush_block", record_flush):
+            with patch.object(LogCacheWriter, "commit", record_commit):
+                found = run_with_client(progressive_text(log), search_twice)
+
+        assert found["matches"][0]["line_number"] == 4
+        assert len(threads) > 2
+        assert threading.get_ident() not in threads
+
+    def test_running_build_not_cached(self):
+        """测试运行中构建的日志不缓存."""
+        requests = []
+
+        async def read_twice(client):
+            await client.get_build_log("job", 1)
+            return await client.get_build_log("job", 1)
+
+        chunk = run_with_client(
+            progressive_text(b"building...\n", building=True, requests=requests),
+            read_twice,
+        )
+
+        assert chunk["more_data"] is True
+        assert len([r for r in requests if "progressiveText" in r.url.path]) == 2
+
+
+def wfapi(requests=None):
+    """Emulate the Pipeline REST API of a build with a failed "Test" stage."""
+    resources = {
+        "/job/job/1/wfapi/describe": {
+            "id": "1",
+            "status": "FAILED",
+            "durationMillis": 5000,
+            "stages": [
+                {"id": "6", "name": "Build", "status": "SUCCESS"},
+                {"id": "12", "name": "Test", "status": "FAILED"},
+            ],
+        },
+        "/job/job/1/execution/node/12/wfapi/describe": {
+            "id": "12",
+            "name": "Test",
+            "stageFlowNodes": [
+                {"id": "13", "name": "Shell Script", "status": "SUCCESS"},
+                {"id": "14", "name": "Shell Script", "status": "FAILED"},
+            ],
+        },
+        "/job/job/1/execution/node/13/wfapi/log": {
+            "text": "setup ok\n",
+            "length": 9,
+            "hasMore": False,
+        },
+        "/job/job/1/execution/node/14/wfapi/log": {
+            "text": '<span class="timestamp">12:00</span> a &lt; b failed\n',
+            "length": 40,
+            "hasMore": True,
+        },
+    }
+
+    def handler(request):
+        if requests is not None:
+            requests.append(request)
+        if request.url.path not in resources:
+            return httpx.Response(404)
+        return httpx.Response(200, json=resources[request.url.path])
+
+    return handler
+
+
+class TestAsyncPipelineStages:
+    """异步流水线阶段测试类."""
+
+    def test_get_pipeline_stages(self):
+        """测试读取流水线阶段结构."""
+        run = run_with_client(
+            wfapi(), lambda client: client.get_pipeline_stages("job", 1)
+        )
+
+        assert run["status"] == "FAILED"
+        assert [(s["id"], s["name"], s["status"]) for s in run["stages"]] == [
+            ("6", "Build", "SUCCESS"),
+            ("12", "Test", "FAILED"),
+        ]
+
+    def test_get_stage_log_only_fetches_stage(self):
+        """测试只下载指定阶段中失败步骤的日志."""
+        requests = []
+
+        stage_log = run_with_client(
+            wfapi(requests),
+            lambda client: client.get_stage_log("job", 1, "Test", failed_only=True),
+        )
+
+        assert stage_log["stage"]["id"] == "12"
+        assert stage_log["steps"] == [
+            {
+                "id": "14",
+                "name": "Shell Script",
+                "status": "FAILED",
+                "parameter_description": "",
+                "text": "12:00 a < b failed\n",
+                "length": 40,
+                "has_more": True,
+            }
+        ]
+        assert [r.url.path for r in requests][-1] == (
+            "/job/job/1/execution/node/14/wfapi/log"
+        )
+        assert len(requests) == 3
+
+    def test_unknown_stage(self):
+        """测试阶段不存在."""
+        with pytest.raises(JenkinsParameterError, match="Build, Test"):
+            run_with_client(
+                wfapi(), lambda client: client.get_stage_log("job", 1, "Deploy")
+            )
+
+    def test_not_a_pipeline(self):
+        """测试非流水线构建."""
+        with pytest.raises(JenkinsError, match="Pipeline data not found"):
+            run_with_client(
+                wfapi(), lambda client: client.get_pipeline_stages("job", 2)
+            )
+
+
+class TestAsyncBatchBuildStatus:
+    """异步批量构建状态测试类."""
+
+    def test_results_in_order_with_item_errors(self):
+        """测试批量查询按输入顺序返回，单项失败不影响其他项."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            number = int(request.url.path.split("/")[-3])
+            if number == 999:
+                return httpx.Response(404)
+            assert request.url.params["tree"].startswith("number,result")
+            return httpx.Response(200, json={"number": number, "result": "SUCCESS"})
+
+        builds = [(f"deploy-{i}", i + 1) for i in range(30)] + [("missing", 999)]
+        results = run_with_client(
+            handler, lambda client: client.get_builds_status(builds)
+        )
+
+        assert [(r["job_full_name"], r["build_number"]) for r in results] == builds
+        assert [r["status"]["number"] for r in results[:30]] == list(range(1, 31))
+        assert all(r["error"] is None for r in results[:30])
+        assert results[30]["status"] is None
+        assert "not found" in results[30]["error"]
+        # Default max_connections
+        assert max_in_flight <= 10
+
+
+def refused_stop(building, requests):
+    """Jenkins refusing stop requests for a build that is ``building``."""
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/stop"):
+            return httpx.Response(403)
+        if request.url.path == "/job/deploy/7/api/json":
+            return httpx.Response(
+                200, json={"number": 7, "building": building, "result": None}
+            )
+        return httpx.Response(404)
+
+    return handler
+
+
+class TestAsyncStopBuild:
+    """异步停止构建测试类."""
+
+    def test_refused_stop_pending_confirmation(self):
+        """测试停止被拒绝且构建仍在运行时立即返回待确认状态."""
+        requests = []
+        result = run_with_client(
+            refused_stop(True, requests),
+            lambda client: client.stop_build("deploy", 7),
+        )
+
+        assert result == {"status": "STOP_PENDING_CONFIRMATION", "url": None}
+        assert requests.count("/job/deploy/7/api/json") == 1
+
+    def test_refused_stop_already_terminated(self):
+        """测试停止被拒绝但构建已结束."""
+        result = run_with_client(
+            refused_stop(False, []),
+            lambda client: client.stop_build("deploy", 7),
+        )
+
+        assert result["status"] == "ALREADY_TERMINATED"
+
+    def test_stop_redirect_is_success(self):
+        """测试 Jenkins 以重定向应答停止请求时视为已请求停止."""
+
+        def handler(request):
+            if request.url.path == "/job/deploy/7/stop":
+                return httpx.Response(
+                    302, headers={"Location": "http://j/job/deploy/7/"}
+                )
+            return httpx.Response(404)
+
+        result = run_with_client(handler, lambda client: client.stop_build("deploy", 7))
+
+        assert result["status"] == "STOP_REQUESTED"
+
+
+def jenkins_with_builds(requests):
+    """Jenkins serving folder ``deploy`` with jobs ``app`` and ``web``.
+
+    ``app`` runs builds 11 (started long ago, VERSION 1.0) and 12 (VERSION
+    2.0); ``web`` runs build 5. The queue holds one ``app`` item (VERSION
+    2.0) and one item of an unrelated job.
+    """
+    now = int(time.time() * 1000)
+
+    def build(number, building, started, version):
+        return {
+            "number": number,
+            "building": building,
+            "timestamp": started,
+            "actions": [{}, {"parameters": [{"name": "VERSION", "value": version}]}],
+        }
+
+    jobs = {
+        "/job/deploy/api/json": {
+            "jobs": [{"fullName": "deploy/app"}, {"fullName": "deploy/web"}]
+        },
+        "/job/deploy/job/app/api/json": {
+            "builds": [
+                build(12, True, now, "2.0"),
+                build(11, True, now - 3600_000, "1.0"),
+                build(10, False, now - 7200_000, "1.0"),
+            ]
+        },
+        "/job/deploy/job/web/api/json": {"builds": [build(5, True, now, "2.0")]},
+    }
+    queue = {
+        "items": [
+            {
+                "id": 100,
+                "task": {"name": "app", "url": "http://j/job/deploy/job/app/"},
+                "inQueueSince": now,
+                "actions": [{"parameters": [{"name": "VERSION", "value": "2.0"}]}],
+            },
+            {
+                "id": 101,
+                "task": {"name": "other", "url": "http://j/job/other/"},
+                "inQueueSince": now,
+            },
+        ]
+    }
+
+    def handler(request):
+        path = request.url.path
+        requests.append((request.method, path, dict(request.url.params)))
+        if path in jobs:
+            assert request.url.params["tree"].startswith("jobs[fullName],builds[")
+            return httpx.Response(200, json=jobs[path])
+        if path == "/queue/api/json":
+            return httpx.Response(200, json=queue)
+        if path == "/queue/cancelItem":
+            return httpx.Response(302, headers={"Location": "http://j/queue/"})
+        if path.endswith("/stop"):
+            return httpx.Response(302, headers={"Location": "http://j/"})
+        return httpx.Response(404)
+
+    return handler
+
+
+class TestAsyncBulkStop:
+    """异步批量停止测试类."""
+
+    def test_stops_folder_builds_and_queue(self):
+        """测试停止文件夹下所有运行中构建并先取消排队项."""
+        requests = []
+        result = run_with_client(
+            jenkins_with_builds(requests),
+            lambda client: client.stop_builds("deploy"),
+        )
+
+        assert result["jobs_scanned"] == 2
+        assert result["matched"] == 4
+        outcomes = {
+            (i["job_full_name"], i["build_number"], i["queue_id"]): i["status"]
+            for i in result["items"]
+        }
+        assert outcomes == {
+            ("deploy/app", None, 100): "CANCELLED",
+            ("deploy/app", 12, None): "STOP_REQUESTED",
+            ("deploy/app", 11, None): "STOP_REQUESTED",
+            ("deploy/web", 5, None): "STOP_REQUESTED",
+        }
+        posts = [
+            (path, params) for method, path, params in requests if method == "POST"
+        ]
+        assert posts[0] == ("/queue/cancelItem", {"id": "100"})
+        # One GET per job or folder, one for the queue
+        assert len([r for r in requests if r[0] == "GET"]) == 4
+
+    def test_filters_and_dry_run(self):
+        """测试按启动时间和参数过滤，演练模式不发送停止请求."""
+        requests = []
+        result = run_with_client(
+            jenkins_with_builds(requests),
+            lambda client: client.stop_builds(
+                "deploy", older_than=60, parameters={"VERSION": "1.0"}, dry_run=True
+            ),
+        )
+
+        assert [(i["job_full_name"], i["build_number"]) for i in result["items"]] == [
+            ("deploy/app", 11)
+        ]
+        assert result["items"][0]["status"] == "MATCHED"
+        assert all(method == "GET" for method, _, _ in requests)
+
+
+class TestAsyncQueue:
+    """异步构建队列测试类."""
+
+    def test_get_queue_single_request(self):
+        """测试一次请求获取整个队列."""
+        requests = []
+        items = run_with_client(
+            jenkins_with_builds(requests), lambda client: client.get_queue()
+        )
+
+        assert [(i["queue_id"], i["job_full_name"]) for i in items] == [
+            (100, "deploy/app"),
+            (101, "other"),
+        ]
+        assert items[0]["parameters"] == {"VERSION": "2.0"}
+        assert len(requests) == 1
+        assert requests[0][2]["tree"].startswith("items[id,task[name,url],why")
+
+    def test_cancel_queue_items(self):
+        """测试并发取消队列项，单项失败不影响其他项."""
+
+        def handler(request):
+            queue_id = request.url.params["id"]
+            if queue_id == "2":
+                return httpx.Response(404)
+            if queue_id == "3":
+                return httpx.Response(500)
+            return httpx.Response(302, headers={"Location": "http://j/queue/"})
+
+        results = run_with_client(
+            handler, lambda client: client.cancel_queue_items([1, 2, 3])
+        )
+
+        assert [(r["queue_id"], r["status"]) for r in results] == [
+            (1, "CANCELLED"),
+            (2, "NOT_FOUND"),
+            (3, "FAILED"),
+        ]
+        assert results[2]["error"]
+
+
+def jenkins_release(requests, in_flight=None):
+    """Serve jobs whose builds leave the queue before its second poll.
+
+    ``deploy`` needs a VERSION parameter, ``missing`` does not exist and
+    ``broken`` refuses to trigger.
+    """
+    queue = []
+    queue_ids = itertools.count(1)
+    queue_polls = 0
+    in_flight = in_flight if in_flight is not None else [0, 0]
+
+    async def handler(request):
+        nonlocal queue_polls
+        path = request.url.path
+        requests.append((request.method, path))
+        if path == "/queue/api/json":
+            queue_polls += 1
+            if queue_polls >= 2:
+                queue.clear()
+            items = [{"id": queue_id} for queue_id in queue]
+            return httpx.Response(200, json={"items": items})
+        if path.startswith("/queue/item/"):
+            queue_id = int(path.split("/")[3])
+            return httpx.Response(
+                200,
+                json={"executable": {"number": queue_id + 10, "url": f"b/{queue_id}"}},
+            )
+
+        job = path.split("/")[2]
+        if request.method == "GET":
+            if job == "missing":
+                return httpx.Response(404)
+            definitions = []
+            if job == "deploy":
+                definitions = [{"name": "VERSION", "type": "StringParameterDefinition"}]
+            return httpx.Response(
+                200, json={"property": [{"parameterDefinitions": definitions}]}
+            )
+
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight[1], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        if job == "broken":
+            return httpx.Response(500)
+        queue_id = next(queue_ids)
+        queue.append(queue_id)
+        return httpx.Response(
+            201, headers={"Location": f"http://j/queue/item/{queue_id}/"}
+        )
+
+    return handler
+
+
+class TestAsyncBatchTrigger:
+    """异步批量触发构建测试类."""
+
+    def test_triggers_and_waits_together(self):
+        """测试并发触发并共用队列轮询等待构建开始."""
+        requests = []
+        in_flight = [0, 0]
+        builds = [("deploy", {"VERSION": "1.2"}), ("broken", {})]
+        builds += [(f"service-{i}", {}) for i in range(12)]
+
+        results = run_with_client(
+            jenkins_release(requests, in_flight),
+            lambda client: client.trigger_builds(builds, max_wait=5),
+        )
+
+        assert [r["job_full_name"] for r in results] == [job for job, _ in builds]
+        assert results[1]["result"] is None
+        assert results[1]["error"]
+        started = [results[0]] + results[2:]
+        assert all(r["result"]["status"] == "BUILD_STARTED" for r in started)
+        assert all(
+            r["result"]["build_number"] == r["result"]["queue_id"] + 10
+            for r in started
+        )
+        assert ("POST", "/job/deploy/buildWithParameters") in requests
+        # One queue request per poll, single lookups only for departed items
+        assert requests.count(("GET", "/queue/api/json")) == 2
+        lookups = [path for _, path in requests if path.startswith("/queue/item/")]
+        assert len(lookups) == len(started)
+        # Default max_connections
+        assert in_flight[1] <= 10
+
+    def test_invalid_batch_triggers_nothing(self):
+        """测试任一项参数缺失或任务不存在时不触发任何构建."""
+        requests = []
+        builds = [("deploy", {}), ("missing", {}), ("service", {})]
+
+        with pytest.raises(JenkinsParameterError) as exc_info:
+            run_with_client(
+                jenkins_release(requests),
+                lambda client: client.trigger_builds(builds, max_wait=5),
+            )
+
+        message = str(exc_info.value)
+        assert message.startswith("2 of 3 builds cannot be triggered")
+        assert "deploy: " in message and "missing: " in message
+        assert exc_info.value.missing_params == ["deploy:VERSION"]
+        assert all(method == "GET" for method, _ in requests)
+
+    def test_timeout_reports_queued(self):
+        """测试等待超时的构建返回排队状态."""
+        requests = []
+        results = run_with_client(
+            jenkins_release(requests),
+            lambda client: client.trigger_builds([("service", {})], max_wait=0),
+        )
+
+        assert results[0]["result"]["status"] == "QUEUED"
+        assert results[0]["result"]["queue_id"]
+        assert "did not start within 0 seconds" in results[0]["result"]["message"]
@@ -0,0 +1,91 @@
+"""任务元数据缓存测试."""
+
+from unittest.mock import patch
+
+from jenkins.tools.cache import MetadataCache
+from jenkins.tools.cache import job_info_key
+from jenkins.tools.cache import parameters_key
+
+
+class TestMetadataCache:
+    """任务元数据缓存测试类."""
+
+    def test_entry_expires(self):
+        """测试缓存项过期后失效."""
+        cache = MetadataCache()
+        with patch("jenkins.tools.cache.time.monotonic", return_value=100.0):
+            cache.set("key", [{"name": "ENV"}], ttl=60)
+            assert cache.get("key") == [{"name": "ENV"}]
+
+        with patch("jenkins.tools.cache.time.monotonic", return_value=160.0):
+            assert cache.get("key") is None
+
+    def test_values_are_copied(self):
+        """测试修改返回值不影响缓存."""
+        cache = MetadataCache()
+        params = [{"name": "ENV", "choices": ["dev"]}]
+        cache.set("key", params, ttl=60)
+
+        params[0]["choices"].append("prod")
+        cache.get("key")[0]["name"] = "changed"
+
+        assert cache.get("key") == [{"name": "ENV", "choices": ["dev"]}]
+
+    def test_zero_ttl_disables_caching(self):
+        """测试 TTL 为 0 时不缓存."""
+        cache = MetadataCache()
+        cache.set("key", "value", ttl=0)
+
+        assert cache.get("key") is None
+
+    def test_invalidate(self):
+        """测试显式失效."""
+        cache = MetadataCache()
+        cache.set("key", "value", ttl=60)
+        cache.invalidate("key")
+
+        assert cache.get("key") is None
+
+    def test_lru_eviction_by_entries(self):
+        """测试超过条目上限时淘汰最久未使用的项."""
+        cache = MetadataCache(max_entries=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_lru_eviction_by_bytes(self):
+        """测试超过容量上限时淘汰."""
+        cache = MetadataCache(max_bytes=20)
+        cache.set("a", "x" * 10, ttl=60)
+        cache.set("b", "y" * 10, ttl=60)
+
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 12
+
+    def test_hit_miss_counters(self):
+        """测试命中与未命中计数."""
+        cache = MetadataCache()
+        cache.set("a", 1, ttl=60)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_invalidate_job(self):
+        """测试使任务相关缓存全部失效."""
+        cache = MetadataCache()
+        cache.set(job_info_key("s", "job"), {"name": "job"}, ttl=60)
+        cache.set(parameters_key("s", "job"), [], ttl=60)
+        cache.invalidate_job("s", "job")
+
+        assert cache.get(job_info_key("s", "job")) is None
+        assert cache.get(parameters_key("s", "job")) is None
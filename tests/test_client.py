@@ -25,7 +25,7 @@ class TestJenkinsAPIClient:
         }
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
             client = JenkinsAPIClient("test-server")
             assert client.server_name == "test-server"
@@ -33,7 +33,7 @@ class TestJenkinsAPIClient:
 
     def test_init_with_invalid_server(self):
         """测试使用无效服务器初始化客户端."""
-        with patch("jenkins.tools.client.get_jenkins_servers", return_value=[]):
+        with patch("jenkins.tools.registry.get_jenkins_servers", return_value=[]):
             with pytest.raises(JenkinsServerNotFoundError):
                 JenkinsAPIClient("nonexistent-server")
 
@@ -47,7 +47,7 @@ class TestJenkinsAPIClient:
         }
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
             client = JenkinsAPIClient("test-server")
 
@@ -59,7 +59,7 @@ class TestJenkinsAPIClient:
             url = client._build_job_url("folder/sub-folder/my-job")
             assert url == "http://test.jenkins.com/job/folder/job/sub-folder/job/my-job"
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_job_info_success(self, mock_request):
         """测试成功获取任务信息."""
         mock_config = {
@@ -83,20 +83,97 @@ class TestJenkinsAPIClient:
         mock_request.return_value = mock_response
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
-            with patch.object(
-                JenkinsAPIClient, "_is_job_parameterized", return_value=False
-            ):
-                client = JenkinsAPIClient("test-server")
-                job_info = client.get_job_info("test-job")
-
-                assert job_info["name"] == "test-job"
-                assert job_info["fullName"] == "test-job"
-                assert job_info["buildable"] is True
-                assert job_info["is_parameterized"] is False
-
-    @patch("requests.request")
+            client = JenkinsAPIClient("test-server")
+            job_info = client.get_job_info("test-job")
+
+            assert job_info["name"] == "test-job"
+            assert job_info["fullName"] == "test-job"
+            assert job_info["buildable"] is True
+            assert job_info["is_parameterized"] is False
+
+    @patch("requests.Session.request")
+    def test_get_job_info_cached(self, mock_request):
+        """测试任务信息与参数定义在缓存有效期内复用."""
+        mock_config = {
+            "name": "test-server",
+            "uri": "http://test.jenkins.com",
+            "user": "test-user",
+            "token": "test-token",
+        }
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "name": "test-job",
+            "property": [{"parameterDefinitions": [{"name": "ENV"}]}],
+        }
+        mock_request.return_value = mock_response
+
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
+        ):
+            client = JenkinsAPIClient("test-server")
+            first = client.get_job_info("test-job")
+            second = client.get_job_info("test-job", include_parameters=True)
+            params = client.get_job_parameters("test-job")
+
+        assert mock_request.call_count == 1
+        assert "parameters" not in first
+        assert second["parameters"] == params
+        assert params[0]["name"] == "ENV"
+
+    @patch("requests.Session.request")
+    def test_get_job_info_with_parameters_single_request(self, mock_request):
+        """测试一次请求同时获取任务信息和参数定义."""
+        mock_config = {
+            "name": "test-server",
+            "uri": "http://test.jenkins.com",
+            "user": "test-user",
+            "token": "test-token",
+        }
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "name": "deploy",
+            "fullName": "release/deploy",
+            "url": "http://test.jenkins.com/job/release/job/deploy/",
+            "buildable": True,
+            "color": "blue",
+            "lastBuild": {"number": 42, "url": "http://test.jenkins.com/42/"},
+            "property": [
+                {},
+                {
+                    "parameterDefinitions": [
+                        {
+                            "name": "ENV",
+                            "type": "ChoiceParameterDefinition",
+                            "defaultParameterValue": {"value": "dev"},
+                            "choices": ["dev", "prod"],
+                        },
+                        {"name": "VERSION", "type": "StringParameterDefinition"},
+                    ]
+                },
+            ],
+        }
+        mock_request.return_value = mock_response
+
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
+        ):
+            client = JenkinsAPIClient("test-server")
+            job_info = client.get_job_info("release/deploy", include_parameters=True)
+
+        assert mock_request.call_count == 1
+        assert job_info["is_parameterized"] is True
+        assert job_info["last_build_number"] == 42
+        assert [p["name"] for p in job_info["parameters"]] == ["ENV", "VERSION"]
+        assert job_info["parameters"][0]["choices"] == ["dev", "prod"]
+        assert job_info["parameters"][1]["default"] is None
+
+    @patch("requests.Session.request")
     def test_get_job_info_not_found(self, mock_request):
         """测试获取不存在的任务信息."""
         mock_config = {
@@ -112,14 +189,14 @@ class TestJenkinsAPIClient:
         mock_request.return_value = mock_response
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
             client = JenkinsAPIClient("test-server")
 
             with pytest.raises(JenkinsJobNotFoundError):
                 client.get_job_info("nonexistent-job")
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_build_status_success(self, mock_request):
         """测试成功获取构建状态."""
         mock_config = {
@@ -143,7 +220,7 @@ class TestJenkinsAPIClient:
         mock_request.return_value = mock_response
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
             client = JenkinsAPIClient("test-server")
             build_info = client.get_build_status("test-job", 123)
@@ -152,7 +229,7 @@ class TestJenkinsAPIClient:
             assert build_info["result"] == "SUCCESS"
             assert build_info["building"] is False
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
     def test_get_build_status_not_found(self, mock_request):
         """测试获取不存在的构建状态."""
         mock_config = {
@@ -168,14 +245,40 @@ class TestJenkinsAPIClient:
         mock_request.return_value = mock_response
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
             client = JenkinsAPIClient("test-server")
 
             with pytest.raises(JenkinsBuildNotFoundError):
                 client.get_build_status("test-job", 999)
 
-    @patch("requests.request")
+    @patch("requests.Session.request")
+    def test_get_build_log_success(self, mock_request):
+        """测试成功获取构建日志."""
+        mock_config = {
+            "name": "test-server",
+            "uri": "http://test.jenkins.com",
+            "user": "test-user",
+            "token": "test-token",
+        }
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.text = "Started by user\nFinished: SUCCESS\n"
+        mock_request.return_value = mock_response
+
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
+        ):
+            client = JenkinsAPIClient("test-server")
+            log = client.get_build_log("test-job", 123)
+
+            assert log.endswith("Finished: SUCCESS\n")
+            assert mock_request.call_args.kwargs["url"].endswith(
+                "/job/test-job/123/consoleText"
+            )
+
+    @patch("requests.Session.request")
     def test_make_request_network_error(self, mock_request):
         """测试网络错误处理."""
         mock_config = {
@@ -191,7 +294,7 @@ class TestJenkinsAPIClient:
         )
 
         with patch(
-            "jenkins.tools.client.get_jenkins_servers", return_value=[mock_config]
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
         ):
             client = JenkinsAPIClient("test-server")
 
@@ -202,3 +305,68 @@ class TestJenkinsAPIClient:
 
                 # 验证错误确实被记录了（但不会打印到控制台）
                 mock_logger.error.assert_called_once()
+
+    @patch("requests.Session.request")
+    def test_search_jobs_crawls_folders(self, mock_request):
+        """测试搜索任务逐个文件夹抓取并支持分页."""
+        mock_config = {
+            "name": "test-server",
+            "uri": "http://test.jenkins.com",
+            "user": "test-user",
+            "token": "test-token",
+        }
+
+        pages = {
+            "http://test.jenkins.com/api/json": [
+                {
+                    "name": "release",
+                    "url": "http://test.jenkins.com/job/release/",
+                    "jobs": [{"name": "deploy-api"}],
+                },
+                {"name": "build", "url": "http://test.jenkins.com/job/build/"},
+            ],
+            "http://test.jenkins.com/job/release/api/json": [
+                {
+                    "name": "deploy-api",
+                    "url": "http://test.jenkins.com/job/release/job/deploy-api/",
+                    "color": "blue",
+                    "buildable": True,
+                    "lastBuild": {"number": 7, "url": "http://x/7/"},
+                    "property": [{"parameterDefinitions": [{"name": "ENV"}]}],
+                },
+                {
+                    "name": "deploy-web",
+                    "url": "http://test.jenkins.com/job/release/job/deploy-web/",
+                    "color": "red",
+                    "buildable": True,
+                },
+            ],
+        }
+
+        def respond(method, url, **kwargs):
+            response = Mock()
+            response.status_code = 200
+            response.json.return_value = {"jobs": pages[url]}
+            return response
+
+        mock_request.side_effect = respond
+
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
+        ):
+            client = JenkinsAPIClient("test-server")
+            jobs = client.search_jobs("DEPLOY")
+            page = client.search_jobs("deploy", limit=1, offset=1)
+
+        # One request per folder and search
+        assert mock_request.call_count == 4
+        assert sorted(job["fullName"] for job in jobs) == [
+            "release/deploy-api",
+            "release/deploy-web",
+        ]
+        jobs_by_name = {job["fullName"]: job for job in jobs}
+        assert jobs_by_name["release/deploy-api"]["is_parameterized"] is True
+        assert jobs_by_name["release/deploy-api"]["last_build_number"] == 7
+        assert jobs_by_name["release/deploy-web"]["color"] == "red"
+        assert len(page) == 1
+
@@ -0,0 +1,64 @@
+"""配置缓存测试."""
+
+import os
+from unittest.mock import patch
+
+import jenkins.config as config_module
+from jenkins.config import ConfigStore
+
+
+def _write_config(path, server_name):
+    path.write_text(
+        "servers:\n"
+        f"  - name: {server_name}\n"
+        "    uri: http://jenkins.example.com\n"
+        "    user: user\n"
+        "    token: token\n",
+        encoding="utf-8",
+    )
+
+
+class TestConfigStore:
+    """配置存储测试类."""
+
+    def test_config_loaded_once(self, tmp_path):
+        """测试配置只加载一次."""
+        config_file = tmp_path / "config.yaml"
+        _write_config(config_file, "server-a")
+        store = ConfigStore(config_path=str(config_file), check_interval=0)
+
+        with patch.object(
+            config_module, "load_config", wraps=config_module.load_config
+        ) as mock_load:
+            first = store.get()
+            second = store.get()
+
+        assert first is second
+        assert mock_load.call_count == 1
+        assert first["servers"][0]["name"] == "server-a"
+
+    def test_reload_when_file_changes(self, tmp_path):
+        """测试配置文件修改后自动重新加载."""
+        config_file = tmp_path / "config.yaml"
+        _write_config(config_file, "server-a")
+        store = ConfigStore(config_path=str(config_file), check_interval=0)
+        first = store.snapshot()
+
+        _write_config(config_file, "server-b-renamed")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        second = store.snapshot()
+
+        assert second.generation == first.generation + 1
+        assert second.config["servers"][0]["name"] == "server-b-renamed"
+
+    def test_invalidate_forces_reload(self, tmp_path):
+        """测试显式失效后重新加载."""
+        config_file = tmp_path / "config.yaml"
+        _write_config(config_file, "server-a")
+        store = ConfigStore(config_path=str(config_file), check_interval=60)
+        first = store.snapshot()
+
+        store.invalidate()
+
+        assert store.snapshot().generation == first.generation + 1
@@ -0,0 +1,111 @@
+"""任务树抓取测试."""
+
+import threading
+from unittest.mock import Mock
+
+from jenkins.tools.crawler import JobTreeCrawler
+from jenkins.tools.exceptions import JenkinsJobNotFoundError
+
+
+def _job(full_name):
+    return {
+        "name": full_name.split("/")[-1],
+        "fullName": full_name,
+        "url": f"http://test.jenkins.com/job/{full_name}/",
+        "description": None,
+        "buildable": True,
+        "color": "blue",
+        "is_parameterized": False,
+        "last_build_number": None,
+        "last_build_url": None,
+    }
+
+
+def _client(tree):
+    """Build a fake client serving folder pages from ``{folder: [child, ...]}``."""
+
+    def get_folder_jobs(folder_full_name, start, end):
+        if folder_full_name not in tree:
+            raise JenkinsJobNotFoundError(folder_full_name, "test-server")
+        prefix = f"{folder_full_name}/" if folder_full_name else ""
+        return [
+            (_job(prefix + name), bool(tree.get(prefix + name)))
+            for name in tree[folder_full_name][start:end]
+        ]
+
+    client = Mock()
+    client.get_folder_jobs.side_effect = get_folder_jobs
+    return client
+
+
+class TestJobTreeCrawler:
+    """任务树抓取测试类."""
+
+    def test_crawl_unbounded_depth(self):
+        """测试抓取超过四层的组织文件夹."""
+        client = _client(
+            {
+                "": ["org", "build"],
+                "org": ["repo"],
+                "org/repo": ["main", "PR-1"],
+                "org/repo/PR-1": ["stage"],
+                "org/repo/PR-1/stage": ["deploy"],
+            }
+        )
+
+        jobs = JobTreeCrawler(client, max_workers=2).crawl()
+
+        assert sorted(job["fullName"] for job in jobs) == [
+            "build",
+            "org",
+            "org/repo",
+            "org/repo/PR-1",
+            "org/repo/PR-1/stage",
+            "org/repo/PR-1/stage/deploy",
+            "org/repo/main",
+        ]
+
+    def test_crawl_pages_large_folders(self):
+        """测试大文件夹按页抓取."""
+        client = _client({"": [f"job-{i}" for i in range(5)]})
+
+        jobs = list(JobTreeCrawler(client, page_size=2).crawl())
+
+        assert len(jobs) == 5
+        assert [call.args for call in client.get_folder_jobs.call_args_list] == [
+            ("", 0, 2),
+            ("", 2, 4),
+            ("", 4, 6),
+        ]
+
+    def test_crawl_yields_pages_as_they_arrive(self):
+        """测试大文件夹的第一页到达后立即产出，不等待后续页."""
+        first_page_yielded = threading.Event()
+
+        def get_folder_jobs(folder_full_name, start, end):
+            # The second page only completes once the first one was consumed
+            if start:
+                assert first_page_yielded.wait(1)
+            return [(_job(f"job-{i}"), False) for i in range(start, min(end, 3))]
+
+        client = Mock()
+        client.get_folder_jobs.side_effect = get_folder_jobs
+        jobs = JobTreeCrawler(client, page_size=2).crawl()
+
+        first = [next(jobs)["fullName"], next(jobs)["fullName"]]
+        first_page_yielded.set()
+
+        assert first == ["job-0", "job-1"]
+        assert [job["fullName"] for job in jobs] == ["job-2"]
+
+    def test_crawl_skips_vanished_folder(self):
+        """测试抓取期间被删除的文件夹被跳过."""
+        client = _client({"": ["gone", "build"], "build": []})
+        client.get_folder_jobs.side_effect = [
+            [(_job("gone"), True), (_job("build"), False)],
+            JenkinsJobNotFoundError("gone", "test-server"),
+        ]
+
+        jobs = list(JobTreeCrawler(client, max_workers=1).crawl())
+
+        assert [job["fullName"] for job in jobs] == ["gone", "build"]
@@ -0,0 +1,76 @@
+"""服务器线程池测试."""
+
+import asyncio
+import threading
+
+import pytest
+from jenkins.tools.exceptions import JenkinsServerBusyError
+from jenkins.tools.executor import ServerExecutorPool
+
+
+class TestServerExecutorPool:
+    """服务器线程池测试类."""
+
+    def test_runs_on_worker_thread(self):
+        """测试阻塞调用在工作线程中执行."""
+        pool = ServerExecutorPool(workers=2, max_queue=0)
+
+        async def main():
+            return await pool.run("server-a", threading.current_thread)
+
+        try:
+            thread = asyncio.run(main())
+        finally:
+            pool.shutdown()
+
+        assert thread is not threading.main_thread()
+        assert thread.name.startswith("jenkins-server-a")
+
+    def test_rejects_when_saturated(self):
+        """测试线程和队列占满时立即拒绝，其他服务器不受影响."""
+        pool = ServerExecutorPool(workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def main():
+            blocked = [
+                asyncio.ensure_future(pool.run("slow", release.wait))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            with pytest.raises(JenkinsServerBusyError, match="slow"):
+                await pool.run("slow", release.wait)
+            other = await pool.run("fast", lambda: "ok")
+            release.set()
+            await asyncio.gather(*blocked)
+            return other
+
+        try:
+            assert asyncio.run(main()) == "ok"
+            stats = pool.stats()["servers"]
+        finally:
+            pool.shutdown()
+
+        assert stats["slow"] == {
+            "workers": 1,
+            "pending": 0,
+            "completed": 2,
+            "rejected": 1,
+        }
+        assert stats["fast"]["completed"] == 1
+
+    def test_slot_freed_after_error(self):
+        """测试调用失败后释放槽位并传递异常."""
+        pool = ServerExecutorPool(workers=1, max_queue=0)
+
+        def fail():
+            raise ValueError("boom")
+
+        async def main():
+            with pytest.raises(ValueError, match="boom"):
+                await pool.run("server-a", fail)
+            return await pool.run("server-a", lambda: 42)
+
+        try:
+            assert asyncio.run(main()) == 42
+        finally:
+            pool.shutdown()
@@ -0,0 +1,138 @@
+"""任务索引测试."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from jenkins.tools.job_index import JobIndex
+
+
+def _job(full_name, color="blue"):
+    return {
+        "name": full_name.split("/")[-1],
+        "fullName": full_name,
+        "url": f"http://test.jenkins.com/job/{full_name}/",
+        "description": None,
+        "buildable": True,
+        "color": color,
+        "is_parameterized": False,
+        "last_build_number": None,
+        "last_build_url": None,
+    }
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    """任务索引数据库路径."""
+    return str(tmp_path / "jobs.sqlite3")
+
+
+class TestJobIndex:
+    """任务索引测试类."""
+
+    def test_first_search_crawls_once(self, index_path):
+        """测试首次搜索同步抓取，后续搜索直接读取索引."""
+        index = JobIndex(index_path, refresh_interval=300)
+        crawl = Mock(return_value=[_job("release/deploy-api"), _job("build")])
+
+        first = index.search("server-a", "deploy", crawl)
+        second = index.search("server-a", "DEPLOY", crawl, limit=1)
+
+        assert crawl.call_count == 1
+        assert [job["fullName"] for job in first] == ["release/deploy-api"]
+        assert second == first
+        assert index.get_job("server-a", "build", crawl)["name"] == "build"
+
+    def test_index_persisted_across_instances(self, index_path):
+        """测试索引在重启后从磁盘加载."""
+        JobIndex(index_path, refresh_interval=300).refresh(
+            "server-a", lambda: [_job("deploy")]
+        )
+
+        crawl = Mock(return_value=[])
+        restored = JobIndex(index_path, refresh_interval=300)
+
+        assert restored.get_job("server-a", "deploy", crawl)["fullName"] == "deploy"
+        crawl.assert_not_called()
+
+    def test_refresh_applies_only_changes(self, index_path):
+        """测试增量刷新只写入变化的任务."""
+        index = JobIndex(index_path, refresh_interval=300)
+        index.refresh("server-a", lambda: [_job("a"), _job("b"), _job("c")])
+
+        changed = index.refresh(
+            "server-a", lambda: [_job("a"), _job("b", color="red"), _job("d")]
+        )
+
+        # b updated, d inserted, c removed
+        assert changed == 3
+        assert index.get_job("server-a", "c", Mock()) is None
+        assert index.get_job("server-a", "b", Mock())["color"] == "red"
+
+    def test_stale_index_refreshed_in_background(self, index_path):
+        """测试过期索引先返回旧数据并在后台刷新."""
+        index = JobIndex(index_path, refresh_interval=0)
+        index.refresh("server-a", lambda: [_job("old-job")])
+        crawl = Mock(return_value=[_job("new-job")])
+
+        stale = index.search("server-a", "job", crawl)
+        for _ in range(100):
+            if index.get_job("server-a", "new-job", crawl):
+                break
+            time.sleep(0.01)
+
+        assert [job["fullName"] for job in stale] == ["old-job"]
+        assert crawl.called
+
+    def test_lookup_without_wait_crawls_in_background(self, index_path):
+        """测试未建立索引时单项查询不阻塞，抓取在后台进行."""
+        index = JobIndex(index_path, refresh_interval=300)
+        release = threading.Event()
+        crawled = []
+
+        def crawl():
+            release.wait(5)
+            crawled.append(True)
+            return [_job("deploy")]
+
+        assert index.get_job("server-a", "deploy", crawl, wait=False) is None
+        assert index.get_job("server-a", "deploy", crawl, wait=False) is None
+        release.set()
+        for _ in range(100):
+            if index.get_job("server-a", "deploy", crawl, wait=False):
+                break
+            time.sleep(0.01)
+
+        assert index.get_job("server-a", "deploy", crawl)["fullName"] == "deploy"
+        assert crawled == [True]
+
+    def test_concurrent_first_searches_crawl_once(self, index_path):
+        """测试未建立索引时并发的首次搜索只抓取一次."""
+        index = JobIndex(index_path, refresh_interval=300)
+        release = threading.Event()
+        crawled = []
+
+        def crawl():
+            crawled.append(True)
+            release.wait(5)
+            return [_job("deploy")]
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(index.search("server-a", "deploy", crawl))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert crawled == [True]
+        assert [[job["fullName"] for job in found] for found in results] == [
+            ["deploy"]
+        ] * 4
@@ -0,0 +1,81 @@
+"""构建日志磁盘缓存测试."""
+
+import os
+
+from jenkins.tools.log_cache import BLOCK_SIZE
+from jenkins.tools.log_cache import LogCache
+from jenkins.tools.log_cache import log_key
+
+LOG = b"".join(f"line {i}\n".encode() for i in range(100000))
+
+
+def store(cache, build_number, data=LOG):
+    """Cache ``data`` as the log of ``job`` #``build_number``."""
+    writer = cache.writer("server", "job", build_number)
+    for i in range(0, len(data), 10000):
+        writer.write(data[i : i + 10000])
+    writer.commit()
+
+
+class TestLogCache:
+    """构建日志磁盘缓存测试类."""
+
+    def test_range_reads_across_blocks(self, tmp_path):
+        """测试跨压缩块的范围读取."""
+        cache = LogCache(str(tmp_path))
+        store(cache, 1)
+
+        with cache.open("server", "job", 1) as cached:
+            assert cached.size == len(LOG)
+            assert cached.read(0, 10) == LOG[:10]
+            boundary = LOG[BLOCK_SIZE - 5 : BLOCK_SIZE + 5]
+            assert cached.read(BLOCK_SIZE - 5, 10) == boundary
+            assert cached.read(len(LOG) - 5, 100) == LOG[-5:]
+            assert cached.read(len(LOG) + 1, 10) == b""
+            assert b"".join(cached.iter_blocks()) == LOG
+            tail = b"".join(cached.iter_blocks(BLOCK_SIZE + 3))
+            assert tail == LOG[BLOCK_SIZE + 3 :]
+
+        # Stored compressed
+        assert cache.stats()["bytes"] < len(LOG) / 2
+
+    def test_empty_log(self, tmp_path):
+        """测试缓存空日志."""
+        cache = LogCache(str(tmp_path))
+        store(cache, 1, b"")
+
+        with cache.open("server", "job", 1) as cached:
+            assert cached.size == 0
+            assert cached.read(0, 10) == b""
+            assert list(cached.iter_blocks()) == []
+
+    def test_miss_and_abort(self, tmp_path):
+        """测试未缓存或中止写入的日志不可见."""
+        cache = LogCache(str(tmp_path))
+        writer = cache.writer("server", "job", 1)
+        writer.write(b"partial")
+        writer.abort()
+
+        assert cache.open("server", "job", 1) is None
+        assert os.listdir(tmp_path) == []
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self, tmp_path):
+        """测试超过磁盘上限时淘汰最久未读的日志."""
+        cache = LogCache(str(tmp_path))
+        store(cache, 1)
+        store(cache, 2)
+        entry_size = cache.stats()["bytes"] // 2
+        index_path = tmp_path / f"{log_key('server', 'job', 1)}.json"
+        os.utime(index_path, (0, 0))
+        # Reading build 1 makes build 2 the least recently read
+        cache.open("server", "job", 1).close()
+        assert index_path.stat().st_mtime > 0
+
+        cache._max_bytes = entry_size * 2 + entry_size // 2
+        store(cache, 3)
+
+        assert cache.open("server", "job", 2) is None
+        assert cache.open("server", "job", 1) is not None
+        assert cache.open("server", "job", 3) is not None
+        assert cache.stats()["evictions"] == 1
@@ -0,0 +1,84 @@
+"""构建日志搜索测试."""
+
+import pytest
+from jenkins.tools.exceptions import JenkinsParameterError
+from jenkins.tools.log_search import MAX_LINE_CHARS
+from jenkins.tools.log_search import LineScanner
+from jenkins.tools.log_search import LogSearcher
+
+
+def search(pattern, data, chunk_size=None, **kwargs):
+    """Feed ``data`` to a searcher, ``chunk_size`` bytes at a time."""
+    searcher = LogSearcher(pattern, **kwargs)
+    chunk_size = chunk_size or len(data) or 1
+    for i in range(0, len(data), chunk_size):
+        searcher.feed(data[i : i + chunk_size])
+        if searcher.done:
+            return searcher.result(complete=False)
+    return searcher.result(complete=True)
+
+
+class TestLogSearcher:
+    """构建日志搜索器测试类."""
+
+    LOG = b"".join(f"step {i}\n".encode() for i in range(10)) + b"ERROR: boom\nend"
+
+    def test_match_with_context(self):
+        """测试返回匹配行号及上下文."""
+        result = search("ERROR", self.LOG, context_lines=2)
+
+        assert result["matches"] == [
+            {
+                "line_number": 11,
+                "line": "ERROR: boom",
+                "context_before": ["step 8", "step 9"],
+                "context_after": ["end"],
+            }
+        ]
+        assert result["truncated"] is False
+        assert result["lines_scanned"] == 12
+        assert result["bytes_scanned"] == len(self.LOG)
+
+    def test_lines_split_across_chunks(self):
+        """测试跨数据块的行也能匹配."""
+        for chunk_size in (1, 3, 7):
+            result = search("ERROR: boom", self.LOG, chunk_size=chunk_size)
+            assert [m["line_number"] for m in result["matches"]] == [11]
+
+    def test_multibyte_characters_split_across_chunks(self):
+        """测试多字节字符被拆分到不同数据块时正确解码."""
+        result = search("构建失败", "开始\n构建失败\n".encode(), chunk_size=1)
+
+        assert result["matches"][0]["line"] == "构建失败"
+        assert result["matches"][0]["context_before"] == ["开始"]
+
+    def test_stops_at_max_matches(self):
+        """测试达到最大匹配数后停止读取."""
+        result = search("step", self.LOG, chunk_size=8, max_matches=3, context_lines=1)
+
+        assert [m["line"] for m in result["matches"]] == ["step 0", "step 1", "step 2"]
+        assert result["matches"][-1]["context_after"] == ["step 3"]
+        assert result["truncated"] is True
+        assert result["bytes_scanned"] < len(self.LOG)
+
+    def test_long_lines_truncated(self):
+        """测试超长行被截断."""
+        data = b"x" * (MAX_LINE_CHARS * 3) + b"\nERROR\n"
+        result = search("ERROR", data, chunk_size=1000, context_lines=1)
+
+        assert result["matches"][0]["line_number"] == 2
+        assert len(result["matches"][0]["context_before"][0]) == MAX_LINE_CHARS
+
+    def test_invalid_pattern(self):
+        """测试非法正则表达式."""
+        with pytest.raises(JenkinsParameterError):
+            LogSearcher("(unclosed")
+
+    def test_scanner_without_scan_rejected(self):
+        """测试未实现 _scan 的扫描器在创建时即报错."""
+
+        class Incomplete(LineScanner):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
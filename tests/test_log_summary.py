@@ -0,0 +1,127 @@
+"""构建失败摘要测试."""
+
+from jenkins.tools.log_summary import FailureSummarizer
+from jenkins.tools.log_summary import format_failure_summary
+
+PIPELINE_LOG = "\n".join(
+    [
+        "Started by user admin",
+        "[Pipeline] stage",
+        "[Pipeline] { (Checkout)",
+        *[f"checkout step {i}" for i in range(50)],
+        "[Pipeline] }",
+        "[Pipeline] stage",
+        "[Pipeline] { (Test)",
+        "Running tests",
+        "java.lang.IllegalStateException: database unavailable",
+        "\tat com.example.Db.connect(Db.java:42)",
+        "\tat com.example.App.main(App.java:7)",
+        "Caused by: java.net.ConnectException: refused",
+        "\t... 3 more",
+        *[f"cleanup step {i}" for i in range(50)],
+        "ERROR: script returned exit code 1",
+        "[Pipeline] }",
+        "Finished: FAILURE",
+    ]
+).encode()
+
+
+def summarize(data, chunk_size=None, **kwargs):
+    """Summarize ``data`` fed ``chunk_size`` bytes at a time."""
+    chunk_size = chunk_size or len(data)
+    blocks = (data[i : i + chunk_size] for i in range(0, len(data), chunk_size))
+    return FailureSummarizer(**kwargs).summarize(blocks)
+
+
+class TestFailureSummarizer:
+    """构建失败摘要测试类."""
+
+    def test_extracts_exception_with_stack_trace(self):
+        """测试提取异常及完整堆栈."""
+        summary = summarize(PIPELINE_LOG, chunk_size=7, context_lines=1)
+
+        first = summary["excerpts"][0]
+        assert first["kind"] == "exception"
+        assert first["stage"] == "Test"
+        assert first["text"].splitlines() == [
+            "Running tests",
+            "java.lang.IllegalStateException: database unavailable",
+            "\tat com.example.Db.connect(Db.java:42)",
+            "\tat com.example.App.main(App.java:7)",
+            "Caused by: java.net.ConnectException: refused",
+            "\t... 3 more",
+            "cleanup step 0",
+        ]
+        assert (first["start_line"], first["end_line"]) == (57, 63)
+        assert summary["failed_stage"] == "Test"
+        assert summary["stages"] == ["Checkout", "Test"]
+        assert summary["result"] == "FAILURE"
+
+    def test_final_failure_markers(self):
+        """测试提取末尾的失败标记."""
+        summary = summarize(PIPELINE_LOG, context_lines=1)
+
+        last = summary["excerpts"][-1]
+        assert last["text"].splitlines() == [
+            "cleanup step 49",
+            "ERROR: script returned exit code 1",
+            "[Pipeline] }",
+            "Finished: FAILURE",
+        ]
+        assert len(summary["excerpts"]) == 2
+
+    def test_keeps_first_and_latest_excerpts(self):
+        """测试只保留第一个和最近的若干个片段."""
+        log = "\n".join(f"ERROR: failure {i}\nok" for i in range(10)).encode()
+
+        summary = summarize(log, context_lines=0, max_excerpts=3)
+
+        assert [e["text"] for e in summary["excerpts"]] == [
+            "ERROR: failure 0",
+            "ERROR: failure 8",
+            "ERROR: failure 9",
+        ]
+        assert summary["omitted_excerpts"] == 7
+
+    def test_byte_budget(self):
+        """测试摘要总大小不超过预算."""
+        log = "\n".join(f"ERROR: {'x' * 500} {i}\nok" for i in range(10)).encode()
+
+        summary = summarize(log, context_lines=0, max_excerpts=10, max_bytes=1500)
+
+        assert sum(len(e["text"]) for e in summary["excerpts"]) <= 1500 + 10
+        assert summary["excerpts"][0]["text"].endswith(" 0")
+        assert summary["excerpts"][-1]["text"].endswith(" 9")
+
+    def test_failed_stage_ignores_tolerated_errors(self):
+        """测试失败阶段取自失败步骤所在阶段，而非第一个错误所在阶段."""
+        log = "\n".join(
+            [
+                "[Pipeline] { (Lint)",
+                "ERROR: lint warning (ignored)",
+                "[Pipeline] }",
+                "[Pipeline] { (Test)",
+                "ERROR: 3 tests failed",
+                "ERROR: script returned exit code 1",
+                "[Pipeline] }",
+                "[Pipeline] { (Declarative: Post Actions)",
+                "ERROR: failed to archive reports",
+                "[Pipeline] }",
+                "Finished: FAILURE",
+            ]
+        ).encode()
+
+        summary = summarize(log, context_lines=0)
+
+        assert summary["excerpts"][0]["stage"] == "Lint"
+        assert summary["failed_stage"] == "Test"
+
+    def test_successful_build(self):
+        """测试成功构建没有失败片段."""
+        summary = summarize(b"building\nall good\nFinished: SUCCESS\n")
+
+        assert summary["excerpts"] == []
+        assert summary["result"] == "SUCCESS"
+        assert format_failure_summary(summary) == (
+            "No failure markers found (result: SUCCESS)."
+        )
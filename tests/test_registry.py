@@ -0,0 +1,108 @@
+"""服务器注册表测试."""
+
+import base64
+from unittest.mock import patch
+
+import pytest
+from jenkins.config import ConfigStore
+from jenkins.config import get_jenkins_servers
+from jenkins.tools.exceptions import JenkinsConfigurationError
+from jenkins.tools.exceptions import JenkinsServerNotFoundError
+from jenkins.tools.mcp_tools import validate_jenkins_config
+from jenkins.tools.registry import ServerRegistry
+
+
+@pytest.fixture
+def store(tmp_path):
+    """创建包含两个服务器的配置存储."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(
+        "servers:\n"
+        "  - name: server-a\n"
+        "    uri: http://a.jenkins.com/\n"
+        "    user: alice\n"
+        "    tokenEnv: SERVER_A_TOKEN\n"
+        "  - name: server-b\n"
+        "    uri: http://b.jenkins.com\n"
+        "    user: bob\n"
+        "    token: plain-token\n",
+        encoding="utf-8",
+    )
+    return ConfigStore(config_path=str(config_file), check_interval=60)
+
+
+class TestServerRegistry:
+    """服务器注册表测试类."""
+
+    def test_lookup_by_name(self, store, monkeypatch):
+        """测试按名称查找并解析 tokenEnv."""
+        monkeypatch.setenv("SERVER_A_TOKEN", "env-token")
+        registry = ServerRegistry(store)
+
+        client = registry.get("server-a")
+
+        assert client.base_url == "http://a.jenkins.com"
+        assert client.auth == ("alice", "env-token")
+        expected = base64.b64encode(b"alice:env-token").decode()
+        assert client.authorization == f"Basic {expected}"
+        assert registry.names() == ["server-a", "server-b"]
+
+    def test_entries_built_once(self, store):
+        """测试配置未变化时不重复构建注册表."""
+        registry = ServerRegistry(store)
+
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers",
+            wraps=get_jenkins_servers,
+        ) as mock_servers:
+            first = registry.get("server-b")
+            second = registry.get("server-b")
+
+        assert first is second
+        assert mock_servers.call_count == 1
+
+    def test_unknown_server(self, store):
+        """测试未知服务器抛出异常."""
+        registry = ServerRegistry(store)
+
+        with pytest.raises(JenkinsServerNotFoundError):
+            registry.get("missing")
+
+    def test_malformed_server_fails_alone(self, tmp_path):
+        """测试缺少 uri 的服务器只影响自身查找，校验仍逐字段报告."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "servers:\n"
+            "  - name: good\n"
+            "    uri: http://good.jenkins.com\n"
+            "    user: alice\n"
+            "    token: token\n"
+            "  - name: bad\n"
+            "    user: bob\n"
+            "    token: token\n",
+            encoding="utf-8",
+        )
+        registry = ServerRegistry(
+            ConfigStore(config_path=str(config_file), check_interval=60)
+        )
+
+        assert registry.get("good").base_url == "http://good.jenkins.com"
+        assert registry.names() == ["good", "bad"]
+        with pytest.raises(JenkinsConfigurationError, match="missing field: uri"):
+            registry.get("bad")
+
+        with patch("jenkins.tools.mcp_tools.server_registry", registry), patch(
+            "jenkins.tools.scenarios.server_registry", registry
+        ), patch(
+            "jenkins.tools.scenarios.get_scenario_mapping",
+            return_value={
+                "deploy": {
+                    "description": "Deploy",
+                    "server": "good",
+                    "job_path": "deploy/",
+                }
+            },
+        ):
+            result = validate_jenkins_config()
+
+        assert result["errors"] == ["Server 'bad' missing field: uri"]
@@ -0,0 +1,53 @@
+"""三元组搜索索引测试."""
+
+from jenkins.tools.search_index import TrigramIndex
+
+
+def _job(full_name):
+    return {"name": full_name.split("/")[-1], "fullName": full_name}
+
+
+class TestTrigramIndex:
+    """三元组搜索索引测试类."""
+
+    def test_results_ranked_by_match_quality(self):
+        """测试结果按匹配质量排序."""
+        index = TrigramIndex(
+            [
+                _job("tools/redeploy-cache"),
+                _job("deploy/api/build"),
+                _job("release/deploy-web"),
+                _job("release/deploy"),
+                _job("misc/job-deploy-notes"),
+            ]
+        )
+
+        results = index.search("Deploy")
+
+        assert [job["fullName"] for job in results] == [
+            "release/deploy",  # exact name
+            "release/deploy-web",  # name prefix
+            "deploy/api/build",  # path segment
+            "tools/redeploy-cache",  # name substring
+            "misc/job-deploy-notes",  # name substring
+        ]
+
+    def test_limit_and_offset(self):
+        """测试分页参数."""
+        index = TrigramIndex([_job(f"svc-{i}/deploy") for i in range(10)])
+
+        page = index.search("deploy", limit=3, offset=2)
+
+        assert [job["fullName"] for job in page] == [
+            "svc-2/deploy",
+            "svc-3/deploy",
+            "svc-4/deploy",
+        ]
+
+    def test_short_and_missing_queries(self):
+        """测试短关键词和无匹配关键词."""
+        index = TrigramIndex([_job("ab/cd"), _job("xyz")])
+
+        assert [job["fullName"] for job in index.search("cd")] == ["ab/cd"]
+        assert index.search("nothing-here") == []
+        assert index.search("b/c")[0]["fullName"] == "ab/cd"
@@ -0,0 +1,104 @@
+"""HTTP 会话池测试."""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+
+from jenkins.tools.client import JenkinsAPIClient
+from jenkins.tools.session import AsyncSessionPool
+from jenkins.tools.session import SessionPool
+
+
+class TestSessionPool:
+    """会话池测试类."""
+
+    def test_session_reused_per_server(self):
+        """测试同一服务器复用同一会话."""
+        pool = SessionPool(max_connections=4)
+        first = pool.get_session("server-a")
+        second = pool.get_session("server-a")
+        other = pool.get_session("server-b")
+
+        assert first is second
+        assert first is not other
+        adapter = first.get_adapter("https://")
+        assert adapter._pool_maxsize == 4
+        assert adapter._pool_block is True
+
+    def test_session_replaced_when_limit_changes(self):
+        """测试连接数上限变化时重建会话."""
+        pool = SessionPool()
+        first = pool.get_session("server-a", max_connections=2)
+        second = pool.get_session("server-a", max_connections=8)
+
+        assert first is not second
+        assert pool.stats()["servers"]["server-a"]["max_connections"] == 8
+
+    def test_clients_share_session(self):
+        """测试多个客户端实例共享服务器会话."""
+        mock_config = {
+            "name": "test-server",
+            "uri": "http://test.jenkins.com",
+            "user": "test-user",
+            "token": "test-token",
+        }
+
+        with patch(
+            "jenkins.tools.registry.get_jenkins_servers", return_value=[mock_config]
+        ):
+            first = JenkinsAPIClient("test-server")
+            second = JenkinsAPIClient("test-server")
+
+        assert first._session is second._session
+
+    def test_close_all(self):
+        """测试关闭所有会话."""
+        pool = SessionPool()
+        pool.get_session("server-a")
+        pool.close_all()
+
+        assert pool.stats()["servers"] == {}
+
+
+class TestAsyncSessionPool:
+    """异步会话池测试类."""
+
+    def test_replaced_client_closed(self):
+        """测试连接数上限变化时关闭旧客户端."""
+
+        async def main():
+            pool = AsyncSessionPool()
+            first = pool.get_client("server-a", max_connections=2)
+            second = pool.get_client("server-a", max_connections=8)
+            await asyncio.sleep(0)
+            closed = first.is_closed
+            stats = pool.stats()
+            await pool.aclose_all()
+            return first, second, closed, stats
+
+        first, second, closed, stats = asyncio.run(main())
+
+        assert first is not second
+        assert closed
+        assert second.is_closed
+        assert stats["servers"]["server-a"]["max_connections"] == 8
+
+    def test_stats_count_requests(self):
+        """测试统计每个服务器的请求数与连接数."""
+
+        async def main():
+            pool = AsyncSessionPool()
+            client = pool.get_client("server-a")
+            client._transport = httpx.MockTransport(lambda request: httpx.Response(200))
+            await client.get("http://a.jenkins.com/api/json")
+            await client.get("http://a.jenkins.com/api/json")
+            stats = pool.stats()
+            await pool.aclose_all()
+            return stats
+
+        server = asyncio.run(main())["servers"]["server-a"]
+
+        assert server["requests"] == 2
+        assert server["connections_open"] == 0
+        assert server["closed"] is False
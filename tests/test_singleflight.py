@@ -0,0 +1,84 @@
+"""请求合并测试."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from jenkins.tools.singleflight import AsyncSingleFlight
+from jenkins.tools.singleflight import SingleFlight
+from jenkins.tools.singleflight import request_key
+
+
+class TestSingleFlight:
+    """线程请求合并测试类."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """测试并发的相同调用只执行一次."""
+        group = SingleFlight()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"number": 7}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(group.do("key", fetch)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while group.coalesced < 4:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"number": 7}] * 5
+
+    def test_error_shared_and_key_released(self):
+        """测试异常传递给所有等待者，且调用结束后不再合并."""
+        group = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            group.do("key", fail)
+
+        assert group.do("key", lambda: "fresh") == "fresh"
+
+    def test_request_key_ignores_param_order(self):
+        """测试请求键与参数顺序无关."""
+        first = request_key("s", "GET", "u", {"a": 1, "b": 2})
+        second = request_key("s", "GET", "u", {"b": 2, "a": 1})
+
+        assert first == second
+        assert first != request_key("s", "GET", "u", {"a": 1})
+
+
+class TestAsyncSingleFlight:
+    """协程请求合并测试类."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """测试并发的相同协程调用只执行一次."""
+        group = AsyncSingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"number": 7}
+
+        async def main():
+            return await asyncio.gather(*(group.do("key", fetch) for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert results == [{"number": 7}] * 5
+        assert group.coalesced == 4
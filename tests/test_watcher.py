@@ -0,0 +1,228 @@
+"""构建监视器测试."""
+
+import asyncio
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+import pytest
+from jenkins.tools.exceptions import JenkinsBuildNotFoundError
+from jenkins.tools.exceptions import JenkinsJobNotFoundError
+from jenkins.tools.watcher import BUILDS_WINDOW
+from jenkins.tools.watcher import WATCHES_URI
+from jenkins.tools.watcher import BuildWatcher
+
+
+def build(number, building):
+    """Build info as returned by the client."""
+    return {
+        "number": number,
+        "result": None if building else "SUCCESS",
+        "building": building,
+        "url": "",
+        "timestamp": 0,
+        "duration": 0,
+    }
+
+
+class FakeClient:
+    """Client serving ``jobs`` (job name -> builds, newest first)."""
+
+    jobs = {}
+    requests = []
+
+    def __init__(self, server_name):
+        self.server_name = server_name
+
+    async def get_recent_builds(self, job_full_name, count):
+        self.requests.append(("recent", job_full_name))
+        if job_full_name not in self.jobs:
+            raise JenkinsJobNotFoundError(job_full_name, self.server_name)
+        return self.jobs[job_full_name][:count]
+
+    async def get_build_status(self, job_full_name, build_number):
+        self.requests.append(("status", job_full_name, build_number))
+        for info in self.jobs[job_full_name]:
+            if info["number"] == build_number:
+                return info
+        raise JenkinsBuildNotFoundError(build_number, job_full_name, self.server_name)
+
+
+@pytest.fixture(autouse=True)
+def fake_client():
+    """用假客户端替换 Jenkins 客户端."""
+    FakeClient.jobs = {}
+    FakeClient.requests = []
+    with patch("jenkins.tools.watcher.AsyncJenkinsAPIClient", FakeClient):
+        yield FakeClient
+
+
+class TestBuildWatcher:
+    """构建监视器测试类."""
+
+    def test_one_request_per_job(self, fake_client):
+        """测试同一作业的多个构建只发一次请求，完成后通知会话."""
+        session = AsyncMock()
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            fake_client.jobs = {
+                "deploy": [build(3, True), build(2, True), build(1, False)],
+                "test": [build(7, True)],
+            }
+            for job, number in (("deploy", 3), ("deploy", 2), ("test", 7)):
+                watcher.watch("server", job, number, session)
+            # Let the background task run its first poll
+            await asyncio.sleep(0.01)
+            fake_client.requests.clear()
+
+            assert await watcher.poll() == []
+            fake_client.jobs["deploy"][1] = build(2, False)
+            finished = await watcher.poll()
+            states = {(w["job_full_name"], w["build_number"]): w["state"]
+                      for w in watcher.list()}
+            await watcher.aclose()
+            return finished, states
+
+        finished, states = asyncio.run(main())
+
+        assert [(w["build_number"], w["state"]) for w in finished] == [(2, "COMPLETED")]
+        assert finished[0]["status"]["result"] == "SUCCESS"
+        assert states == {
+            ("deploy", 3): "WATCHING",
+            ("deploy", 2): "COMPLETED",
+            ("test", 7): "WATCHING",
+        }
+        assert sorted(fake_client.requests) == [
+            ("recent", "deploy"),
+            ("recent", "deploy"),
+            ("recent", "test"),
+            ("recent", "test"),
+        ]
+        session.send_log_message.assert_awaited_once()
+        assert session.send_log_message.await_args.kwargs["data"]["build_number"] == 2
+        assert str(session.send_resource_updated.await_args.args[0]) == WATCHES_URI
+
+    def test_builds_outside_window_looked_up_directly(self, fake_client):
+        """测试超出最近构建窗口的构建单独查询."""
+        fake_client.jobs = {
+            "deploy": [build(n, False) for n in range(BUILDS_WINDOW + 5, 0, -1)]
+        }
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            watcher.watch("server", "deploy", 1)
+            return await watcher.poll()
+
+        finished = asyncio.run(main())
+
+        assert finished[0]["state"] == "COMPLETED"
+        assert ("status", "deploy", 1) in fake_client.requests
+
+    def test_missing_job_reports_error(self):
+        """测试作业不存在时监视以错误结束."""
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            watcher.watch("server", "gone", 1)
+            return await watcher.poll()
+
+        finished = asyncio.run(main())
+
+        assert finished[0]["state"] == "ERROR"
+        assert "not found" in finished[0]["error"]
+
+    def test_background_polling(self, fake_client):
+        """测试后台任务持续轮询直到构建完成."""
+        fake_client.jobs = {"deploy": [build(1, True)]}
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=0.01)
+            watcher.watch("server", "deploy", 1)
+            await asyncio.sleep(0.05)
+            fake_client.jobs["deploy"] = [build(1, False)]
+            for _ in range(100):
+                if watcher.list()[0]["state"] != "WATCHING":
+                    break
+                await asyncio.sleep(0.01)
+            return watcher.list()[0]
+
+        assert asyncio.run(main())["state"] == "COMPLETED"
+
+    def test_unwatch_keeps_other_registrations(self):
+        """测试取消一次注册不影响其他注册."""
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            watcher.watch("server", "deploy", 1)
+            watcher.watch("server", "deploy", 1)
+            assert watcher.unwatch("server", "deploy", 1)
+            assert watcher.list()[0]["watchers"] == 1
+            assert watcher.unwatch("server", "deploy", 1)
+            assert watcher.list() == []
+            assert not watcher.unwatch("server", "deploy", 1)
+            await watcher.aclose()
+
+        asyncio.run(main())
+
+    def test_timeout_reports_error(self, fake_client):
+        """测试超时后仍在运行的构建以指定错误结束."""
+        fake_client.jobs = {"deploy": [build(1, True)]}
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            watcher.watch("server", "deploy", 1, timeout=0, timeout_error="refused")
+            return await watcher.poll()
+
+        finished = asyncio.run(main())
+
+        assert finished[0]["state"] == "ERROR"
+        assert finished[0]["error"] == "refused"
+        assert finished[0]["status"]["building"] is True
+
+    def test_timeout_ends_only_its_registration(self, fake_client):
+        """测试停止确认超时不影响同一构建上用户的监视."""
+        fake_client.jobs = {"deploy": [build(1, True)]}
+        user = AsyncMock()
+        confirm = AsyncMock()
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            watcher.watch("server", "deploy", 1, user)
+            watcher.watch(
+                "server", "deploy", 1, confirm, timeout=0, timeout_error="refused"
+            )
+            timed_out = await watcher.poll()
+            after_timeout = watcher.list()[0]
+            fake_client.jobs["deploy"] = [build(1, False)]
+            completed = await watcher.poll()
+            await watcher.aclose()
+            return timed_out, after_timeout, completed
+
+        timed_out, after_timeout, completed = asyncio.run(main())
+
+        assert [(w["state"], w["error"]) for w in timed_out] == [("ERROR", "refused")]
+        assert after_timeout["state"] == "WATCHING"
+        assert after_timeout["watchers"] == 1
+        assert [w["state"] for w in completed] == ["COMPLETED"]
+        assert confirm.send_log_message.await_args.kwargs["data"]["error"] == "refused"
+        user.send_log_message.assert_awaited_once()
+        assert user.send_log_message.await_args.kwargs["data"]["state"] == "COMPLETED"
+
+    def test_finished_watch_not_reused(self, fake_client):
+        """测试已结束的监视不会被新的注册复用."""
+        fake_client.jobs = {"deploy": [build(1, True)]}
+
+        async def main():
+            watcher = BuildWatcher(poll_interval=3600)
+            watcher.watch("server", "deploy", 1, timeout=0, timeout_error="refused")
+            await watcher.poll()
+            assert watcher.list()[0]["state"] == "ERROR"
+            info = watcher.watch("server", "deploy", 1)
+            await watcher.aclose()
+            return info
+
+        info = asyncio.run(main())
+
+        assert info["state"] == "WATCHING"
+        assert info["error"] is None
+        assert info["watchers"] == 1